@@ -1,5 +1,6 @@
 """Messaging adapters - Event publishing implementations."""
 
 from claude_clone.adapters.messaging.event_bus import EventBus
+from claude_clone.adapters.messaging.event_ring import EventRing, RingCursor
 
-__all__ = ["EventBus"]
+__all__ = ["EventBus", "EventRing", "RingCursor"]
@@ -1,58 +1,444 @@
 """EventBus - In-process event publishing implementation."""
 
-from collections import defaultdict
+import queue
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import replace
 from typing import Any, Callable, Optional
 
 from claude_clone.domain.entities.event import Event, EventType
 from claude_clone.application.interfaces.event_publisher import EventPublisher
 from claude_clone.application.interfaces.event_repository import EventRepository
 
+# Maximum events written per save_many call by the background persister
+_PERSIST_CHUNK = 64
+
+# Idempotency keys of recently published events remembered by the bus, so
+# retries are deduplicated before the event reaches the repository
+_RECENT_KEYS = 4096
+
 
 class EventBus(EventPublisher):
     """In-process event bus for publishing and subscribing to events.
 
     Features:
-    - Synchronous event delivery
+    - Synchronous event delivery (or asynchronous, via a worker thread)
     - Multiple subscribers per event type
     - Optional persistence via EventRepository
+
+    With ``batch_size`` > 1, persistence is batched: delivered events are
+    buffered and written with ``save_many`` once the batch fills (or on
+    ``flush()``). Handlers are still notified per event.
+
+    In asynchronous mode ``publish`` only allocates the event ID and
+    enqueues the event; persistence and handler calls happen on a daemon
+    worker thread, so slow handlers don't block the caller. Handler and
+    persistence errors don't stop the worker; the first one is raised by
+    the next ``flush()``, which also waits for delivery. Publishers wait
+    for room while ``queue_size`` events are in flight, but never while
+    holding the sequence lock, and handlers publishing from the worker
+    thread never wait (they may overshoot the bound instead).
+
+    With ``background_persistence``, events are handed to a dedicated
+    persister thread that writes them in chunks with ``save_many``, so
+    repository writes stay off the publish path. ``wait_persisted()``
+    blocks until a given event ID has been written. A failed write is
+    not counted as persisted: its error is raised by the next
+    ``wait_persisted()`` or ``flush()``.
+
+    Subscriptions are copy-on-write: (un)subscribing takes a lock and
+    swaps in new dispatch tuples, while publishing reads the current tuple
+    without locking. A publish racing a subscription change sees either
+    the old or the new handler set, never a partially updated one.
+
+    Publishing with an ``idempotency_key`` returns the earlier event for
+    that key, if any, instead of publishing again. Keys are looked up
+    among recently published events, then in the repository.
+
+    ``enqueue`` adds events to a per-thread outbox instead. They get their
+    IDs and are written with a single ``save_many`` (then delivered to
+    handlers) on ``flush_outbox()``, which the unit of work calls on
+    commit; ``discard_outbox()`` drops them (or those after an
+    ``outbox_mark()``) on rollback.
     """
 
-    def __init__(self, event_repository: Optional[EventRepository] = None) -> None:
+    def __init__(
+        self,
+        event_repository: Optional[EventRepository] = None,
+        asynchronous: bool = False,
+        queue_size: int = 4096,
+        batch_size: int = 1,
+        background_persistence: bool = False,
+    ) -> None:
         self._event_repository = event_repository
-        self._handlers: dict[EventType, list[Callable[[Event], None]]] = defaultdict(
-            list
+        self._batch_size = batch_size
+        self._pending: list[Event] = []
+        # Handler maps are used as ordered sets (handler -> None)
+        self._handlers: defaultdict[EventType, dict[Callable[[Event], None], None]] = (
+            defaultdict(dict)
         )
-        self._global_handlers: list[Callable[[Event], None]] = []
+        self._global_handlers: dict[Callable[[Event], None], None] = {}
+
+        # Precomputed fan-out: type handlers followed by global handlers.
+        # Keyed by the enum's raw value: Enum.__hash__ is implemented in
+        # Python, while str hashes are cached.
+        self._dispatch: dict[str, tuple[Callable[[Event], None], ...]] = {}
+        self._global_dispatch: tuple[Callable[[Event], None], ...] = ()
+        self._subscription_lock = threading.Lock()
+
+        # Serializes ID allocation with queue hand-off, so queued events
+        # stay in ID order when several threads publish
+        self._sequence_lock = threading.Lock()
+
+        # idempotency key -> event, for events that may not be persisted yet
+        self._recent_keys: OrderedDict[str, Event] = OrderedDict()
+
+        # Per-thread outbox of enqueued events (see enqueue)
+        self._outbox = threading.local()
+
+        # Delivery queue (asynchronous mode only). Items carry whether they
+        # hold one of the queue_size slots, released once delivered.
+        self._queue: Optional[queue.Queue[tuple[Event, bool]]] = None
+        self._queue_size = queue_size
+        self._slots = threading.Semaphore(queue_size)
+        self._reserve_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._delivery_error: Optional[Exception] = None  # First unreported failure
+        if asynchronous:
+            self._queue = queue.Queue()
+            self._worker = threading.Thread(
+                target=self._drain, name="event-bus", daemon=True
+            )
+            self._worker.start()
+
+        # Persistence queue (background persistence only)
+        self._persist_queue: Optional[queue.SimpleQueue[Event]] = None
+        self._queued_id = 0  # Highest event ID handed to the persister
+        self._persisted_id = 0  # Highest event ID written to the repository
+        self._persist_error: Optional[Exception] = None  # First unreported failure
+        self._persisted = threading.Condition()
+        if background_persistence and event_repository:
+            self._persist_queue = queue.SimpleQueue()
+            persister = threading.Thread(
+                target=self._persist_loop, name="event-bus-persist", daemon=True
+            )
+            persister.start()
 
     def publish(
         self,
         run_id: str,
         event_type: EventType,
         data: Optional[dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Event:
         """Publish an event and return the created Event."""
+        if idempotency_key is None and self._queue is None and self._persist_queue is None:
+            event = self._create_event(run_id, event_type, data)
+            self._deliver(event)
+            return event
+
+        # Reserve queue room first: waiting for the worker while holding
+        # the sequence lock would deadlock a handler that publishes
+        reserved = self._reserve(1) if self._queue is not None else 0
+        try:
+            with self._sequence_lock:
+                if idempotency_key is not None:
+                    existing = self._find_published(idempotency_key)
+                    if existing is not None:
+                        return existing
+                event = self._create_event(run_id, event_type, data, idempotency_key)
+                if idempotency_key is not None:
+                    self._remember(idempotency_key, event)
+                if self._queue is not None:
+                    self._queue.put((event, reserved > 0))
+                    reserved = 0
+                    return event
+                self._persist(event)
+        finally:
+            self._release(reserved)
+
+        self._notify(event)
+        return event
+
+    def enqueue(
+        self,
+        run_id: str,
+        event_type: EventType,
+        data: Optional[dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Event:
+        """Add an event to the calling thread's outbox.
+
+        The returned event carries the provisional ID 0; the stored one
+        gets its real ID when the outbox is flushed.
+        """
+        event = Event.create(
+            event_id=0,
+            run_id=run_id,
+            event_type=event_type,
+            data=data,
+            idempotency_key=idempotency_key,
+        )
+        if idempotency_key is not None:
+            with self._sequence_lock:
+                existing = self._find_published(idempotency_key)
+                if existing is not None:
+                    return existing
+                self._remember(idempotency_key, event)
+        self._outbox_events().append(event)
+        return event
+
+    def flush_outbox(self) -> None:
+        """Publish the calling thread's enqueued events as one batch.
+
+        The outbox is cleared once the batch is handed off. If writing it
+        fails, the events are discarded (their idempotency keys are
+        forgotten, so a retry publishes again) and the error is raised.
+        """
+        outbox = self._outbox_events()
+        if not outbox:
+            return
+
+        reserved = self._reserve(len(outbox)) if self._queue is not None else 0
+        with self._sequence_lock:
+            if self._event_repository:
+                events = [
+                    replace(event, id=self._event_repository.next_id())
+                    for event in outbox
+                ]
+            else:
+                events = list(outbox)
+            try:
+                if self._queue is not None:
+                    for i, event in enumerate(events):
+                        self._queue.put((event, i < reserved))
+                    reserved = 0
+                elif self._persist_queue is not None:
+                    for event in events:
+                        self._persist(event)
+                elif self._event_repository:
+                    self._pending.extend(events)
+                    self._persist_pending()
+            except BaseException:
+                self._forget(outbox)
+                del outbox[:]
+                raise
+            finally:
+                self._release(reserved)
+            # Point remembered keys at the stored events
+            for enqueued, event in zip(outbox, events):
+                key = event.idempotency_key
+                if key is not None and self._recent_keys.get(key) is enqueued:
+                    self._recent_keys[key] = event
+            del outbox[:]
+
+        if self._queue is None:
+            for event in events:
+                self._notify(event)
+
+    def outbox_mark(self) -> int:
+        """Return the calling thread's outbox position."""
+        return len(self._outbox_events())
+
+    def discard_outbox(self, mark: int = 0) -> None:
+        """Drop the events the calling thread enqueued after ``mark``."""
+        outbox = self._outbox_events()
+        events = outbox[mark:]
+        if not events:
+            return
+        del outbox[mark:]
+        with self._sequence_lock:
+            self._forget(events)
+
+    def _forget(self, events: list[Event]) -> None:
+        """Forget the idempotency keys of events that won't be published.
+
+        Must be called with the sequence lock held.
+        """
+        for event in events:
+            key = event.idempotency_key
+            if key is not None and self._recent_keys.get(key) is event:
+                del self._recent_keys[key]
+
+    def _reserve(self, count: int) -> int:
+        """Reserve delivery queue slots for ``count`` events.
+
+        Waits while the queue is full, except on the worker thread: as
+        the only consumer it can't wait for itself, so it takes the free
+        slots and queues the rest over the limit. A batch larger than the
+        queue reserves ``queue_size`` slots. Returns the number reserved.
+        """
+        if threading.current_thread() is self._worker:
+            reserved = 0
+            while reserved < count and self._slots.acquire(blocking=False):
+                reserved += 1
+            return reserved
+
+        count = min(count, self._queue_size)
+        # One reservation at a time, so concurrent batches can't each hold
+        # part of the queue while waiting for the rest
+        with self._reserve_lock:
+            for _ in range(count):
+                self._slots.acquire()
+        return count
+
+    def _release(self, count: int) -> None:
+        """Give back reserved queue slots that weren't used."""
+        if count:
+            self._slots.release(count)
+
+    def _outbox_events(self) -> list[Event]:
+        """Return the calling thread's outbox."""
+        try:
+            return self._outbox.events
+        except AttributeError:
+            events: list[Event] = []
+            self._outbox.events = events
+            return events
+
+    def _remember(self, idempotency_key: str, event: Event) -> None:
+        """Remember a published event's key (bounded, oldest dropped first).
+
+        Must be called with the sequence lock held.
+        """
+        self._recent_keys[idempotency_key] = event
+        if len(self._recent_keys) > _RECENT_KEYS:
+            self._recent_keys.popitem(last=False)
+
+    def _create_event(
+        self,
+        run_id: str,
+        event_type: EventType,
+        data: Optional[dict[str, Any]],
+        idempotency_key: Optional[str] = None,
+    ) -> Event:
+        """Allocate an ID and create the event."""
         # Get next ID
         if self._event_repository:
             event_id = self._event_repository.next_id()
         else:
             event_id = 0  # No persistence
 
-        # Create event
-        event = Event.create(
+        return Event.create(
             event_id=event_id,
             run_id=run_id,
             event_type=event_type,
             data=data,
+            idempotency_key=idempotency_key,
         )
 
-        # Persist if repository available
+    def find_published(self, idempotency_key: str) -> Optional[Event]:
+        """Find the event published or enqueued with an idempotency key."""
+        with self._sequence_lock:
+            return self._find_published(idempotency_key)
+
+    def _find_published(self, idempotency_key: str) -> Optional[Event]:
+        """Find an earlier event published with the key.
+
+        Must be called with the sequence lock held.
+        """
+        event = self._recent_keys.get(idempotency_key)
+        if event is not None:
+            return event
         if self._event_repository:
-            self._event_repository.save(event)
+            return self._event_repository.find_by_idempotency_key(idempotency_key)
+        return None
+
+    def flush(self) -> None:
+        """Block until every published event has been delivered and persisted.
+
+        Raises the error of an asynchronous delivery or background write
+        that failed since the last report.
+        """
+        if self._queue is not None:
+            self._queue.join()
+            error, self._delivery_error = self._delivery_error, None
+            if error is not None:
+                raise error
+        self._persist_pending()
+        self.wait_persisted(self._queued_id)
+
+    def wait_persisted(self, event_id: int, timeout: Optional[float] = None) -> bool:
+        """Wait until the event with the given ID has been persisted.
 
-        # Notify handlers
+        Only blocks with background persistence; otherwise events are
+        written on delivery. Returns False if the timeout expired first.
+        If a background write failed, its error is raised (once) instead.
+        """
+        if self._persist_queue is None:
+            return True
+        with self._persisted:
+            done = self._persisted.wait_for(
+                lambda: self._persisted_id >= event_id or self._persist_error is not None,
+                timeout,
+            )
+            error, self._persist_error = self._persist_error, None
+        if error is not None:
+            raise error
+        return done
+
+    def _persist_loop(self) -> None:
+        """Background loop writing queued events in chunks."""
+        assert self._persist_queue is not None and self._event_repository
+        persist_queue = self._persist_queue
+        while True:
+            batch = [persist_queue.get()]
+            while len(batch) < _PERSIST_CHUNK and not persist_queue.empty():
+                batch.append(persist_queue.get_nowait())
+            try:
+                self._event_repository.save_many(batch)
+            except Exception as e:
+                # Leave the watermark behind the batch and hand the error
+                # to whoever waits next
+                with self._persisted:
+                    if self._persist_error is None:
+                        self._persist_error = e
+                    self._persisted.notify_all()
+                continue
+            with self._persisted:
+                self._persisted_id = batch[-1].id
+                self._persisted.notify_all()
+
+    def _persist_pending(self) -> None:
+        """Write buffered events to the repository in one batch."""
+        if self._pending and self._event_repository:
+            pending, self._pending = self._pending, []
+            self._event_repository.save_many(pending)
+
+    def _deliver(self, event: Event) -> None:
+        """Persist an event and notify its handlers."""
+        self._persist(event)
         self._notify(event)
 
-        return event
+    def _persist(self, event: Event) -> None:
+        """Persist an event if a repository is available."""
+        if not self._event_repository:
+            return
+        if self._persist_queue is not None:
+            self._queued_id = event.id
+            self._persist_queue.put(event)
+        elif self._batch_size > 1:
+            self._pending.append(event)
+            if len(self._pending) >= self._batch_size:
+                self._persist_pending()
+        else:
+            self._event_repository.save(event)
+
+    def _drain(self) -> None:
+        """Worker loop for asynchronous delivery."""
+        assert self._queue is not None
+        while True:
+            event, reserved = self._queue.get()
+            try:
+                self._deliver(event)
+            except Exception as e:
+                # Keep delivering; flush() reports the failure
+                if self._delivery_error is None:
+                    self._delivery_error = e
+            finally:
+                if reserved:
+                    self._slots.release()
+                self._queue.task_done()
 
     def subscribe(
         self,
@@ -60,16 +446,21 @@ class EventBus(EventPublisher):
         handler: Callable[[Event], None],
     ) -> None:
         """Subscribe to events of a specific type."""
-        if handler not in self._handlers[event_type]:
-            self._handlers[event_type].append(handler)
+        with self._subscription_lock:
+            handlers = self._handlers[event_type]
+            if handler not in handlers:
+                handlers[handler] = None
+                self._rebuild(event_type)
 
     def subscribe_all(
         self,
         handler: Callable[[Event], None],
     ) -> None:
         """Subscribe to all events."""
-        if handler not in self._global_handlers:
-            self._global_handlers.append(handler)
+        with self._subscription_lock:
+            if handler not in self._global_handlers:
+                self._global_handlers[handler] = None
+                self._rebuild_all()
 
     def unsubscribe(
         self,
@@ -77,28 +468,49 @@ class EventBus(EventPublisher):
         handler: Callable[[Event], None],
     ) -> None:
         """Unsubscribe a handler from an event type."""
-        if handler in self._handlers[event_type]:
-            self._handlers[event_type].remove(handler)
+        with self._subscription_lock:
+            handlers = self._handlers.get(event_type)
+            if handlers and handler in handlers:
+                del handlers[handler]
+                self._rebuild(event_type)
 
     def unsubscribe_all(
         self,
         handler: Callable[[Event], None],
     ) -> None:
         """Unsubscribe a global handler."""
-        if handler in self._global_handlers:
-            self._global_handlers.remove(handler)
+        with self._subscription_lock:
+            if handler in self._global_handlers:
+                del self._global_handlers[handler]
+                self._rebuild_all()
 
-    def _notify(self, event: Event) -> None:
-        """Notify all relevant handlers."""
-        # Type-specific handlers
-        for handler in self._handlers[event.type]:
-            handler(event)
+    def _rebuild(self, event_type: EventType) -> None:
+        """Recompute the dispatch tuple for a single event type.
 
-        # Global handlers
-        for handler in self._global_handlers:
+        Must be called with the subscription lock held.
+        """
+        handlers = self._handlers.get(event_type)
+        if handlers:
+            self._dispatch[event_type._value_] = tuple(handlers) + self._global_dispatch
+        else:
+            self._dispatch.pop(event_type._value_, None)
+
+    def _rebuild_all(self) -> None:
+        """Recompute every dispatch tuple (after a global handler change)."""
+        self._global_dispatch = tuple(self._global_handlers)
+        for event_type in list(self._handlers):
+            self._rebuild(event_type)
+
+    def _notify(self, event: Event) -> None:
+        """Notify all relevant handlers (lock-free snapshot read)."""
+        handlers = self._dispatch.get(event.type._value_, self._global_dispatch)
+        for handler in handlers:
             handler(event)
 
     def clear_handlers(self) -> None:
         """Clear all handlers (for testing)."""
-        self._handlers.clear()
-        self._global_handlers.clear()
+        with self._subscription_lock:
+            self._handlers.clear()
+            self._global_handlers.clear()
+            self._dispatch = {}
+            self._global_dispatch = ()
@@ -0,0 +1,97 @@
+"""EventRing - Preallocated multi-reader event ring."""
+
+import threading
+from typing import Optional
+
+from claude_clone.domain.entities.event import Event
+
+
+class EventRing:
+    """Fixed-size ring of events with independent consumer cursors.
+
+    Producers write into preallocated slots; each consumer keeps its own
+    sequence number and reads forward from it, so slow consumers never
+    hold up the producers or each other and events are never copied.
+    Writes take a lock, since a bus handler is called from every
+    publishing thread; reads don't.
+
+    A consumer that falls more than ``capacity`` events behind skips ahead
+    to the oldest event still in the ring; the skipped count is recorded
+    on its cursor.
+
+    Usage:
+        ring = EventRing()
+        event_bus.subscribe_all(ring.write)
+
+        cursor = ring.cursor()
+        for event in cursor.poll():
+            ...
+    """
+
+    def __init__(self, capacity: int = 4096) -> None:
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError(f"capacity must be a power of two: {capacity}")
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._slots: list[Optional[Event]] = [None] * capacity
+        self._sequence = 0  # Number of events written so far
+        self._write_lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        """Number of slots in the ring."""
+        return self._capacity
+
+    @property
+    def sequence(self) -> int:
+        """Total number of events written."""
+        return self._sequence
+
+    def write(self, event: Event) -> None:
+        """Write an event, overwriting the oldest slot when full."""
+        with self._write_lock:
+            sequence = self._sequence
+            self._slots[sequence & self._mask] = event
+            # Publish the slot only after it has been filled
+            self._sequence = sequence + 1
+
+    def cursor(self, from_start: bool = False) -> "RingCursor":
+        """Create a consumer cursor.
+
+        By default the cursor only sees events written after its creation;
+        with ``from_start`` it starts at the oldest event still retained.
+        """
+        start = max(0, self._sequence - self._capacity) if from_start else self._sequence
+        return RingCursor(self, start)
+
+
+class RingCursor:
+    """A consumer's read position in an EventRing."""
+
+    def __init__(self, ring: EventRing, sequence: int) -> None:
+        self._ring = ring
+        self._sequence = sequence
+        self.dropped = 0  # Events skipped because the consumer was overrun
+
+    @property
+    def lag(self) -> int:
+        """Number of events written but not yet read."""
+        return self._ring.sequence - self._sequence
+
+    def poll(self, max_events: Optional[int] = None) -> list[Event]:
+        """Read the events written since the last poll, oldest first."""
+        ring = self._ring
+        end = ring.sequence
+        oldest = end - ring.capacity
+        if self._sequence < oldest:
+            self.dropped += oldest - self._sequence
+            self._sequence = oldest
+
+        if max_events is not None:
+            end = min(end, self._sequence + max_events)
+
+        slots = ring._slots
+        mask = ring._mask
+        events = [slots[i & mask] for i in range(self._sequence, end)]
+        self._sequence = end
+        return events  # type: ignore[return-value]
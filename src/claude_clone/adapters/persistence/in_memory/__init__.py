@@ -9,9 +9,13 @@ from claude_clone.adapters.persistence.in_memory.approval_repository import (
 from claude_clone.adapters.persistence.in_memory.event_repository import (
     InMemoryEventRepository,
 )
+from claude_clone.adapters.persistence.in_memory.unit_of_work import (
+    InMemoryUnitOfWork,
+)
 
 __all__ = [
     "InMemoryRunRepository",
     "InMemoryApprovalRepository",
     "InMemoryEventRepository",
+    "InMemoryUnitOfWork",
 ]
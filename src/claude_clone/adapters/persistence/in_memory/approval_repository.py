@@ -1,10 +1,22 @@
 """In-memory implementation of ApprovalRepository for testing."""
 
-from typing import Optional
+from collections import defaultdict
+from typing import Optional, TypeVar
 
 from claude_clone.domain.entities.approval import Approval, ApprovalStatus
 from claude_clone.application.interfaces.approval_repository import ApprovalRepository
 
+K = TypeVar("K")
+
+
+def _discard(index: dict[K, dict[str, None]], key: K, approval_id: str) -> None:
+    """Remove an approval id from an index bucket, dropping empty buckets."""
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.pop(approval_id, None)
+        if not bucket:
+            del index[key]
+
 
 class InMemoryApprovalRepository(ApprovalRepository):
     """In-memory implementation of ApprovalRepository.
@@ -13,13 +25,37 @@ class InMemoryApprovalRepository(ApprovalRepository):
     - Unit testing
     - Quick prototyping
     - Development without database
+
+    Approval ids are indexed by run and by (run, status) as of the last
+    ``save``. Index buckets are dicts used as ordered sets so results keep
+    insertion order.
     """
 
     def __init__(self) -> None:
         self._approvals: dict[str, Approval] = {}
 
+        # Secondary indexes (approval id -> None)
+        self._by_run: defaultdict[str, dict[str, None]] = defaultdict(dict)
+        self._by_run_status: defaultdict[
+            tuple[str, ApprovalStatus], dict[str, None]
+        ] = defaultdict(dict)
+        # Index key each approval was last filed under. Approvals are
+        # mutable, so the stored object can't tell us its previous status.
+        self._indexed: dict[str, tuple[str, ApprovalStatus]] = {}
+
     def save(self, approval: Approval) -> None:
         """Save an approval (create or update)."""
+        key = (approval.run_id, approval.status)
+        previous = self._indexed.get(approval.id)
+        if previous != key:
+            if previous is not None:
+                _discard(self._by_run_status, previous, approval.id)
+                if previous[0] != approval.run_id:
+                    _discard(self._by_run, previous[0], approval.id)
+            self._by_run[approval.run_id][approval.id] = None
+            self._by_run_status[key][approval.id] = None
+            self._indexed[approval.id] = key
+
         self._approvals[approval.id] = approval
 
     def find_by_id(self, approval_id: str) -> Optional[Approval]:
@@ -28,40 +64,41 @@ class InMemoryApprovalRepository(ApprovalRepository):
 
     def find_by_run(self, run_id: str) -> list[Approval]:
         """Find all approvals for a run."""
-        return [a for a in self._approvals.values() if a.run_id == run_id]
+        return [self._approvals[i] for i in self._by_run.get(run_id, ())]
 
     def find_pending_by_run(self, run_id: str) -> list[Approval]:
         """Find pending approvals for a run."""
-        return [
-            a
-            for a in self._approvals.values()
-            if a.run_id == run_id and a.status == ApprovalStatus.PENDING
-        ]
+        return self.find_by_status(run_id, ApprovalStatus.PENDING)
 
     def find_by_status(
         self, run_id: str, status: ApprovalStatus
     ) -> list[Approval]:
         """Find approvals by run and status."""
         return [
-            a
-            for a in self._approvals.values()
-            if a.run_id == run_id and a.status == status
+            self._approvals[i]
+            for i in self._by_run_status.get((run_id, status), ())
         ]
 
     def count_pending(self, run_id: str) -> int:
         """Count pending approvals for a run."""
-        return len(self.find_pending_by_run(run_id))
+        return len(self._by_run_status.get((run_id, ApprovalStatus.PENDING), ()))
 
     def delete(self, approval_id: str) -> bool:
         """Delete an approval. Returns True if deleted, False if not found."""
         if approval_id in self._approvals:
             del self._approvals[approval_id]
+            key = self._indexed.pop(approval_id)
+            _discard(self._by_run, key[0], approval_id)
+            _discard(self._by_run_status, key, approval_id)
             return True
         return False
 
     def clear(self) -> None:
         """Clear all approvals (for testing)."""
         self._approvals.clear()
+        self._by_run.clear()
+        self._by_run_status.clear()
+        self._indexed.clear()
 
     def count(self) -> int:
         """Count total approvals (for testing)."""
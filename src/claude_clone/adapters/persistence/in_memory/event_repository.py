@@ -1,10 +1,19 @@
 """In-memory implementation of EventRepository for testing."""
 
-from typing import Optional
+import threading
+from bisect import bisect_right, insort
+from collections import defaultdict, deque
+from collections.abc import Collection
+from heapq import merge
+from itertools import count, islice
+from operator import attrgetter
+from typing import Iterable, Optional
 
 from claude_clone.domain.entities.event import Event, EventType
 from claude_clone.application.interfaces.event_repository import EventRepository
 
+_event_id = attrgetter("id")
+
 
 class InMemoryEventRepository(EventRepository):
     """In-memory implementation of EventRepository.
@@ -13,39 +22,182 @@ class InMemoryEventRepository(EventRepository):
     - Unit testing
     - Quick prototyping
     - Development without database
+
+    Events are indexed by id, by run and by (run, type), and the log and
+    every bucket are kept sorted by id. Ids come from ``next_id()`` but
+    concurrent publishers may save them out of order, so an event older
+    than the newest one is inserted in place instead of appended. Writes
+    and bucket reads are serialized by a lock.
+
+    The log is a ring buffer of ``capacity`` events: once full, saving a
+    new event evicts the lowest-id one from the log and every index.
     """
 
-    def __init__(self) -> None:
-        self._events: list[Event] = []
-        self._next_id: int = 1
+    DEFAULT_CAPACITY = 65536
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self._capacity = capacity
+        self._lock = threading.Lock()
+        self._events: deque[Event] = deque()
+        # next() on itertools.count is atomic under the GIL, so concurrent
+        # publishers can't be handed the same ID (which would clobber
+        # entries in the id index)
+        self._id_counter = count(1)
+
+        # Secondary indexes
+        self._by_id: dict[int, Event] = {}
+        self._by_idempotency_key: dict[str, Event] = {}
+        self._by_run: defaultdict[str, list[Event]] = defaultdict(list)
+        self._by_run_ids: defaultdict[str, list[int]] = defaultdict(list)
+        self._by_run_type: defaultdict[tuple[str, EventType], list[Event]] = (
+            defaultdict(list)
+        )
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of events retained."""
+        return self._capacity
 
     def save(self, event: Event) -> None:
-        """Save an event."""
+        """Save an event, evicting the oldest one if the log is full."""
+        with self._lock:
+            self._save(event)
+
+    def _save(self, event: Event) -> None:
+        """Save one event (lock held)."""
+        if len(self._events) >= self._capacity:
+            self._evict(self._events.popleft())
+        if self._events and self._events[-1].id > event.id:
+            self._insert(event)
+            return
+
         self._events.append(event)
+        self._by_id[event.id] = event
+        if event.idempotency_key is not None:
+            self._by_idempotency_key[event.idempotency_key] = event
+        self._by_run[event.run_id].append(event)
+        self._by_run_ids[event.run_id].append(event.id)
+        self._by_run_type[(event.run_id, event.type)].append(event)
+
+    def _insert(self, event: Event) -> None:
+        """Save an event that was allocated before the newest saved one."""
+        self._events.insert(bisect_right(self._events, event.id, key=_event_id), event)
+        self._by_id[event.id] = event
+        if event.idempotency_key is not None:
+            self._by_idempotency_key[event.idempotency_key] = event
+        insort(self._by_run[event.run_id], event, key=_event_id)
+        insort(self._by_run_ids[event.run_id], event.id)
+        insort(self._by_run_type[(event.run_id, event.type)], event, key=_event_id)
+
+    def save_many(self, events: Iterable[Event]) -> None:
+        """Save several events at once."""
+        events = list(events)
+        with self._lock:
+            if not self._can_extend(events):
+                for event in events:
+                    self._save(event)
+                return
+
+            self._events.extend(events)
+            by_id = self._by_id
+            by_run = self._by_run
+            by_run_ids = self._by_run_ids
+            by_run_type = self._by_run_type
+            by_key = self._by_idempotency_key
+            for event in events:
+                run_id = event.run_id
+                by_id[event.id] = event
+                if event.idempotency_key is not None:
+                    by_key[event.idempotency_key] = event
+                by_run[run_id].append(event)
+                by_run_ids[run_id].append(event.id)
+                by_run_type[(run_id, event.type)].append(event)
+
+    def _can_extend(self, events: list[Event]) -> bool:
+        """Whether a batch fits and can be appended without reordering."""
+        if len(self._events) + len(events) > self._capacity:
+            return False
+        last_id = self._events[-1].id if self._events else 0
+        for event in events:
+            if event.id <= last_id:
+                return False
+            last_id = event.id
+        return True
+
+    def _evict(self, event: Event) -> None:
+        """Drop an evicted event from the secondary indexes.
+
+        The log and the buckets are all sorted by id, so the lowest-id
+        event overall is at the front of its run and (run, type) buckets.
+        """
+        self._by_id.pop(event.id, None)
+        if self._by_idempotency_key.get(event.idempotency_key) is event:
+            del self._by_idempotency_key[event.idempotency_key]
+
+        run_id = event.run_id
+        del self._by_run[run_id][0]
+        del self._by_run_ids[run_id][0]
+        if not self._by_run[run_id]:
+            del self._by_run[run_id]
+            del self._by_run_ids[run_id]
+
+        key = (run_id, event.type)
+        del self._by_run_type[key][0]
+        if not self._by_run_type[key]:
+            del self._by_run_type[key]
 
     def find_by_id(self, event_id: int) -> Optional[Event]:
         """Find an event by ID. Returns None if not found."""
-        for event in self._events:
-            if event.id == event_id:
-                return event
-        return None
+        return self._by_id.get(event_id)
+
+    def find_by_idempotency_key(self, idempotency_key: str) -> Optional[Event]:
+        """Find the event saved with an idempotency key. Returns None if not found."""
+        return self._by_idempotency_key.get(idempotency_key)
 
     def find_by_run(
         self,
         run_id: str,
         since_id: Optional[int] = None,
         limit: int = 100,
+        event_types: Optional[Collection[EventType]] = None,
     ) -> list[Event]:
         """Find events for a run, optionally since a given event ID."""
-        events = [e for e in self._events if e.run_id == run_id]
+        if event_types is not None:
+            return self._find_by_run_types(run_id, since_id, limit, event_types)
 
-        if since_id is not None:
-            events = [e for e in events if e.id > since_id]
+        with self._lock:
+            events = self._by_run.get(run_id)
+            if not events:
+                return []
 
-        # Sort by ID (ascending)
-        events.sort(key=lambda e: e.id)
+            start = 0
+            if since_id is not None:
+                start = bisect_right(self._by_run_ids[run_id], since_id)
 
-        return events[:limit]
+            return events[start:start + limit]
+
+    def _find_by_run_types(
+        self,
+        run_id: str,
+        since_id: Optional[int],
+        limit: int,
+        event_types: Collection[EventType],
+    ) -> list[Event]:
+        """Merge the per-(run, type) buckets of the requested types by id."""
+        pages = []
+        with self._lock:
+            for event_type in set(event_types):
+                events = self._by_run_type.get((run_id, event_type))
+                if not events:
+                    continue
+                start = 0
+                if since_id is not None:
+                    start = bisect_right(events, since_id, key=_event_id)
+                pages.append(events[start:start + limit])
+
+        if len(pages) == 1:
+            return pages[0]
+        return list(islice(merge(*pages, key=_event_id), limit))
 
     def find_by_type(
         self,
@@ -54,35 +206,35 @@ class InMemoryEventRepository(EventRepository):
         limit: int = 100,
     ) -> list[Event]:
         """Find events of a specific type for a run."""
-        events = [
-            e
-            for e in self._events
-            if e.run_id == run_id and e.type == event_type
-        ]
-        events.sort(key=lambda e: e.id)
-        return events[:limit]
+        with self._lock:
+            events = self._by_run_type.get((run_id, event_type))
+            return events[:limit] if events else []
 
     def get_latest_id(self, run_id: str) -> Optional[int]:
         """Get the latest event ID for a run."""
-        events = [e for e in self._events if e.run_id == run_id]
-        if not events:
-            return None
-        return max(e.id for e in events)
+        with self._lock:
+            ids = self._by_run_ids.get(run_id)
+            return ids[-1] if ids else None
 
     def count_by_run(self, run_id: str) -> int:
         """Count events for a run."""
-        return len([e for e in self._events if e.run_id == run_id])
+        events = self._by_run.get(run_id)
+        return len(events) if events else 0
 
     def next_id(self) -> int:
         """Get the next available event ID."""
-        event_id = self._next_id
-        self._next_id += 1
-        return event_id
+        return next(self._id_counter)
 
     def clear(self) -> None:
         """Clear all events (for testing)."""
-        self._events.clear()
-        self._next_id = 1
+        with self._lock:
+            self._events.clear()
+            self._by_id.clear()
+            self._by_idempotency_key.clear()
+            self._by_run.clear()
+            self._by_run_ids.clear()
+            self._by_run_type.clear()
+            self._id_counter = count(1)
 
     def count(self) -> int:
         """Count total events (for testing)."""
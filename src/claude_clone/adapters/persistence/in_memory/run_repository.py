@@ -1,5 +1,7 @@
 """In-memory implementation of RunRepository for testing."""
 
+from bisect import insort
+from collections import defaultdict
 from typing import Optional
 
 from claude_clone.domain.entities.run import Run, RunStatus
@@ -13,46 +15,82 @@ class InMemoryRunRepository(RunRepository):
     - Unit testing
     - Quick prototyping
     - Development without database
+
+    Run ids are indexed by status and activeness as of the last ``save``,
+    and kept in a creation-ordered list so ``list_recent`` is a slice
+    rather than a sort.
     """
 
     def __init__(self) -> None:
         self._runs: dict[str, Run] = {}
 
+        # Secondary indexes
+        self._by_status: defaultdict[RunStatus, dict[str, None]] = defaultdict(dict)
+        self._status_of: dict[str, RunStatus] = {}
+        self._active_ids: dict[str, None] = {}
+        self._created_order: list[str] = []  # ascending created_at
+
     def save(self, run: Run) -> None:
         """Save a run (create or update)."""
         self._runs[run.id] = run
 
+        previous = self._status_of.get(run.id)
+        if previous is None:
+            self._insert_created(run)
+        if previous is not run.status:
+            if previous is not None:
+                self._by_status[previous].pop(run.id, None)
+            self._by_status[run.status][run.id] = None
+            self._status_of[run.id] = run.status
+            # Activeness can only change with the status
+            if run.is_active:
+                self._active_ids[run.id] = None
+            else:
+                self._active_ids.pop(run.id, None)
+
+    def _insert_created(self, run: Run) -> None:
+        """Add a new run id to the creation-ordered index."""
+        order = self._created_order
+        if not order or self._runs[order[-1]].created_at <= run.created_at:
+            order.append(run.id)
+        else:
+            insort(order, run.id, key=lambda i: self._runs[i].created_at)
+
     def find_by_id(self, run_id: str) -> Optional[Run]:
         """Find a run by ID. Returns None if not found."""
         return self._runs.get(run_id)
 
     def find_active(self) -> list[Run]:
         """Find all active (non-terminal) runs."""
-        return [run for run in self._runs.values() if run.is_active]
+        return [self._runs[i] for i in self._active_ids]
 
     def find_by_status(self, status: RunStatus) -> list[Run]:
         """Find runs by status."""
-        return [run for run in self._runs.values() if run.status == status]
+        return [self._runs[i] for i in self._by_status.get(status, ())]
 
     def list_recent(self, limit: int = 10) -> list[Run]:
         """List recent runs, ordered by created_at desc."""
-        runs = sorted(
-            self._runs.values(),
-            key=lambda r: r.created_at,
-            reverse=True,
-        )
-        return runs[:limit]
+        if limit <= 0:
+            return []
+        return [self._runs[i] for i in reversed(self._created_order[-limit:])]
 
     def delete(self, run_id: str) -> bool:
         """Delete a run. Returns True if deleted, False if not found."""
         if run_id in self._runs:
             del self._runs[run_id]
+            self._by_status[self._status_of.pop(run_id)].pop(run_id, None)
+            self._active_ids.pop(run_id, None)
+            self._created_order.remove(run_id)
             return True
         return False
 
     def clear(self) -> None:
         """Clear all runs (for testing)."""
         self._runs.clear()
+        self._by_status.clear()
+        self._status_of.clear()
+        self._active_ids.clear()
+        self._created_order.clear()
 
     def count(self) -> int:
         """Count total runs (for testing)."""
@@ -0,0 +1,33 @@
+"""In-memory implementation of UnitOfWork for testing."""
+
+import threading
+from typing import Optional
+
+from claude_clone.application.interfaces.event_publisher import EventPublisher
+from claude_clone.application.interfaces.unit_of_work import UnitOfWork
+
+
+class InMemoryUnitOfWork(UnitOfWork):
+    """In-memory implementation of UnitOfWork.
+
+    Serializes units of work with a re-entrant lock, so a save and the
+    events it publishes are never interleaved with another worker's.
+    In-memory writes take effect immediately: rollback only releases the
+    lock and does not undo them.
+    """
+
+    def __init__(self, event_publisher: Optional[EventPublisher] = None) -> None:
+        super().__init__(event_publisher)
+        self._lock = threading.RLock()
+
+    def begin(self) -> None:
+        """Start the unit of work."""
+        self._lock.acquire()
+
+    def commit(self) -> None:
+        """Finish the unit of work."""
+        self._lock.release()
+
+    def rollback(self) -> None:
+        """Finish the unit of work (writes are not undone)."""
+        self._lock.release()
@@ -1,10 +1,12 @@
 """Agent Module
 
 LangGraph-based conversational agent with tool support.
+
+The graph and LLM modules are imported lazily (PEP 562) so that importing
+``claude_clone.agent.tools`` doesn't load LangGraph and the LLM SDKs.
 """
 
-from claude_clone.agent.graph import AgentState, create_agent
-from claude_clone.agent.llm import LLMCreationError, create_llm
+from typing import Any
 
 __all__ = [
     "create_agent",
@@ -12,3 +14,15 @@ __all__ = [
     "AgentState",
     "LLMCreationError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in ("AgentState", "create_agent"):
+        from claude_clone.agent import graph
+
+        return getattr(graph, name)
+    if name in ("LLMCreationError", "create_llm"):
+        from claude_clone.agent import llm
+
+        return getattr(llm, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,14 @@
 """Tools Module
 
 Defines tools based on LangChain StructuredTool.
+
+The LangChain tools and their input schemas are resolved lazily (PEP 562),
+so the plain functions can be imported without loading langchain_core.
 """
 
+from typing import Any
+
 from claude_clone.agent.tools.bash import (
-    bash_tool,
     BashToolError,
     CommandExecutionError,
     CommandResult,
@@ -13,19 +17,16 @@ from claude_clone.agent.tools.bash import (
 )
 from claude_clone.agent.tools.edit import (
     edit_file,
-    edit_tool,
     EditToolError,
     MultipleMatchesError,
     StringNotFoundError,
 )
 from claude_clone.agent.tools.glob import (
     glob_files,
-    glob_tool,
     GlobToolError,
 )
 from claude_clone.agent.tools.grep import (
     grep_files,
-    grep_tool,
     GrepMatch,
     GrepToolError,
     InvalidPatternError,
@@ -33,17 +34,8 @@ from claude_clone.agent.tools.grep import (
 from claude_clone.agent.tools.read import (
     BinaryFileError,
     read_file,
-    read_tool,
     ReadToolError,
 )
-from claude_clone.agent.tools.schemas import (
-    BashInput,
-    EditInput,
-    GlobInput,
-    GrepInput,
-    ReadInput,
-    WriteInput,
-)
 
 # Note: FileNotFoundError is intentionally not exported as it shadows the builtin.
 # Use EditToolError or ReadToolError for error handling.
@@ -85,3 +77,26 @@ __all__ = [
     "GrepToolError",
     "InvalidPatternError",
 ]
+
+_LAZY_ATTRS = {
+    "bash_tool": "bash",
+    "edit_tool": "edit",
+    "glob_tool": "glob",
+    "grep_tool": "grep",
+    "read_tool": "read",
+    "ReadInput": "schemas",
+    "EditInput": "schemas",
+    "WriteInput": "schemas",
+    "BashInput": "schemas",
+    "GrepInput": "schemas",
+    "GlobInput": "schemas",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    return getattr(import_module(f"{__name__}.{module}"), name)
@@ -0,0 +1,35 @@
+"""Deferred LangChain tool construction
+
+Importing langchain_core (and the pydantic schemas) is much slower than
+the tool functions themselves, so each tool module builds its LangChain
+tool on first attribute access through a PEP 562 ``__getattr__``.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+
+def build_tool(
+    namespace: dict[str, Any],
+    name: str,
+    func: Callable[..., str],
+    schema_name: str,
+) -> Any:
+    """Build a LangChain tool and cache it in the module namespace
+
+    Args:
+        namespace: globals() of the tool module
+        name: Tool name (also the module attribute name)
+        func: Function implementing the tool; its docstring is the description
+        schema_name: Name of the args schema class in the schemas module
+
+    Returns:
+        The LangChain tool
+    """
+    from langchain_core.tools import tool
+
+    from claude_clone.agent.tools import schemas
+
+    built = tool(name, args_schema=getattr(schemas, schema_name))(func)
+    namespace[name] = built
+    return built
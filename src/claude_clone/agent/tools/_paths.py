@@ -0,0 +1,22 @@
+"""Path helpers shared by the file tools"""
+
+import os
+from pathlib import Path
+
+
+def normalize_path(path: str) -> Path:
+    """Normalize path to absolute path
+
+    Absolute paths (what the agent usually passes) need no getcwd(), and
+    ".." segments are collapsed lexically rather than with resolve(),
+    which would stat every component to follow symlinks.
+
+    Args:
+        path: File path (absolute or relative)
+
+    Returns:
+        Normalized absolute Path object
+    """
+    if not os.path.isabs(path):
+        path = os.path.join(os.getcwd(), path)
+    return Path(os.path.normpath(path))
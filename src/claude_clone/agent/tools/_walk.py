@@ -0,0 +1,64 @@
+"""Cached directory listings for the search tools
+
+An agent session runs many searches over the same tree. Listings are
+cached per directory and revalidated with a single stat(): adding,
+removing or renaming an entry updates the directory's mtime, so an
+unchanged mtime means the cached names are still current.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+# (name, is_dir, is_file) for each entry; is_dir does not follow symlinks
+DirListing = list[tuple[str, bool, bool]]
+
+# Maximum number of directories kept in the cache
+DIR_CACHE_SIZE = 4096
+
+_dir_cache: OrderedDict[str, tuple[int, DirListing]] = OrderedDict()
+_dir_cache_lock = threading.Lock()
+
+
+def listdir_cached(path: str) -> DirListing:
+    """List a directory, reusing the cached listing if it is unchanged
+
+    Args:
+        path: Directory path
+
+    Returns:
+        List of (name, is_dir, is_file) tuples
+
+    Raises:
+        OSError: If the directory can't be read
+    """
+    mtime = os.stat(path).st_mtime_ns
+
+    with _dir_cache_lock:
+        cached = _dir_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            _dir_cache.move_to_end(path)
+            return cached[1]
+
+    listing: DirListing = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                listing.append((entry.name, is_dir, not is_dir and entry.is_file()))
+            except OSError:
+                continue
+
+    with _dir_cache_lock:
+        _dir_cache[path] = (mtime, listing)
+        _dir_cache.move_to_end(path)
+        if len(_dir_cache) > DIR_CACHE_SIZE:
+            _dir_cache.popitem(last=False)
+
+    return listing
+
+
+def clear_dir_cache() -> None:
+    """Drop all cached listings"""
+    with _dir_cache_lock:
+        _dir_cache.clear()
@@ -13,10 +13,12 @@ Usage:
 import subprocess
 import sys
 from dataclasses import dataclass
+from typing import Any
 
-from langchain_core.tools import tool
+from claude_clone.agent.tools._lazy import build_tool
 
-from claude_clone.agent.tools.schemas import BashInput
+# Shell invocation prefix, resolved once per platform
+_SHELL_PREFIX: tuple[str, ...] = ("cmd", "/c") if sys.platform == "win32" else ("bash", "-c")
 
 
 class BashToolError(Exception):
@@ -37,7 +39,7 @@ class CommandExecutionError(BashToolError):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommandResult:
     """Result of command execution"""
 
@@ -69,17 +71,14 @@ def run_command(
         CommandExecutionError: If command cannot be started
         BashToolError: Other execution errors
     """
-    # Determine shell based on platform
-    if sys.platform == "win32":
-        shell_cmd = ["cmd", "/c", command]
-    else:
-        shell_cmd = ["bash", "-c", command]
+    shell_cmd = (*_SHELL_PREFIX, command)
 
     try:
         process = subprocess.run(
             shell_cmd,
             capture_output=True,
-            text=True,
+            encoding="utf-8",
+            errors="replace",
             timeout=timeout,
             cwd=cwd,
         )
@@ -93,7 +92,7 @@ def run_command(
 
     except subprocess.TimeoutExpired as e:
         # Return partial output if available
-        # Note: stdout/stderr are strings when text=True, bytes otherwise
+        # Note: partial output may be bytes even in text mode
         if e.stdout:
             stdout = e.stdout if isinstance(e.stdout, str) else e.stdout.decode("utf-8", errors="replace")
         else:
@@ -115,6 +114,14 @@ def run_command(
         raise BashToolError(f"Failed to execute command: {e}") from e
 
 
+def _truncate(text: str, max_length: int) -> str:
+    """Cut text to max_length, noting the original size if truncated"""
+    total = len(text)
+    if total <= max_length:
+        return text
+    return f"{text[:max_length]}\n... (truncated, {total} total chars)"
+
+
 def format_output(result: CommandResult, max_length: int = 10000) -> str:
     """Format command result for display
 
@@ -129,17 +136,11 @@ def format_output(result: CommandResult, max_length: int = 10000) -> str:
 
     # Add stdout if present
     if result.stdout:
-        stdout = result.stdout
-        if len(stdout) > max_length:
-            stdout = stdout[:max_length] + f"\n... (truncated, {len(result.stdout)} total chars)"
-        parts.append(stdout)
+        parts.append(_truncate(result.stdout, max_length))
 
     # Add stderr if present
     if result.stderr:
-        stderr = result.stderr
-        if len(stderr) > max_length:
-            stderr = stderr[:max_length] + f"\n... (truncated, {len(result.stderr)} total chars)"
-        parts.append(f"STDERR:\n{stderr}")
+        parts.append(f"STDERR:\n{_truncate(result.stderr, max_length)}")
 
     # Handle empty output
     if not parts:
@@ -157,8 +158,7 @@ def format_output(result: CommandResult, max_length: int = 10000) -> str:
     return output
 
 
-@tool(args_schema=BashInput)
-def bash_tool(
+def _bash_tool(
     command: str,
     timeout: int = 120,
     description: str = "",
@@ -181,3 +181,11 @@ def bash_tool(
         return format_output(result)
     except BashToolError as e:
         return f"Error: {e}"
+
+
+def __getattr__(name: str) -> Any:
+    # The LangChain tool is built on first access, so importing this
+    # module for its plain functions doesn't load langchain_core
+    if name == "bash_tool":
+        return build_tool(globals(), name, _bash_tool, "BashInput")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
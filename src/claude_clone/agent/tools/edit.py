@@ -10,11 +10,14 @@ Usage:
     agent = create_agent(config, tools=[edit_tool])
 """
 
-from pathlib import Path
+import os
+import stat
+import tempfile
+from contextlib import suppress
+from typing import Any
 
-from langchain_core.tools import tool
-
-from claude_clone.agent.tools.schemas import EditInput
+from claude_clone.agent.tools._lazy import build_tool
+from claude_clone.agent.tools._paths import normalize_path
 
 
 class EditToolError(Exception):
@@ -41,19 +44,46 @@ class MultipleMatchesError(EditToolError):
     pass
 
 
-def _normalize_path(path: str) -> Path:
-    """Normalize path to absolute path
+def _to_crlf(data: bytes) -> bytes:
+    """Convert LF line endings to CRLF (existing CRLF left as is)"""
+    return data.replace(b"\r\n", b"\n").replace(b"\n", b"\r\n")
 
-    Args:
-        path: File path (absolute or relative)
 
-    Returns:
-        Resolved absolute Path object
+def _string_not_found(old_string: str) -> StringNotFoundError:
+    """Build the error for a missing target string"""
+    return StringNotFoundError(
+        f"String not found in file: {repr(old_string[:50])}..."
+        if len(old_string) > 50
+        else f"String not found in file: {repr(old_string)}"
+    )
+
+
+def _write_atomic(file_path: str, data: bytes) -> None:
+    """Replace a file's contents atomically
+
+    Data goes to a temporary file in the same directory, which is then
+    renamed over the original, so readers and crashes see either the old
+    or the new contents, never a partial write. Symlinks are followed and
+    the original permission bits are kept.
+
+    Args:
+        file_path: File to replace
+        data: New file contents
     """
-    p = Path(path)
-    if not p.is_absolute():
-        p = Path.cwd() / p
-    return p.resolve()
+    target = os.path.realpath(file_path)
+    mode = stat.S_IMODE(os.stat(target).st_mode)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(target), prefix=f".{os.path.basename(target)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
 
 
 def edit_file(
@@ -81,7 +111,10 @@ def edit_file(
         MultipleMatchesError: Multiple matches found when replace_all=False
         EditToolError: Other edit errors
     """
-    path = _normalize_path(file_path)
+    if not old_string:
+        raise EditToolError("old_string must not be empty")
+
+    path = normalize_path(file_path)
 
     # Check file exists
     if not path.exists():
@@ -91,37 +124,44 @@ def edit_file(
         raise EditToolError(f"Not a file: {path}")
 
     try:
-        # Read current content
-        content = path.read_text(encoding="utf-8")
-
-        # Check if old_string exists
-        if old_string not in content:
-            raise StringNotFoundError(
-                f"String not found in file: {repr(old_string[:50])}..."
-                if len(old_string) > 50
-                else f"String not found in file: {repr(old_string)}"
-            )
-
-        # Count occurrences
-        count = content.count(old_string)
-
-        # Check for multiple matches when replace_all=False
-        if not replace_all and count > 1:
-            raise MultipleMatchesError(
-                f"Found {count} occurrences of the string. "
-                "Use replace_all=True to replace all, or provide a more specific string."
-            )
-
-        # Perform replacement
+        # Work on raw bytes: UTF-8 needles can be searched without
+        # decoding the file
+        content = path.read_bytes()
+        old_bytes = old_string.encode("utf-8")
+        new_bytes = new_string.encode("utf-8")
+
+        # Keep CRLF files CRLF (judged by the first line ending)
+        first_newline = content.find(b"\n")
+        if first_newline > 0 and content[first_newline - 1 : first_newline] == b"\r":
+            old_bytes = _to_crlf(old_bytes)
+            new_bytes = _to_crlf(new_bytes)
+
         if replace_all:
-            new_content = content.replace(old_string, new_string)
-            replaced_count = count
+            # One pass: split finds every occurrence, join replaces them
+            parts = content.split(old_bytes)
+            replaced_count = len(parts) - 1
+            if replaced_count == 0:
+                raise _string_not_found(old_string)
+            new_content = new_bytes.join(parts)
         else:
-            new_content = content.replace(old_string, new_string, 1)
+            index = content.find(old_bytes)
+            if index < 0:
+                raise _string_not_found(old_string)
+
+            # Only look past the first hit to rule out a second one
+            end = index + len(old_bytes)
+            if content.find(old_bytes, end) >= 0:
+                count = content.count(old_bytes)
+                raise MultipleMatchesError(
+                    f"Found {count} occurrences of the string. "
+                    "Use replace_all=True to replace all, or provide a more specific string."
+                )
+
+            new_content = content[:index] + new_bytes + content[end:]
             replaced_count = 1
 
         # Write back
-        path.write_text(new_content, encoding="utf-8")
+        _write_atomic(str(path), new_content)
 
         # Return success message
         if replaced_count == 1:
@@ -135,8 +175,7 @@ def edit_file(
         raise EditToolError(f"Failed to edit file {path}: {e}") from e
 
 
-@tool(args_schema=EditInput)
-def edit_tool(
+def _edit_tool(
     file_path: str,
     old_string: str,
     new_string: str,
@@ -160,3 +199,11 @@ def edit_tool(
         return edit_file(file_path, old_string, new_string, replace_all)
     except EditToolError as e:
         return f"Error: {e}"
+
+
+def __getattr__(name: str) -> Any:
+    # The LangChain tool is built on first access, so importing this
+    # module for its plain functions doesn't load langchain_core
+    if name == "edit_tool":
+        return build_tool(globals(), name, _edit_tool, "EditInput")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,11 +10,17 @@ Usage:
     agent = create_agent(config, tools=[glob_tool])
 """
 
-from pathlib import Path
+import os
+import re
+from collections.abc import Iterator
+from functools import lru_cache
+from itertools import islice
+from pathlib import PurePath
+from typing import Any
 
-from langchain_core.tools import tool
-
-from claude_clone.agent.tools.schemas import GlobInput
+from claude_clone.agent.tools._lazy import build_tool
+from claude_clone.agent.tools._paths import normalize_path
+from claude_clone.agent.tools._walk import listdir_cached
 
 
 class GlobToolError(Exception):
@@ -29,19 +35,151 @@ class DirectoryNotFoundError(GlobToolError):
     pass
 
 
-def _normalize_path(path: str) -> Path:
-    """Normalize path to absolute path
+# Marks a symlinked directory in the paths matched against a pattern
+# (see _iter_files): only non-** components may match one
+_LINK = "\0"
 
-    Args:
-        path: File path (absolute or relative)
+
+def _translate_part(part: str) -> str:
+    """Translate one glob path component to a regex, in a single pass
+
+    * and ? stay within the component, [...] is a character class (a
+    negated class never matches / either), anything else is literal. None
+    of them match the _LINK marker.
+    """
+    buf: list[str] = []
+    i, n = 0, len(part)
+    while i < n:
+        ch = part[i]
+        if ch == "*":
+            buf.append(f"[^/{_LINK}]*")
+        elif ch == "?":
+            buf.append(f"[^/{_LINK}]")
+        elif ch == "[":
+            # Like fnmatch, a ] right after [ or [! is part of the class
+            j = i + 2 if part.startswith("!", i + 1) else i + 1
+            end = part.find("]", j + 1)
+            if end == -1:
+                buf.append("\\[")
+            else:
+                body = re.sub(r"([\\\[\]&~|])", r"\\\1", part[i + 1 : end])
+                if body[0] == "!":
+                    body = f"^/{_LINK}" + body[1:]
+                elif body[0] == "^":
+                    body = "\\" + body
+                buf.append(f"[{body}]")
+                i = end
+        else:
+            buf.append(re.escape(ch))
+        i += 1
+    return "".join(buf)
+
+
+def _is_wildcard(part: str) -> bool:
+    """Check if a path component contains glob wildcards"""
+    return "*" in part or "?" in part or "[" in part
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(
+    pattern: str,
+) -> tuple[str, re.Pattern[str] | None, int | None, int]:
+    """Split a glob pattern into a literal directory prefix and a matcher
+
+    Components are matched like Path.glob: ** is zero or more directories,
+    other wildcards stay within one component, and "." components are
+    dropped.
 
     Returns:
-        Resolved absolute Path object
+        (prefix, regex, max_depth, max_links): the leading literal
+        directories, a regex for file paths relative to them (None if the
+        pattern can only match directories), how many components deep a
+        match can be (None if unbounded) and how many symlinked directories
+        a match can pass through
+
+    Raises:
+        ValueError: If the pattern is empty, absolute or misuses **
     """
-    p = Path(path)
-    if not p.is_absolute():
-        p = Path.cwd() / p
-    return p.resolve()
+    # PurePath drops a trailing separator, which makes Path.glob match
+    # only directories
+    directories_only = pattern.endswith(("/", os.sep))
+    pure = PurePath(pattern)
+    if pure.anchor:
+        raise ValueError("Non-relative patterns are unsupported")
+    parts = pure.parts
+    if not parts:
+        raise ValueError(f"Unacceptable pattern: {pattern!r}")
+    for part in parts:
+        if "**" in part and part != "**":
+            raise ValueError("Invalid pattern: '**' can only be an entire path component")
+
+    # Literal leading directories are joined onto the root instead of walked
+    literal = 0
+    while literal < len(parts) - 1 and not _is_wildcard(parts[literal]):
+        literal += 1
+    prefix = "".join(part + "/" for part in parts[:literal])
+    rest = parts[literal:]
+
+    if rest[-1] == "**" or directories_only:
+        # Path.glob matches only directories here
+        return prefix, None, 0, 0
+
+    buf: list[str] = []
+    for part in rest[:-1]:
+        if part == "**":
+            # ** doesn't descend into symlinked directories
+            buf.append(f"(?:[^/{_LINK}]+/)*")
+        else:
+            buf.append(f"{_translate_part(part)}{_LINK}?/")
+    buf.append(_translate_part(rest[-1]))
+    max_depth = None if "**" in rest else len(rest)
+    max_links = sum(part != "**" for part in rest[:-1])
+    return prefix, re.compile("".join(buf)), max_depth, max_links
+
+
+def _iter_files(
+    root: str, max_depth: int | None, max_links: int
+) -> Iterator[tuple[str, str]]:
+    """Yield files under root in sorted order, as (path, match path)
+
+    Directories are visited as "name/", so siblings sorted that way put
+    every path in string order and the walk can stop after the first
+    matches. Symlinked files are included. A path goes through at most
+    max_links symlinked directories, so links pointing back up the tree
+    can't make the walk loop; the match path marks each one with _LINK
+    for the pattern to check which component it fills.
+    """
+    # (relative path, match path, is_dir, depth, links); popped smallest first
+    stack: list[tuple[str, str, bool, int, int]] = [("", "", True, 0, 0)]
+    while stack:
+        rel, match_rel, is_dir, depth, links = stack.pop()
+        if not is_dir:
+            yield rel, match_rel
+            continue
+        directory = os.path.join(root, rel) if rel else root
+        try:
+            listing = listdir_cached(directory)
+        except OSError:
+            continue
+        depth += 1
+        descend = max_depth is None or depth < max_depth
+        children = []
+        for name, child_is_dir, child_is_file in listing:
+            if child_is_dir:
+                if descend:
+                    children.append(
+                        (f"{rel}{name}/", f"{match_rel}{name}/", True, depth, links)
+                    )
+            elif child_is_file:
+                children.append((rel + name, match_rel + name, False, depth, links))
+            elif descend and links < max_links and os.path.isdir(
+                os.path.join(directory, name)
+            ):
+                children.append(
+                    (f"{rel}{name}/", f"{match_rel}{name}{_LINK}/", True, depth, links + 1)
+                )
+        children.sort(reverse=True)
+        stack.extend(children)
 
 
 def glob_files(
@@ -57,13 +195,14 @@ def glob_files(
         max_results: Maximum number of results to return
 
     Returns:
-        List of matching file paths (relative to search path)
+        Sorted list of matching file paths (relative to search path);
+        when truncated, the first max_results in sorted order
 
     Raises:
         DirectoryNotFoundError: If path does not exist
         GlobToolError: Other glob errors
     """
-    search_path = _normalize_path(path)
+    search_path = normalize_path(path)
 
     if not search_path.exists():
         raise DirectoryNotFoundError(f"Directory not found: {search_path}")
@@ -72,23 +211,19 @@ def glob_files(
         raise GlobToolError(f"Not a directory: {search_path}")
 
     try:
-        matches = []
-        for match in search_path.glob(pattern):
-            if match.is_file():
-                # Return relative path from search directory
-                try:
-                    rel_path = match.relative_to(search_path)
-                    matches.append(str(rel_path))
-                except ValueError:
-                    # If relative_to fails, use absolute path
-                    matches.append(str(match))
-
-            if len(matches) >= max_results:
-                break
-
-        # Sort for consistent output
-        matches.sort()
-        return matches
+        prefix, regex, max_depth, max_links = _compile_pattern(pattern)
+        root = os.path.join(search_path, prefix)
+        if regex is None or not os.path.isdir(root):
+            return []
+
+        matches = (
+            prefix + rel
+            for rel, match_rel in _iter_files(root, max_depth, max_links)
+            if regex.fullmatch(match_rel)
+        )
+        # Matches stream in sorted order, so the smallest max_results paths
+        # are the first ones and the walk stops as soon as they're found
+        return list(islice(matches, max_results))
 
     except Exception as e:
         raise GlobToolError(f"Glob search failed: {e}") from e
@@ -116,8 +251,7 @@ def format_glob_results(matches: list[str], max_results: int = 1000) -> str:
     return result
 
 
-@tool(args_schema=GlobInput)
-def glob_tool(
+def _glob_tool(
     pattern: str,
     path: str = ".",
 ) -> str:
@@ -138,3 +272,11 @@ def glob_tool(
         return format_glob_results(matches)
     except GlobToolError as e:
         return f"Error: {e}"
+
+
+def __getattr__(name: str) -> Any:
+    # The LangChain tool is built on first access, so importing this
+    # module for its plain functions doesn't load langchain_core
+    if name == "glob_tool":
+        return build_tool(globals(), name, _glob_tool, "GlobInput")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,8 @@
 """Grep Tool - Code/text search with regex
 
 Searches for patterns in files using regular expressions.
-Pure Python implementation (ripgrep backend can be added later).
+Directory searches run through ripgrep when it is installed, with a pure
+Python implementation as the fallback.
 
 Usage:
     from claude_clone.agent.tools.grep import grep_tool
@@ -10,13 +11,23 @@ Usage:
     agent = create_agent(config, tools=[grep_tool])
 """
 
+import base64
+import json
+import mmap
+import os
 import re
-from dataclasses import dataclass, field
-from pathlib import Path
+import shutil
+import subprocess
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
 
-from langchain_core.tools import tool
-
-from claude_clone.agent.tools.schemas import GrepInput
+from claude_clone.agent.tools._lazy import build_tool
+from claude_clone.agent.tools._paths import normalize_path
+from claude_clone.agent.tools._walk import listdir_cached
 
 
 class GrepToolError(Exception):
@@ -38,90 +49,138 @@ class PathNotFoundError(GrepToolError):
 
 
 # File type to extension mapping
-FILE_TYPE_EXTENSIONS: dict[str, list[str]] = {
-    "py": [".py", ".pyi"],
-    "js": [".js", ".mjs", ".cjs"],
-    "ts": [".ts", ".tsx"],
-    "jsx": [".jsx"],
-    "java": [".java"],
-    "c": [".c", ".h"],
-    "cpp": [".cpp", ".cc", ".cxx", ".hpp", ".hh"],
-    "go": [".go"],
-    "rs": [".rs"],
-    "rb": [".rb"],
-    "php": [".php"],
-    "swift": [".swift"],
-    "kt": [".kt", ".kts"],
-    "scala": [".scala"],
-    "cs": [".cs"],
-    "md": [".md", ".markdown"],
-    "json": [".json"],
-    "yaml": [".yaml", ".yml"],
-    "toml": [".toml"],
-    "xml": [".xml"],
-    "html": [".html", ".htm"],
-    "css": [".css", ".scss", ".sass", ".less"],
-    "sql": [".sql"],
-    "sh": [".sh", ".bash", ".zsh"],
+FILE_TYPE_EXTENSIONS: dict[str, frozenset[str]] = {
+    "py": frozenset({".py", ".pyi"}),
+    "js": frozenset({".js", ".mjs", ".cjs"}),
+    "ts": frozenset({".ts", ".tsx"}),
+    "jsx": frozenset({".jsx"}),
+    "java": frozenset({".java"}),
+    "c": frozenset({".c", ".h"}),
+    "cpp": frozenset({".cpp", ".cc", ".cxx", ".hpp", ".hh"}),
+    "go": frozenset({".go"}),
+    "rs": frozenset({".rs"}),
+    "rb": frozenset({".rb"}),
+    "php": frozenset({".php"}),
+    "swift": frozenset({".swift"}),
+    "kt": frozenset({".kt", ".kts"}),
+    "scala": frozenset({".scala"}),
+    "cs": frozenset({".cs"}),
+    "md": frozenset({".md", ".markdown"}),
+    "json": frozenset({".json"}),
+    "yaml": frozenset({".yaml", ".yml"}),
+    "toml": frozenset({".toml"}),
+    "xml": frozenset({".xml"}),
+    "html": frozenset({".html", ".htm"}),
+    "css": frozenset({".css", ".scss", ".sass", ".less"}),
+    "sql": frozenset({".sql"}),
+    "sh": frozenset({".sh", ".bash", ".zsh"}),
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class GrepMatch:
-    """A single grep match"""
+    """A single grep match
+
+    Context defaults to the shared empty tuple, so matches without context
+    (the common case) allocate nothing beyond the instance itself.
+    """
 
     file: str
     line_number: int
     content: str
-    context_before: list[str] = field(default_factory=list)
-    context_after: list[str] = field(default_factory=list)
+    context_before: tuple[str, ...] = ()
+    context_after: tuple[str, ...] = ()
 
 
-def _normalize_path(path: str) -> Path:
-    """Normalize path to absolute path"""
-    p = Path(path)
-    if not p.is_absolute():
-        p = Path.cwd() / p
-    return p.resolve()
+def _get_extensions_for_type(file_type: str) -> frozenset[str]:
+    """Get file extensions for a given type"""
+    file_type = file_type.lower()
+    return FILE_TYPE_EXTENSIONS.get(file_type) or frozenset({f".{file_type}"})
 
 
-def _get_extensions_for_type(file_type: str) -> list[str]:
-    """Get file extensions for a given type"""
-    return FILE_TYPE_EXTENSIONS.get(file_type.lower(), [f".{file_type}"])
+# Common non-text directories never searched
+_SKIP_DIRS = frozenset(
+    {"node_modules", "__pycache__", ".git", ".venv", "venv", "dist", "build"}
+)
 
+# Characters that make a pattern more than a plain string (line breaks
+# included, since lines are matched one at a time)
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()\n\r")
 
-def _should_skip_file(file_path: Path) -> bool:
-    """Check if file should be skipped (binary, too large, etc.)"""
-    # Skip hidden files and directories
-    if any(part.startswith(".") for part in file_path.parts):
-        return True
+# ripgrep executable, resolved once at import (None if not installed)
+_RG_PATH: str | None = shutil.which("rg")
 
-    # Skip common non-text directories
-    skip_dirs = {"node_modules", "__pycache__", ".git", ".venv", "venv", "dist", "build"}
-    if any(part in skip_dirs for part in file_path.parts):
-        return True
 
-    # Skip files larger than 1MB
-    try:
-        if file_path.stat().st_size > 1_000_000:
-            return True
-    except OSError:
-        return True
+def _walk_files(root: str) -> Iterator[tuple[str, str]]:
+    """Yield (path, name) for files under root
 
-    return False
+    Hidden entries and common non-text directories are pruned before
+    descending, so nothing below them is ever listed. Listings come from
+    the shared directory cache, so repeated searches over an unchanged
+    tree cost one stat() per directory instead of a scandir().
+    """
+    stack = [root]
+    while stack:
+        top = stack.pop()
+        subdirs = []
+        try:
+            listing = listdir_cached(top)
+        except OSError:
+            continue
+        for name, is_dir, is_file in listing:
+            if name.startswith("."):
+                continue
+            if is_dir:
+                if name not in _SKIP_DIRS:
+                    subdirs.append(os.path.join(top, name))
+            elif is_file:
+                yield os.path.join(top, name), name
+        # Reverse so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
 
 
-def _is_binary_file(file_path: Path) -> bool:
-    """Quick check if file appears to be binary"""
-    try:
-        with open(file_path, "rb") as f:
-            chunk = f.read(1024)
-            # Check for null bytes (common in binary files)
-            if b"\x00" in chunk:
-                return True
-    except OSError:
-        return True
-    return False
+@lru_cache(maxsize=256)
+def _compile(pattern: str) -> re.Pattern[str]:
+    """Compile a search pattern, reusing it across searches"""
+    # MULTILINE so ^ and $ anchor at line boundaries in the whole-file scan
+    return re.compile(pattern, re.MULTILINE)
+
+
+# Anchors and lookarounds that can see past a line's ends, so a
+# whole-buffer scan could skip lines that match on their own
+_LINE_CONTEXT_TOKENS = ("\\A", "\\Z", "(?=", "(?!", "(?<=", "(?<!", "(?-")
+
+
+@lru_cache(maxsize=256)
+def _needs_line_scan(pattern: str) -> bool:
+    """Check if a pattern must be tried line by line"""
+    return any(token in pattern for token in _LINE_CONTEXT_TOKENS)
+
+
+def _has_extension(name: str, extensions: frozenset[str]) -> bool:
+    """Check a file name's suffix against an extension set"""
+    dot = name.rfind(".")
+    return dot >= 0 and name[dot:].lower() in extensions
+
+
+# Files at least this large are probed for a literal via mmap before
+# being read
+_MMAP_MIN_SIZE = 1 << 16
+
+
+# Worker threads for searching files, and how many files may be queued
+# ahead of the one whose results are consumed next
+_SEARCH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_SEARCH_WINDOW = _SEARCH_WORKERS * 2
+
+
+# Bytes read from the start of a file to detect binary content
+_BINARY_CHECK_SIZE = 1024
+
+
+def _is_too_large(size: int) -> bool:
+    """Check if a file is too large to search (over 1MB)"""
+    return size > 1_000_000
 
 
 def grep_files(
@@ -150,11 +209,14 @@ def grep_files(
     """
     # Validate and compile pattern
     try:
-        regex = re.compile(pattern)
+        regex = _compile(pattern)
     except re.error as e:
         raise InvalidPatternError(f"Invalid regex pattern: {e}") from e
 
-    search_path = _normalize_path(path)
+    # Plain strings skip the regex engine in favour of str.find
+    literal = None if _REGEX_METACHARS.intersection(pattern) else pattern
+
+    search_path = normalize_path(path)
 
     if not search_path.exists():
         raise PathNotFoundError(f"Path not found: {search_path}")
@@ -165,97 +227,350 @@ def grep_files(
     matches: list[GrepMatch] = []
 
     try:
-        # Get list of files to search
+        # Single file: search it directly
         if search_path.is_file():
-            files = [search_path]
-        else:
-            files = list(search_path.rglob("*"))
+            if extensions and not _has_extension(search_path.name, extensions):
+                return matches
+            return _search_file(
+                str(search_path),
+                search_path.name,
+                regex,
+                context_lines,
+                max_results,
+                literal,
+            )
 
-        for file_path in files:
-            if len(matches) >= max_results:
-                break
+        # Directory: prefer ripgrep, fall back to the Python walk
+        if _RG_PATH is not None:
+            rg_matches = _grep_files_rg(
+                pattern, str(search_path), extensions, context_lines, max_results
+            )
+            if rg_matches is not None:
+                return rg_matches
+
+        root = str(search_path)
+        prefix_len = len(root) + 1  # strip "root/" for relative paths
+
+        # Files are read and scanned on worker threads (file I/O and the
+        # regex engine release the GIL). Futures are consumed in walk
+        # order, so results match a sequential search; only a bounded
+        # window of files is in flight past the point where we stop.
+        with ThreadPoolExecutor(max_workers=_SEARCH_WORKERS) as executor:
+            pending: deque[Future[list[GrepMatch]]] = deque()
+            try:
+                for file_path, name in _walk_files(root):
+                    # Apply file type filter on the name before touching the file
+                    if extensions and not _has_extension(name, extensions):
+                        continue
+
+                    pending.append(
+                        executor.submit(
+                            _search_file,
+                            file_path,
+                            file_path[prefix_len:],
+                            regex,
+                            context_lines,
+                            max_results,
+                            literal,
+                        )
+                    )
+                    if len(pending) >= _SEARCH_WINDOW:
+                        matches.extend(pending.popleft().result())
+                        if len(matches) >= max_results:
+                            break
+
+                while pending and len(matches) < max_results:
+                    matches.extend(pending.popleft().result())
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        del matches[max_results:]
 
-            if not file_path.is_file():
-                continue
+    except Exception as e:
+        raise GrepToolError(f"Grep search failed: {e}") from e
 
-            # Apply file type filter
-            if extensions and file_path.suffix.lower() not in extensions:
-                continue
+    return matches
 
-            # Skip binary and large files
-            if _should_skip_file(file_path):
-                continue
 
-            if _is_binary_file(file_path):
-                continue
+def _grep_files_rg(
+    pattern: str,
+    root: str,
+    extensions: frozenset[str] | None,
+    context_lines: int,
+    max_results: int,
+) -> list[GrepMatch] | None:
+    """Search a directory with ripgrep
 
-            # Search file
-            try:
-                file_matches = _search_file(
-                    file_path, regex, context_lines, max_results - len(matches), search_path
-                )
-                matches.extend(file_matches)
-            except (OSError, UnicodeDecodeError):
-                # Skip files that can't be read
-                continue
+    Filters mirror the Python walk: hidden files, skipped directories and
+    files over 1MB are excluded, and .gitignore is not honoured. Results
+    are sorted by path, so truncation is the same from run to run.
 
-    except Exception as e:
-        raise GrepToolError(f"Grep search failed: {e}") from e
+    Returns:
+        List of GrepMatch objects, or None if ripgrep failed without
+        output (e.g. the pattern uses syntax its regex engine lacks)
+    """
+    args = [
+        _RG_PATH,
+        "--json",
+        "--no-config",
+        "--no-ignore",
+        "--crlf",  # let $ match before CRLF, as in the Python search
+        "--sort",
+        "path",
+        "--max-filesize",
+        "1000000",  # as _is_too_large; rg's "1M" is 1MiB
+        "--max-count",
+        str(max_results),
+    ]
+    if context_lines > 0:
+        args += ["--context", str(context_lines)]
+    for name in sorted(_SKIP_DIRS):
+        args += ["--glob", f"!{name}/"]
+    for ext in sorted(extensions or ()):
+        args += ["--glob", _extension_glob(ext)]
+    args += ["--regexp", pattern]
+
+    # Run from the root so reported paths are relative to it
+    try:
+        process = subprocess.Popen(
+            args,
+            cwd=root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding="utf-8",
+            errors="replace",
+        )
+    except OSError:
+        return None
+
+    assert process.stdout is not None
+    try:
+        matches = _parse_rg_json(process.stdout, context_lines, max_results)
+    finally:
+        # Stop ripgrep early once enough matches have been read
+        process.kill()
+        process.stdout.close()
+        returncode = process.wait()
+
+    # Exit code 2 means an error; partial results are still usable
+    if returncode == 2 and not matches:
+        return None
+    return matches
+
+
+def _extension_glob(ext: str) -> str:
+    """Build a ripgrep glob matching an extension in any case
+
+    Each letter is a two-case class ("*.[pP][yY]"), so a plain --glob
+    matches the extension case-insensitively, like _has_extension.
+    """
+    return "*" + "".join(
+        f"[{ch.lower()}{ch.upper()}]" if ch.lower() != ch.upper() else ch for ch in ext
+    )
+
+
+def _parse_rg_json(
+    records: Iterable[str], context_lines: int, max_results: int
+) -> list[GrepMatch]:
+    """Build GrepMatch objects from ripgrep --json output
+
+    Match and context lines are collected per file and turned into
+    matches when the file's "end" record arrives, since ripgrep shares
+    context lines between nearby matches.
+    """
+    matches: list[GrepMatch] = []
+    lines: dict[int, str] = {}
+    match_lines: list[int] = []
+
+    for record in records:
+        message = json.loads(record)
+        kind = message["type"]
+        data = message["data"]
+
+        if kind == "match" or kind == "context":
+            line_number = data["line_number"]
+            lines[line_number] = _strip_line_ending(_rg_text(data["lines"]))
+            if kind == "match":
+                match_lines.append(line_number)
+
+        elif kind == "end":
+            file = _rg_text(data["path"])
+            for line_number in match_lines:
+                matches.append(
+                    GrepMatch(
+                        file=file,
+                        line_number=line_number,
+                        content=lines[line_number],
+                        context_before=tuple(
+                            lines[i]
+                            for i in range(line_number - context_lines, line_number)
+                            if i in lines
+                        ),
+                        context_after=tuple(
+                            lines[i]
+                            for i in range(line_number + 1, line_number + context_lines + 1)
+                            if i in lines
+                        ),
+                    )
+                )
+                if len(matches) >= max_results:
+                    return matches
+            lines.clear()
+            match_lines.clear()
 
     return matches
 
 
+def _rg_text(value: dict[str, str]) -> str:
+    """Decode a ripgrep JSON text field (base64 "bytes" if not UTF-8)"""
+    if "text" in value:
+        return value["text"]
+    return base64.b64decode(value["bytes"]).decode("utf-8", errors="replace")
+
+
+def _strip_line_ending(line: str) -> str:
+    """Remove a trailing LF or CRLF"""
+    if line.endswith("\n"):
+        line = line[:-1]
+        if line.endswith("\r"):
+            line = line[:-1]
+    return line
+
+
 def _search_file(
-    file_path: Path,
+    file_path: str,
+    rel_path: str,
     regex: re.Pattern[str],
     context_lines: int,
     max_matches: int,
-    base_path: Path,
+    literal: str | None = None,
 ) -> list[GrepMatch]:
-    """Search a single file for pattern matches"""
+    """Search a single file for pattern matches
+
+    The file is opened once: the size check uses fstat() on the open
+    handle, the first chunk doubles as the binary check and the rest is
+    read from the same handle. Large and binary files yield no matches.
+    When the pattern is a plain string, pass it as literal to search with
+    str.find instead of regex.
+
+    For a literal and a file of at least _MMAP_MIN_SIZE bytes, the file is
+    first memory-mapped and probed for the encoded literal, so files that
+    don't contain it are never copied or decoded.
+    """
     matches: list[GrepMatch] = []
 
     try:
-        content = file_path.read_text(encoding="utf-8", errors="replace")
-    except Exception:
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if _is_too_large(size):
+                return []
+            head = f.read(_BINARY_CHECK_SIZE)
+            # Null bytes are common in binary files
+            if b"\x00" in head:
+                return []
+            # U+FFFD in the literal could match replaced invalid bytes,
+            # which a byte-level probe would miss
+            if literal and size >= _MMAP_MIN_SIZE and "\ufffd" not in literal:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if mapped.find(literal.encode("utf-8")) < 0:
+                        return []
+            data = head + f.read()
+    except (OSError, ValueError):
         return []
 
-    lines = content.splitlines()
+    content = data.decode("utf-8", errors="replace")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+    # Scan the whole buffer in the regex engine rather than line by line,
+    # then map each hit back to its line. Patterns whose hits depend on
+    # text outside the line are tried on every line instead.
+    size = len(content)
+    line_number = 1
+    counted_to = 0
+    pos = 0
+    per_line = literal is None and _needs_line_scan(regex.pattern)
+
+    while len(matches) < max_matches:
+        if per_line:
+            if pos >= size:
+                break
+            start = pos
+        elif literal is not None:
+            start = content.find(literal, pos)
+            if start < 0:
+                break
+        else:
+            m = regex.search(content, pos)
+            if m is None:
+                break
+            start = m.start()
+
+        line_start = content.rfind("\n", 0, start) + 1
+        if line_start >= size:
+            break  # empty match past the final newline
+        line_end = content.find("\n", start)
+        if line_end < 0:
+            line_end = size
+        pos = line_end + 1
+
+        # Lines are matched on their own, as if split out of the file
+        if literal is None and not regex.search(content[line_start:line_end]):
+            continue
+
+        line_number += content.count("\n", counted_to, line_start)
+        counted_to = line_start
+
+        # Get context lines
+        context_before: tuple[str, ...] = ()
+        context_after: tuple[str, ...] = ()
+
+        if context_lines > 0:
+            context_before = _lines_before(content, line_start, context_lines)
+            context_after = _lines_after(content, line_end, context_lines)
+
+        matches.append(
+            GrepMatch(
+                file=rel_path,
+                line_number=line_number,  # 1-based line numbers
+                content=content[line_start:line_end],
+                context_before=context_before,
+                context_after=context_after,
+            )
+        )
 
-    for i, line in enumerate(lines):
-        if len(matches) >= max_matches:
+        if pos > size:
             break
 
-        if regex.search(line):
-            # Get relative path
-            try:
-                rel_path = str(file_path.relative_to(base_path))
-            except ValueError:
-                rel_path = str(file_path)
-
-            # Get context lines
-            context_before = []
-            context_after = []
-
-            if context_lines > 0:
-                start = max(0, i - context_lines)
-                end = min(len(lines), i + context_lines + 1)
-                context_before = lines[start:i]
-                context_after = lines[i + 1 : end]
-
-            matches.append(
-                GrepMatch(
-                    file=rel_path,
-                    line_number=i + 1,  # 1-based line numbers
-                    content=line,
-                    context_before=context_before,
-                    context_after=context_after,
-                )
-            )
-
     return matches
 
 
+def _lines_before(content: str, line_start: int, count: int) -> tuple[str, ...]:
+    """Get up to count lines ending just before line_start"""
+    lines = []
+    end = line_start - 1  # newline terminating the previous line
+    while end >= 0 and len(lines) < count:
+        start = content.rfind("\n", 0, end) + 1
+        lines.append(content[start:end])
+        end = start - 1
+    lines.reverse()
+    return tuple(lines)
+
+
+def _lines_after(content: str, line_end: int, count: int) -> tuple[str, ...]:
+    """Get up to count lines starting just after line_end"""
+    lines = []
+    start = line_end + 1
+    while start < len(content) and len(lines) < count:
+        end = content.find("\n", start)
+        if end < 0:
+            end = len(content)
+        lines.append(content[start:end])
+        start = end + 1
+    return tuple(lines)
+
+
 def format_grep_results(
     matches: list[GrepMatch],
     max_results: int = 100,
@@ -299,8 +614,7 @@ def format_grep_results(
     return "\n".join(parts)
 
 
-@tool(args_schema=GrepInput)
-def grep_tool(
+def _grep_tool(
     pattern: str,
     path: str = ".",
     file_type: str | None = None,
@@ -327,3 +641,11 @@ def grep_tool(
         return format_grep_results(matches, max_results, show_context=context_lines > 0)
     except GrepToolError as e:
         return f"Error: {e}"
+
+
+def __getattr__(name: str) -> Any:
+    # The LangChain tool is built on first access, so importing this
+    # module for its plain functions doesn't load langchain_core
+    if name == "grep_tool":
+        return build_tool(globals(), name, _grep_tool, "GrepInput")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
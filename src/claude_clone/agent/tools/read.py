@@ -1,7 +1,8 @@
 """Read Tool - File reading with line numbers
 
 Reads file contents with UTF-8 encoding and returns formatted output
-with line numbers. Supports offset and limit for large files.
+with line numbers. Supports offset and limit for large files; only the
+requested lines are decoded.
 
 Usage:
     from claude_clone.agent.tools.read import read_tool
@@ -10,11 +11,16 @@ Usage:
     agent = create_agent(config, tools=[read_tool])
 """
 
-from pathlib import Path
+from itertools import repeat
+from typing import Any
 
-from langchain_core.tools import tool
+from claude_clone.agent.tools._lazy import build_tool
+from claude_clone.agent.tools._paths import normalize_path
 
-from claude_clone.agent.tools.schemas import ReadInput
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+# Bytes per block when skipping lines with count()
+_SKIP_BLOCK_SIZE = 1 << 16
 
 
 class ReadToolError(Exception):
@@ -35,21 +41,6 @@ class FileNotFoundError(ReadToolError):
     pass
 
 
-def _normalize_path(path: str) -> Path:
-    """Normalize path to absolute path
-
-    Args:
-        path: File path (absolute or relative)
-
-    Returns:
-        Resolved absolute Path object
-    """
-    p = Path(path)
-    if not p.is_absolute():
-        p = Path.cwd() / p
-    return p.resolve()
-
-
 def _is_binary(content: bytes) -> bool:
     """Check if content is binary by looking for null bytes
 
@@ -62,18 +53,39 @@ def _is_binary(content: bytes) -> bool:
     return b"\x00" in content[:8192]
 
 
-def _strip_bom(content: str) -> str:
-    """Strip UTF-8 BOM if present
+def _skip_lines(content: bytes, pos: int, count: int) -> int:
+    """Advance past count newline-terminated lines
+
+    Whole blocks are skipped with a C-level count() while they hold fewer
+    newlines than are left to skip, so a large offset doesn't cost one
+    Python-level find() per line.
 
     Args:
-        content: Decoded string content
+        content: Raw file content
+        pos: Byte offset to start from
+        count: Number of lines to skip
 
     Returns:
-        Content without BOM
+        Byte offset of the line after the skipped ones (or end of content)
     """
-    if content.startswith("\ufeff"):
-        return content[1:]
-    return content
+    size = len(content)
+    while count:
+        block_end = min(pos + _SKIP_BLOCK_SIZE, size)
+        newlines = content.count(b"\n", pos, block_end)
+        if newlines >= count:
+            break
+        if block_end == size:
+            return size
+        count -= newlines
+        pos = block_end
+
+    find = content.find
+    for _ in range(count):
+        newline = find(b"\n", pos)
+        if newline < 0:
+            return size
+        pos = newline + 1
+    return pos
 
 
 def _format_with_line_numbers(lines: list[str], start_line: int) -> str:
@@ -90,17 +102,16 @@ def _format_with_line_numbers(lines: list[str], start_line: int) -> str:
         1→def main():
         2→    print("hello")
     """
-    result = []
     max_line_num = start_line + len(lines)
     width = len(str(max_line_num))
 
-    for i, line in enumerate(lines):
-        line_num = start_line + i
-        # Remove trailing newline for consistent formatting
-        line = line.rstrip("\n\r")
-        result.append(f"{line_num:>{width}}→{line}")
-
-    return "\n".join(result)
+    # Build the number prefixes in one pass, then pair them with the lines
+    # (trailing newlines removed) through C-level map/join rather than
+    # formatting each line with an f-string
+    prefixes = [
+        str(line_num).rjust(width) + "→" for line_num in range(start_line, max_line_num)
+    ]
+    return "\n".join(map(str.__add__, prefixes, map(str.rstrip, lines, repeat("\n\r"))))
 
 
 def read_file(file_path: str, offset: int = 0, limit: int = 2000) -> str:
@@ -122,7 +133,7 @@ def read_file(file_path: str, offset: int = 0, limit: int = 2000) -> str:
         BinaryFileError: File is binary
         ReadToolError: Other read errors
     """
-    path = _normalize_path(file_path)
+    path = normalize_path(file_path)
 
     # Check file exists
     if not path.exists():
@@ -138,20 +149,25 @@ def read_file(file_path: str, offset: int = 0, limit: int = 2000) -> str:
         if _is_binary(raw_content):
             raise BinaryFileError(f"Binary file cannot be read: {path}")
 
-        # Decode with UTF-8, replace errors
-        content = raw_content.decode("utf-8", errors="replace")
-        content = _strip_bom(content)
-
-        # Split into lines and apply offset/limit
-        lines = content.splitlines(keepends=True)
-        total_lines = len(lines)
+        # Skip a UTF-8 BOM without copying the buffer
+        start = len(_UTF8_BOM) if raw_content.startswith(_UTF8_BOM) else 0
 
-        # Apply offset and limit
-        selected_lines = lines[offset : offset + limit]
+        # Count lines on raw bytes (a trailing partial line counts too)
+        total_lines = raw_content.count(b"\n", start)
+        if len(raw_content) > start and not raw_content.endswith(b"\n"):
+            total_lines += 1
 
-        if not selected_lines:
+        if offset >= total_lines:
             return f"(Empty or offset beyond file. Total lines: {total_lines})"
 
+        # Locate the requested lines and decode only that slice
+        begin = _skip_lines(raw_content, start, offset)
+        end = _skip_lines(raw_content, begin, limit)
+        chunk = raw_content[begin:end].decode("utf-8", errors="replace")
+        if chunk.endswith("\n"):
+            chunk = chunk[:-1]
+        selected_lines = chunk.split("\n")
+
         # Format with line numbers (1-based for display)
         start_line = offset + 1
         formatted = _format_with_line_numbers(selected_lines, start_line)
@@ -169,8 +185,7 @@ def read_file(file_path: str, offset: int = 0, limit: int = 2000) -> str:
         raise ReadToolError(f"Failed to read file {path}: {e}") from e
 
 
-@tool(args_schema=ReadInput)
-def read_tool(file_path: str, offset: int = 0, limit: int = 2000) -> str:
+def _read_tool(file_path: str, offset: int = 0, limit: int = 2000) -> str:
     """Read the contents of a file with line numbers.
 
     Use this tool to read source code files, configuration files, or any text file.
@@ -188,3 +203,11 @@ def read_tool(file_path: str, offset: int = 0, limit: int = 2000) -> str:
         return read_file(file_path, offset, limit)
     except ReadToolError as e:
         return f"Error: {e}"
+
+
+def __getattr__(name: str) -> Any:
+    # The LangChain tool is built on first access, so importing this
+    # module for its plain functions doesn't load langchain_core
+    if name == "read_tool":
+        return build_tool(globals(), name, _read_tool, "ReadInput")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
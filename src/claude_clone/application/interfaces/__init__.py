@@ -4,10 +4,12 @@ from claude_clone.application.interfaces.run_repository import RunRepository
 from claude_clone.application.interfaces.approval_repository import ApprovalRepository
 from claude_clone.application.interfaces.event_repository import EventRepository
 from claude_clone.application.interfaces.event_publisher import EventPublisher
+from claude_clone.application.interfaces.unit_of_work import UnitOfWork
 
 __all__ = [
     "RunRepository",
     "ApprovalRepository",
     "EventRepository",
     "EventPublisher",
+    "UnitOfWork",
 ]
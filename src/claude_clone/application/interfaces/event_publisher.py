@@ -22,10 +22,48 @@ class EventPublisher(ABC):
         run_id: str,
         event_type: EventType,
         data: Optional[dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Event:
-        """Publish an event and return the created Event."""
+        """Publish an event and return the created Event.
+
+        If an event was already published with ``idempotency_key``, that
+        event is returned and nothing new is published.
+        """
         ...
 
+    def enqueue(
+        self,
+        run_id: str,
+        event_type: EventType,
+        data: Optional[dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Event:
+        """Add an event to the outbox, to be published by flush_outbox().
+
+        Used by use cases running inside a UnitOfWork, which flushes the
+        outbox on commit so its events are written in one batch.
+        Publishers without an outbox publish immediately.
+        """
+        return self.publish(run_id, event_type, data, idempotency_key)
+
+    def find_published(self, idempotency_key: str) -> Optional[Event]:
+        """Find the event published or enqueued with an idempotency key.
+
+        Returns None if there is none, or if the publisher doesn't track
+        keys.
+        """
+        return None
+
+    def outbox_mark(self) -> int:
+        """Return the current thread's outbox position, for discard_outbox()."""
+        return 0
+
+    def flush_outbox(self) -> None:
+        """Publish the events enqueued by the current thread."""
+
+    def discard_outbox(self, mark: int = 0) -> None:
+        """Drop the events the current thread enqueued after ``mark``."""
+
     @abstractmethod
     def subscribe(
         self,
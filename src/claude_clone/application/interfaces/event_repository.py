@@ -1,7 +1,8 @@
 """EventRepository interface - Abstract repository for Event entities."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections.abc import Collection
+from typing import Iterable, Optional
 
 from claude_clone.domain.entities.event import Event, EventType
 
@@ -21,19 +22,47 @@ class EventRepository(ABC):
         """Save an event."""
         ...
 
+    def save_many(self, events: Iterable[Event]) -> None:
+        """Save several events at once.
+
+        Implementations should override this to persist the batch in a
+        single operation. For SQL stores that means one ``executemany``
+        INSERT inside a single transaction (``BEGIN IMMEDIATE``), with the
+        database in WAL mode and ``synchronous=NORMAL`` so the batch costs
+        one commit rather than one per event.
+        """
+        for event in events:
+            self.save(event)
+
     @abstractmethod
     def find_by_id(self, event_id: int) -> Optional[Event]:
         """Find an event by ID. Returns None if not found."""
         ...
 
+    @abstractmethod
+    def find_by_idempotency_key(self, idempotency_key: str) -> Optional[Event]:
+        """Find the event saved with an idempotency key. Returns None if not found.
+
+        Keys are unique across the store; SQL implementations keep them in
+        a UNIQUE column, which also serves this lookup.
+        """
+        ...
+
     @abstractmethod
     def find_by_run(
         self,
         run_id: str,
         since_id: Optional[int] = None,
         limit: int = 100,
+        event_types: Optional[Collection[EventType]] = None,
     ) -> list[Event]:
-        """Find events for a run, optionally since a given event ID."""
+        """Find events for a run, optionally since a given event ID.
+
+        ``event_types`` restricts the result to those types. Like
+        ``find_by_type``, the filter must be answered by the storage
+        index (``... AND type IN (...)`` over ``(run_id, type, id)``),
+        not by filtering the run's events afterwards.
+        """
         ...
 
     @abstractmethod
@@ -43,7 +72,16 @@ class EventRepository(ABC):
         event_type: EventType,
         limit: int = 100,
     ) -> list[Event]:
-        """Find events of a specific type for a run."""
+        """Find events of a specific type for a run.
+
+        The type filter must be answered by the storage index, not by
+        filtering a run's events afterwards. SQL implementations need a
+        composite index covering the whole predicate and ordering::
+
+            CREATE INDEX events_run_type_id ON events(run_id, type, id);
+
+        and query ``WHERE run_id = ? AND type = ? ORDER BY id LIMIT ?``.
+        """
         ...
 
     @abstractmethod
@@ -0,0 +1,79 @@
+"""UnitOfWork interface - Groups repository writes and event publishing."""
+
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Optional
+
+from claude_clone.application.interfaces.event_publisher import EventPublisher
+
+
+class UnitOfWork(ABC):
+    """Abstract unit of work spanning a save and the events it publishes.
+
+    Used as a context manager around a use case's writes: they are
+    committed together when the block exits normally and rolled back if
+    it raises. Units of work on the same store are serialized, so the
+    events of concurrent use cases can't interleave within a run.
+
+    If ``event_publisher`` is set, use cases enqueue their events on it
+    instead of publishing them; the outbox is flushed just before the
+    outermost commit. A block that raises discards only the events
+    enqueued inside it, so a nested failure that the caller catches
+    doesn't drop the enclosing block's events.
+
+    Subclasses that define ``__init__`` must call ``super().__init__()``.
+
+    Implementations:
+    - InMemoryUnitOfWork (testing)
+    - SqliteUnitOfWork (production, BEGIN IMMEDIATE ... COMMIT)
+    """
+
+    def __init__(self, event_publisher: Optional[EventPublisher] = None) -> None:
+        self.event_publisher = event_publisher
+        # Outbox position at entry of each open block, innermost last;
+        # only changed while the unit of work is held
+        self._outbox_marks: list[int] = []
+
+    def __enter__(self) -> "UnitOfWork":
+        self.begin()
+        publisher = self.event_publisher
+        self._outbox_marks.append(publisher.outbox_mark() if publisher is not None else 0)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        mark = self._outbox_marks.pop()
+        publisher = self.event_publisher
+        if exc_type is not None:
+            if publisher is not None:
+                publisher.discard_outbox(mark)
+            self.rollback()
+            return
+
+        if publisher is not None and not self._outbox_marks:
+            try:
+                publisher.flush_outbox()
+            except BaseException:
+                publisher.discard_outbox()
+                self.rollback()
+                raise
+        self.commit()
+
+    @abstractmethod
+    def begin(self) -> None:
+        """Start the unit of work."""
+        ...
+
+    @abstractmethod
+    def commit(self) -> None:
+        """Make the writes since begin() durable and visible."""
+        ...
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """Discard the writes since begin()."""
+        ...
@@ -1,24 +1,29 @@
 """CreateRunUseCase - Create a new agent run."""
 
+from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Optional
 
 from claude_clone.domain.entities.run import Run
-from claude_clone.domain.entities.event import EventType
+from claude_clone.domain.entities.event import Event, EventType
+from claude_clone.domain.exceptions import IdempotencyConflictError, NotFoundError
 from claude_clone.application.interfaces.run_repository import RunRepository
 from claude_clone.application.interfaces.event_publisher import EventPublisher
+from claude_clone.application.interfaces.unit_of_work import UnitOfWork
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CreateRunRequest:
     """Request to create a new run."""
 
     goal: str
     repo_root: str = "."
     branch: Optional[str] = None
+    # Retries with the same key return the run created by the first attempt
+    idempotency_key: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CreateRunResponse:
     """Response from creating a run."""
 
@@ -29,10 +34,10 @@ class CreateRunResponse:
 class CreateRunUseCase:
     """Use case: Create a new agent run.
 
-    Steps:
-    1. Create Run entity
-    2. Save to repository
-    3. Publish run.started event
+    Steps (one unit of work):
+    1. Return the earlier run if the idempotency key was already used
+    2. Create Run entity
+    3. Save to repository and publish run.started event
     4. Return response
     """
 
@@ -40,30 +45,72 @@ class CreateRunUseCase:
         self,
         run_repository: RunRepository,
         event_publisher: EventPublisher,
+        unit_of_work: Optional[UnitOfWork] = None,
     ):
         self.run_repository = run_repository
         self.event_publisher = event_publisher
+        self.unit_of_work = unit_of_work
+        # Inside a unit of work that flushes this publisher, events go to
+        # its outbox and are written together on commit
+        if unit_of_work is not None and unit_of_work.event_publisher is event_publisher:
+            self._publish = event_publisher.enqueue
+        else:
+            self._publish = event_publisher.publish
 
     def execute(self, request: CreateRunRequest) -> CreateRunResponse:
         """Execute the use case."""
-        # Create run entity
-        run = Run.create(goal=request.goal, repo_root=request.repo_root)
-        if request.branch:
-            run.branch = request.branch
+        with self.unit_of_work or nullcontext():
+            # Retried request: return the run created the first time
+            if request.idempotency_key is not None:
+                earlier = self.event_publisher.find_published(request.idempotency_key)
+                if earlier is not None:
+                    return self._earlier_response(earlier, request)
+
+            # Create run entity
+            run = Run.create(goal=request.goal, repo_root=request.repo_root)
+            if request.branch:
+                run.branch = request.branch
+
+            # Start the run
+            run.start()
+
+            # Save to repository
+            self.run_repository.save(run)
+
+            # Publish event
+            event = self._publish(
+                run_id=run.id,
+                event_type=EventType.RUN_STARTED,
+                data={"goal": run.goal, "repo_root": run.repo_root},
+                idempotency_key=request.idempotency_key,
+            )
+
+            if event.run_id != run.id:
+                # A concurrent attempt with the same key published first
+                self.run_repository.delete(run.id)
+                return self._earlier_response(event, request)
 
-        # Start the run
-        run.start()
-
-        # Save to repository
-        self.run_repository.save(run)
-
-        # Publish event
-        self.event_publisher.publish(
+        return CreateRunResponse(
             run_id=run.id,
-            event_type=EventType.RUN_STARTED,
-            data={"goal": run.goal, "repo_root": run.repo_root},
+            status=run.status.value,
         )
 
+    def _earlier_response(self, event: Event, request: CreateRunRequest) -> CreateRunResponse:
+        """Build the response for the run started by an earlier event.
+
+        Raises IdempotencyConflictError if the event wasn't published by
+        the same request (another goal or use case).
+        """
+        if (
+            event.type != EventType.RUN_STARTED
+            or event.data.get("goal") != request.goal
+            or event.data.get("repo_root") != request.repo_root
+        ):
+            raise IdempotencyConflictError(event.idempotency_key)
+
+        run = self.run_repository.find_by_id(event.run_id)
+        if run is None:
+            raise NotFoundError("Run", event.run_id)
         return CreateRunResponse(
             run_id=run.id,
             status=run.status.value,
@@ -1,7 +1,8 @@
 """GetTimelineUseCase - Get timeline of events for a run."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
 
 from claude_clone.domain.entities.event import Event
 from claude_clone.domain.exceptions import NotFoundError
@@ -9,7 +10,7 @@ from claude_clone.application.interfaces.run_repository import RunRepository
 from claude_clone.application.interfaces.event_repository import EventRepository
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GetTimelineRequest:
     """Request to get timeline."""
 
@@ -18,7 +19,7 @@ class GetTimelineRequest:
     limit: int = 100
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimelineEvent:
     """A single event in the timeline response."""
 
@@ -26,10 +27,10 @@ class TimelineEvent:
     type: str
     timestamp: str
     summary: str
-    data: dict
+    data: Mapping[str, Any]  # Read-only view of the event payload
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GetTimelineResponse:
     """Response containing timeline events."""
 
@@ -39,6 +40,17 @@ class GetTimelineResponse:
     has_more: bool
 
 
+def _to_timeline_event(e: Event) -> TimelineEvent:
+    """Convert a domain event to its timeline representation."""
+    return TimelineEvent(
+        e.id,
+        e.type.value,
+        e.timestamp.isoformat(),
+        e.to_summary(),
+        e.data,  # Already a read-only view
+    )
+
+
 class GetTimelineUseCase:
     """Use case: Get timeline of events for a run.
 
@@ -67,25 +79,22 @@ class GetTimelineUseCase:
         events = self.event_repository.find_by_run(
             run_id=request.run_id,
             since_id=request.since_event_id,
-            limit=request.limit + 1,  # +1 to check if there's more
+            limit=request.limit,
         )
 
-        # Check if there's more
-        has_more = len(events) > request.limit
-        if has_more:
-            events = events[:request.limit]
+        # Check if there's more: only a full page can have a successor, and
+        # ids increase, so compare against the run's latest id rather than
+        # fetching an extra row
+        has_more = False
+        if len(events) >= request.limit:
+            last_seen = events[-1].id if events else request.since_event_id
+            latest_id = self.event_repository.get_latest_id(request.run_id)
+            has_more = latest_id is not None and (
+                last_seen is None or latest_id > last_seen
+            )
 
         # Convert to response
-        timeline_events = [
-            TimelineEvent(
-                id=e.id,
-                type=e.type.value,
-                timestamp=e.timestamp.isoformat(),
-                summary=e.to_summary(),
-                data=dict(e.data),
-            )
-            for e in events
-        ]
+        timeline_events = list(map(_to_timeline_event, events))
 
         latest_id = events[-1].id if events else None
 
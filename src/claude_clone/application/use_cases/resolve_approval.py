@@ -1,14 +1,17 @@
 """ResolveApprovalUseCase - Approve or reject a pending approval."""
 
+from contextlib import nullcontext
 from dataclasses import dataclass
+from typing import Optional
 
-from claude_clone.domain.entities.event import EventType
-from claude_clone.domain.exceptions import NotFoundError
+from claude_clone.domain.entities.event import Event, EventType
+from claude_clone.domain.exceptions import IdempotencyConflictError, NotFoundError
 from claude_clone.application.interfaces.approval_repository import ApprovalRepository
 from claude_clone.application.interfaces.event_publisher import EventPublisher
+from claude_clone.application.interfaces.unit_of_work import UnitOfWork
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResolveApprovalRequest:
     """Request to resolve an approval."""
 
@@ -16,9 +19,11 @@ class ResolveApprovalRequest:
     approved: bool
     comment: str = ""
     resolved_by: str = "user"
+    # A retry with the same key returns the first attempt's outcome
+    idempotency_key: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResolveApprovalResponse:
     """Response from resolving an approval."""
 
@@ -30,53 +35,92 @@ class ResolveApprovalResponse:
 class ResolveApprovalUseCase:
     """Use case: Resolve (approve/reject) a pending approval.
 
-    Steps:
-    1. Find the approval
-    2. Validate it's pending
-    3. Resolve it
-    4. Save to repository
-    5. Publish event
-    6. Return response
+    Steps (one unit of work):
+    1. Return the earlier outcome if the idempotency key was already used
+    2. Find the approval
+    3. Resolve it (the domain checks it's pending)
+    4. Save to repository and publish event
+    5. Return response
     """
 
     def __init__(
         self,
         approval_repository: ApprovalRepository,
         event_publisher: EventPublisher,
+        unit_of_work: Optional[UnitOfWork] = None,
     ):
         self.approval_repository = approval_repository
         self.event_publisher = event_publisher
+        self.unit_of_work = unit_of_work
+        # Inside a unit of work that flushes this publisher, events go to
+        # its outbox and are written together on commit
+        if unit_of_work is not None and unit_of_work.event_publisher is event_publisher:
+            self._publish = event_publisher.enqueue
+        else:
+            self._publish = event_publisher.publish
 
     def execute(self, request: ResolveApprovalRequest) -> ResolveApprovalResponse:
         """Execute the use case."""
-        # Find approval
-        approval = self.approval_repository.find_by_id(request.approval_id)
-        if not approval:
-            raise NotFoundError("Approval", request.approval_id)
+        with self.unit_of_work or nullcontext():
+            # Retried request: the approval is no longer pending, so report
+            # the first resolution instead of resolving again
+            if request.idempotency_key is not None:
+                earlier = self.event_publisher.find_published(request.idempotency_key)
+                if earlier is not None:
+                    return self._earlier_response(earlier, request)
+
+            # Find approval
+            approval = self.approval_repository.find_by_id(request.approval_id)
+            if not approval:
+                raise NotFoundError("Approval", request.approval_id)
+
+            # Resolve it
+            if request.approved:
+                approval.approve(resolved_by=request.resolved_by, comment=request.comment)
+                event_type = EventType.APPROVAL_APPROVED
+            else:
+                approval.reject(resolved_by=request.resolved_by, comment=request.comment)
+                event_type = EventType.APPROVAL_REJECTED
+
+            # Save
+            self.approval_repository.save(approval)
+
+            # Publish event
+            self._publish(
+                run_id=approval.run_id,
+                event_type=event_type,
+                data={
+                    "approval_id": approval.id,
+                    "target": approval.target,
+                    "resolved_by": request.resolved_by,
+                    "comment": request.comment,
+                },
+                idempotency_key=request.idempotency_key,
+            )
 
-        # Resolve it
-        if request.approved:
-            approval.approve(resolved_by=request.resolved_by, comment=request.comment)
-            event_type = EventType.APPROVAL_APPROVED
-        else:
-            approval.reject(resolved_by=request.resolved_by, comment=request.comment)
-            event_type = EventType.APPROVAL_REJECTED
-
-        # Save
-        self.approval_repository.save(approval)
-
-        # Publish event
-        self.event_publisher.publish(
-            run_id=approval.run_id,
-            event_type=event_type,
-            data={
-                "approval_id": approval.id,
-                "target": approval.target,
-                "resolved_by": request.resolved_by,
-                "comment": request.comment,
-            },
+        return ResolveApprovalResponse(
+            approval_id=approval.id,
+            status=approval.status.value,
+            target=approval.target,
+        )
+
+    def _earlier_response(
+        self, event: Event, request: ResolveApprovalRequest
+    ) -> ResolveApprovalResponse:
+        """Build the response for the resolution recorded by an earlier event.
+
+        Raises IdempotencyConflictError if the event wasn't published by
+        the same request (another approval, decision or use case).
+        """
+        expected_type = (
+            EventType.APPROVAL_APPROVED if request.approved else EventType.APPROVAL_REJECTED
         )
+        if event.type != expected_type or event.data.get("approval_id") != request.approval_id:
+            raise IdempotencyConflictError(event.idempotency_key)
 
+        approval = self.approval_repository.find_by_id(request.approval_id)
+        if approval is None:
+            raise NotFoundError("Approval", request.approval_id)
         return ResolveApprovalResponse(
             approval_id=approval.id,
             status=approval.status.value,
@@ -1,7 +1,10 @@
 """FileCheckpointManager - File-based checkpoint implementation
 
-Stores file snapshots as JSON for rollback purposes.
-MVP implementation using simple file storage.
+Stores file snapshots for rollback purposes in an append-only JSONL log
+(``checkpoints.jsonl``) with a small sidecar index (``index.jsonl``) of
+byte offsets, so listing and loading checkpoints never parse the whole log.
+File contents are stored once per distinct content under ``objects/<sha256>``
+and snapshots only reference them by hash.
 
 Usage:
     from claude_clone.backends.file_checkpoint import FileCheckpointManager
@@ -13,10 +16,16 @@ Usage:
     manager.restore(checkpoint.id)  # Rollback
 """
 
+import hashlib
+import heapq
 import json
+import os
+import stat
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO
 
 from claude_clone.interfaces import CheckpointManager, FileCheckpoint, FileSnapshot
 
@@ -33,11 +42,33 @@ class CheckpointNotFoundError(CheckpointError):
     pass
 
 
+_LOG_FILE = "checkpoints.jsonl"
+_INDEX_FILE = "index.jsonl"
+_OBJECTS_DIR = "objects"
+_TRACK_CACHE_FILE = ".track_cache.json"
+
+
+@dataclass(frozen=True, slots=True)
+class _IndexEntry:
+    """Location of a checkpoint record in the log"""
+
+    offset: int
+    length: int
+    timestamp: datetime
+    turn: int
+
+
 class FileCheckpointManager(CheckpointManager):
     """File-based checkpoint manager
 
-    Stores checkpoints as JSON files in a storage directory.
-    Each checkpoint contains snapshots of tracked files.
+    Appends each checkpoint as one compact JSON line to ``checkpoints.jsonl``
+    and its ``(offset, length, timestamp, turn)`` to ``index.jsonl``. The
+    index is cached in memory and only its new tail is read on later calls,
+    so loading a checkpoint is a single positioned read. Each checkpoint
+    contains snapshots of tracked files, whose contents are deduplicated in
+    a content-addressed object store keyed by SHA-256.
+
+    A storage directory is expected to have a single writer at a time.
 
     Attributes:
         storage_dir: Directory to store checkpoint files
@@ -66,6 +97,20 @@ class FileCheckpointManager(CheckpointManager):
         self._tracked_files: dict[str, FileSnapshot | None] = {}
         self._turn = turn
 
+        self._log_path = self.storage_dir / _LOG_FILE
+        self._index_path = self.storage_dir / _INDEX_FILE
+        self._objects_dir = self.storage_dir / _OBJECTS_DIR
+        self._objects_dir.mkdir(exist_ok=True)
+
+        # path -> (st_mtime_ns, st_size, content hash) of the last read
+        self._track_cache_path = self.storage_dir / _TRACK_CACHE_FILE
+        self._track_cache: dict[str, tuple[int, int, str]] = self._load_track_cache()
+        self._index: dict[str, _IndexEntry] = {}
+        self._index_inode: int | None = None
+        self._index_pos = 0
+
+        self._migrate_legacy_files()
+
     @property
     def turn(self) -> int:
         """Current conversation turn number"""
@@ -79,38 +124,64 @@ class FileCheckpointManager(CheckpointManager):
     def track_file(self, file_path: str) -> None:
         """Start tracking a file for potential rollback
 
-        Saves the current content of the file before modification.
+        Stores the current content of the file before modification. A file
+        whose mtime and size match the last time it was read is not read
+        again; its known content hash is reused.
 
         Args:
             file_path: Path to the file to track
         """
-        # Normalize path
-        path = Path(file_path)
-        if not path.is_absolute():
-            path = Path.cwd() / path
-        path = path.resolve()
-        path_str = str(path)
+        # Normalize lexically; unlike Path.resolve() this doesn't stat or
+        # readlink every path component
+        path_str = os.path.abspath(file_path)
 
         # Skip if already tracked in this turn
         if path_str in self._tracked_files:
             return
 
         # Save current state (or None if file doesn't exist)
-        if path.exists() and path.is_file():
-            try:
-                content = path.read_text(encoding="utf-8")
-                mtime = path.stat().st_mtime
-                self._tracked_files[path_str] = FileSnapshot(
-                    path=path_str,
-                    content=content,
-                    mtime=mtime,
-                )
-            except (OSError, UnicodeDecodeError):
-                # Can't read file, mark as new
-                self._tracked_files[path_str] = None
-        else:
+        try:
+            st = os.stat(path_str)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             # File doesn't exist, mark as new
             self._tracked_files[path_str] = None
+            return
+
+        cached = self._track_cache.get(path_str)
+        if (
+            cached is not None
+            and cached[:2] == (st.st_mtime_ns, st.st_size)
+            and (self._objects_dir / cached[2]).exists()
+        ):
+            self._tracked_files[path_str] = FileSnapshot(
+                path=path_str,
+                content_hash=cached[2],
+                mtime=st.st_mtime,
+                size=st.st_size,
+            )
+            return
+
+        try:
+            with open(path_str, "rb") as f:
+                # Stat the open file before reading, so a concurrent write
+                # changes the mtime and misses the cache next time
+                st = os.fstat(f.fileno())
+                content = f.read()
+        except OSError:
+            # Can't read file, mark as new
+            self._tracked_files[path_str] = None
+            return
+
+        content_hash = self._store_object(content)
+        self._track_cache[path_str] = (st.st_mtime_ns, st.st_size, content_hash)
+        self._tracked_files[path_str] = FileSnapshot(
+            path=path_str,
+            content_hash=content_hash,
+            mtime=st.st_mtime,
+            size=len(content),
+        )
 
     def create(self, message: str) -> FileCheckpoint:
         """Create a checkpoint from currently tracked files
@@ -144,6 +215,7 @@ class FileCheckpointManager(CheckpointManager):
 
         # Clear tracked files for next turn
         self._tracked_files.clear()
+        self._save_track_cache()
 
         return checkpoint
 
@@ -171,7 +243,7 @@ class FileCheckpointManager(CheckpointManager):
                 # Create parent directories if needed
                 path.parent.mkdir(parents=True, exist_ok=True)
                 # Restore content
-                path.write_text(snapshot.content, encoding="utf-8")
+                path.write_bytes(self.read_snapshot(snapshot))
                 restored_paths.append(snapshot.path)
             except OSError:
                 # Skip files that can't be restored
@@ -188,22 +260,22 @@ class FileCheckpointManager(CheckpointManager):
         Returns:
             List of checkpoints, newest first
         """
-        checkpoints: list[FileCheckpoint] = []
+        if limit <= 0:
+            return []
 
-        # Load all checkpoint files
-        for checkpoint_file in self.storage_dir.glob("*.json"):
-            try:
-                checkpoint = self._load_checkpoint_from_file(checkpoint_file)
-                if checkpoint:
-                    checkpoints.append(checkpoint)
-            except Exception:
-                # Skip invalid files
-                continue
+        index = self._refresh_index()
+        newest = heapq.nlargest(limit, index.values(), key=lambda e: e.timestamp)
+        if not newest:
+            return []
 
-        # Sort by timestamp (newest first)
-        checkpoints.sort(key=lambda c: c.timestamp, reverse=True)
+        checkpoints: list[FileCheckpoint] = []
+        with open(self._log_path, "rb") as log:
+            for entry in newest:
+                checkpoint = self._read_record(log, entry)
+                if checkpoint is not None:
+                    checkpoints.append(checkpoint)
 
-        return checkpoints[:limit]
+        return checkpoints
 
     def clear_old(self, keep_last: int = 50) -> int:
         """Remove old checkpoints, keeping only the most recent
@@ -214,24 +286,62 @@ class FileCheckpointManager(CheckpointManager):
         Returns:
             Number of deleted checkpoints
         """
-        checkpoints = self.list_checkpoints(limit=10000)  # Get all
+        index = self._refresh_index()
 
-        if len(checkpoints) <= keep_last:
+        if len(index) <= keep_last:
             return 0
 
-        # Delete old ones
-        to_delete = checkpoints[keep_last:]
-        deleted_count = 0
+        # Rewrite the log with only the most recent checkpoints
+        keep = heapq.nlargest(keep_last, index.items(), key=lambda item: item[1].timestamp)
+        keep.reverse()
 
-        for checkpoint in to_delete:
-            checkpoint_file = self.storage_dir / f"{checkpoint.id}.json"
-            try:
-                checkpoint_file.unlink()
-                deleted_count += 1
-            except OSError:
-                continue
+        # (path, hash) pairs still in use, collected from the records as
+        # they are copied
+        referenced = {
+            (snapshot.path, snapshot.content_hash)
+            for snapshot in self._tracked_files.values()
+            if snapshot is not None
+        }
+
+        log_tmp = self._log_path.with_name(_LOG_FILE + ".tmp")
+        index_tmp = self._index_path.with_name(_INDEX_FILE + ".tmp")
+        with (
+            open(self._log_path, "rb") as src,
+            open(log_tmp, "wb") as log,
+            open(index_tmp, "wb") as new_index,
+        ):
+            for checkpoint_id, entry in keep:
+                src.seek(entry.offset)
+                record = src.read(entry.length)
+                moved = _IndexEntry(log.tell(), len(record), entry.timestamp, entry.turn)
+                log.write(record)
+                log.write(b"\n")
+                new_index.write(_index_line(checkpoint_id, moved))
+                referenced.update(_snapshot_refs(record))
+            _fsync(log)
+            _fsync(new_index)
+
+        os.replace(log_tmp, self._log_path)
+        os.replace(index_tmp, self._index_path)
+        _fsync_dir(self.storage_dir)
+
+        self._remove_unreferenced_objects(referenced)
+
+        return len(index) - len(keep)
+
+    def read_snapshot(self, snapshot: FileSnapshot) -> bytes:
+        """Read the content of a file snapshot
 
-        return deleted_count
+        Args:
+            snapshot: Snapshot from a checkpoint
+
+        Returns:
+            File content as it was when tracked
+
+        Raises:
+            OSError: If the content object is missing
+        """
+        return (self._objects_dir / snapshot.content_hash).read_bytes()
 
     def clear_tracked(self) -> None:
         """Clear currently tracked files without creating checkpoint"""
@@ -242,26 +352,210 @@ class FileCheckpointManager(CheckpointManager):
         return list(self._tracked_files.keys())
 
     def _save_checkpoint(self, checkpoint: FileCheckpoint) -> None:
-        """Save checkpoint to file"""
-        checkpoint_file = self.storage_dir / f"{checkpoint.id}.json"
-        data = checkpoint.model_dump(mode="json")
-        checkpoint_file.write_text(
-            json.dumps(data, indent=2, default=str),
-            encoding="utf-8",
-        )
+        """Append checkpoint to the log, then record it in the index"""
+        record = checkpoint.model_dump_json().encode("utf-8")
+
+        with open(self._log_path, "ab") as log:
+            offset = log.seek(0, os.SEEK_END)
+            log.write(record)
+            log.write(b"\n")
+            _fsync(log)
+
+        # Written after the record is durable, so the index never points at
+        # a torn write, even after a crash
+        entry = _IndexEntry(offset, len(record), checkpoint.timestamp, checkpoint.turn)
+        with open(self._index_path, "ab") as index:
+            index.write(_index_line(checkpoint.id, entry))
+            _fsync(index)
 
     def _load_checkpoint(self, checkpoint_id: str) -> FileCheckpoint | None:
         """Load checkpoint by ID"""
-        checkpoint_file = self.storage_dir / f"{checkpoint_id}.json"
-        return self._load_checkpoint_from_file(checkpoint_file)
+        entry = self._refresh_index().get(checkpoint_id)
+        if entry is None:
+            return None
 
-    def _load_checkpoint_from_file(self, file_path: Path) -> FileCheckpoint | None:
-        """Load checkpoint from file"""
-        if not file_path.exists():
+        try:
+            with open(self._log_path, "rb") as log:
+                return self._read_record(log, entry)
+        except OSError:
             return None
 
+    def _read_record(self, log: BinaryIO, entry: _IndexEntry) -> FileCheckpoint | None:
+        """Read and parse one checkpoint record from the log"""
         try:
-            data = json.loads(file_path.read_text(encoding="utf-8"))
-            return FileCheckpoint.model_validate(data)
-        except (json.JSONDecodeError, ValueError):
+            log.seek(entry.offset)
+            return FileCheckpoint.model_validate_json(log.read(entry.length))
+        except (OSError, ValueError):
             return None
+
+    def _store_object(self, content: bytes) -> str:
+        """Store content in the object store unless already present
+
+        Returns:
+            SHA-256 hex digest naming the object
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self._objects_dir / digest
+        if not object_path.exists():
+            # Write under a temporary name so a torn write never looks complete
+            tmp_path = object_path.with_name(f".{digest}.{uuid.uuid4().hex}.tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(content)
+                    _fsync(f)
+                os.replace(tmp_path, object_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+        return digest
+
+    def _remove_unreferenced_objects(self, referenced: set[tuple[str, str]]) -> None:
+        """Delete objects and track cache entries not in ``referenced``
+
+        Args:
+            referenced: (path, content hash) pairs of the remaining snapshots
+        """
+        hashes = {content_hash for _, content_hash in referenced}
+        with os.scandir(self._objects_dir) as entries:
+            for entry in entries:
+                if entry.name not in hashes:
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        continue
+
+        # Keep a path's entry only while a snapshot of that path still
+        # uses the cached content
+        self._track_cache = {
+            path: cached
+            for path, cached in self._track_cache.items()
+            if (path, cached[2]) in referenced
+        }
+        self._save_track_cache()
+
+    def _load_track_cache(self) -> dict[str, tuple[int, int, str]]:
+        """Load the persisted track_file cache"""
+        try:
+            data = json.loads(self._track_cache_path.read_bytes())
+            return {
+                path: (mtime_ns, size, digest)
+                for path, (mtime_ns, size, digest) in data.items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+
+    def _save_track_cache(self) -> None:
+        """Persist the track_file cache for later sessions"""
+        tmp_path = self._track_cache_path.with_name(f"{_TRACK_CACHE_FILE}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(self._track_cache, separators=(",", ":")))
+            os.replace(tmp_path, self._track_cache_path)
+        except OSError:
+            # The cache is an optimization; losing it only costs re-reads
+            tmp_path.unlink(missing_ok=True)
+
+    def _refresh_index(self) -> dict[str, _IndexEntry]:
+        """Bring the cached index up to date with the index file
+
+        Only lines appended since the last call are parsed. A replaced
+        (compacted) or truncated index file is reloaded from the start.
+        """
+        try:
+            st = os.stat(self._index_path)
+        except FileNotFoundError:
+            self._index = {}
+            self._index_inode = None
+            self._index_pos = 0
+            return self._index
+
+        if st.st_ino != self._index_inode or st.st_size < self._index_pos:
+            self._index = {}
+            self._index_inode = st.st_ino
+            self._index_pos = 0
+
+        if st.st_size > self._index_pos:
+            with open(self._index_path, "rb") as f:
+                f.seek(self._index_pos)
+                data = f.read()
+            # Leave a partially written last line for the next refresh
+            end = data.rfind(b"\n") + 1
+            for line in data[:end].splitlines():
+                try:
+                    item = json.loads(line)
+                    self._index[item["id"]] = _IndexEntry(
+                        offset=item["offset"],
+                        length=item["length"],
+                        timestamp=datetime.fromisoformat(item["timestamp"]),
+                        turn=item["turn"],
+                    )
+                except (ValueError, KeyError, TypeError):
+                    # Skip corrupt index lines
+                    continue
+            self._index_pos += end
+
+        return self._index
+
+    def _migrate_legacy_files(self) -> None:
+        """Move checkpoints from the old one-JSON-file-per-checkpoint layout into the log"""
+        legacy: list[tuple[FileCheckpoint, Path]] = []
+        for checkpoint_file in self.storage_dir.glob("*.json"):
+            if checkpoint_file.name.startswith("."):
+                # Not a checkpoint (e.g. the track_file cache)
+                continue
+            try:
+                data = json.loads(checkpoint_file.read_bytes())
+                # Old snapshots carried their content inline
+                for snapshot in data["snapshots"]:
+                    content = snapshot.pop("content").encode("utf-8")
+                    snapshot["content_hash"] = self._store_object(content)
+                    snapshot["size"] = len(content)
+                checkpoint = FileCheckpoint.model_validate(data)
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                # Skip invalid files
+                continue
+            legacy.append((checkpoint, checkpoint_file))
+
+        legacy.sort(key=lambda item: item[0].timestamp)
+        for checkpoint, checkpoint_file in legacy:
+            self._save_checkpoint(checkpoint)
+            checkpoint_file.unlink()
+
+
+def _fsync(f: BinaryIO) -> None:
+    """Flush a file object through to stable storage"""
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def _fsync_dir(path: Path) -> None:
+    """Persist renames in a directory (POSIX only; a no-op elsewhere)"""
+    if os.name != "posix":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _snapshot_refs(record: bytes) -> list[tuple[str, str]]:
+    """(path, content hash) pairs referenced by a raw checkpoint record"""
+    try:
+        return [
+            (snapshot["path"], snapshot["content_hash"])
+            for snapshot in json.loads(record)["snapshots"]
+        ]
+    except (ValueError, KeyError, TypeError):
+        return []
+
+
+def _index_line(checkpoint_id: str, entry: _IndexEntry) -> bytes:
+    """Serialize one index record"""
+    item = {
+        "id": checkpoint_id,
+        "offset": entry.offset,
+        "length": entry.length,
+        "timestamp": entry.timestamp.isoformat(),
+        "turn": entry.turn,
+    }
+    return json.dumps(item, separators=(",", ":")).encode("utf-8") + b"\n"
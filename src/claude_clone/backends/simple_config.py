@@ -4,12 +4,14 @@ Loads configuration from environment variables and TOML files.
 Priority (highest first): env > project > user > defaults
 """
 
+import json
+import math
 import os
+import re
 import tomllib
+from datetime import date, datetime, time
 from pathlib import Path
-from typing import Any
-
-from dotenv import load_dotenv
+from typing import Any, ClassVar
 
 from claude_clone.interfaces import Config, ConfigLoader
 
@@ -51,6 +53,9 @@ class SimpleConfigLoader(ConfigLoader):
         "CLAUDE_CLONE_MODEL": "model",
     }
 
+    # .env files already loaded into os.environ by any instance
+    _loaded_env_files: ClassVar[set[Path]] = set()
+
     # Fallback environment variables
     API_KEY_FALLBACKS: list[str] = [
         "GOOGLE_API_KEY",  # Gemini
@@ -66,11 +71,16 @@ class SimpleConfigLoader(ConfigLoader):
         """
         self._project_root = project_root or Path.cwd()
         self._config: Config | None = None
+        # Source state the cached config was built from (see _source_key_now)
+        self._source_key: tuple[Any, ...] | None = None
 
-        # Load .env file if exists
+        # Load .env file if exists (python-dotenv is only imported then)
         env_file = self._project_root / ".env"
-        if env_file.exists():
+        if env_file not in self._loaded_env_files and env_file.exists():
+            from dotenv import load_dotenv
+
             load_dotenv(env_file)
+            self._loaded_env_files.add(env_file)
 
     @property
     def user_config_path(self) -> Path:
@@ -85,12 +95,21 @@ class SimpleConfigLoader(ConfigLoader):
     def load(self) -> Config:
         """Load configuration from all sources
 
+        Returns the previous result without re-reading anything when
+        neither config file nor any relevant environment variable changed.
+
         Returns:
             Merged configuration object
 
         Raises:
             ConfigurationError: When API key is missing
         """
+        env = self._read_env()
+        source_key = self._source_key_now(env)
+        if self._config is not None and source_key == self._source_key:
+            return self._config
+        self._source_key = None
+
         # Start with defaults
         config_dict: dict[str, Any] = {}
 
@@ -103,7 +122,7 @@ class SimpleConfigLoader(ConfigLoader):
         config_dict.update(project_config)
 
         # Load environment variables (highest priority)
-        env_config = self._load_env()
+        env_config = self._load_env(env)
         config_dict.update(env_config)
 
         # Create Config object (applies defaults for missing fields)
@@ -112,6 +131,7 @@ class SimpleConfigLoader(ConfigLoader):
         # Validate API key
         self._validate_api_key()
 
+        self._source_key = source_key
         return self._config
 
     def save_user_config(self, updates: dict[str, Any]) -> None:
@@ -191,36 +211,65 @@ class SimpleConfigLoader(ConfigLoader):
 
         Raises:
             PermissionError: When file write permission is denied
+            ConfigurationError: When a value can't be written as TOML
         """
         # Ensure directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        # The next load() must see the new file even within one mtime tick
+        self._source_key = None
+
         # Load existing config
         existing = self._load_toml(path)
 
         # Merge updates
         existing.update(updates)
 
-        # Write back
-        # Note: tomllib is read-only, we need to write manually
-        lines = []
-        for key, value in existing.items():
-            if isinstance(value, str):
-                lines.append(f'{key} = "{value}"')
-            elif isinstance(value, bool):
-                lines.append(f"{key} = {str(value).lower()}")
-            elif isinstance(value, (int, float)):
-                lines.append(f"{key} = {value}")
-            elif isinstance(value, list):
-                items = ", ".join(f'"{v}"' if isinstance(v, str) else str(v) for v in value)
-                lines.append(f"{key} = [{items}]")
-
+        # Write back (tomllib is read-only, so serialize here)
         with open(path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines) + "\n")
+            f.write(_dumps_toml(existing))
+
+    def _source_key_now(self, env: dict[str, str]) -> tuple[Any, ...]:
+        """Snapshot of everything load() reads: config file stats and env vars
+
+        Args:
+            env: Relevant environment variables, from _read_env()
+
+        Returns:
+            Tuple that compares equal as long as the sources are unchanged
+        """
+        stats: list[tuple[int, int] | None] = []
+        for path in (self.user_config_path, self.project_config_path):
+            try:
+                st = os.stat(path)
+                stats.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stats.append(None)
+
+        return (*stats, tuple(env.items()))
 
-    def _load_env(self) -> dict[str, Any]:
+    def _read_env(self) -> dict[str, str]:
+        """Read the environment variables the config depends on
+
+        Each variable is looked up once; copying all of os.environ would
+        cost far more than these few lookups.
+
+        Returns:
+            Set variables among ENV_MAPPING and API_KEY_FALLBACKS
+        """
+        env: dict[str, str] = {}
+        for env_var in (*self.ENV_MAPPING, *self.API_KEY_FALLBACKS):
+            value = os.environ.get(env_var)
+            if value is not None:
+                env[env_var] = value
+        return env
+
+    def _load_env(self, env: dict[str, str]) -> dict[str, Any]:
         """Load configuration from environment variables
 
+        Args:
+            env: Relevant environment variables, from _read_env()
+
         Returns:
             Dict of config values from environment
         """
@@ -228,16 +277,14 @@ class SimpleConfigLoader(ConfigLoader):
 
         # Load mapped environment variables
         for env_var, config_key in self.ENV_MAPPING.items():
-            value = os.environ.get(env_var)
-            if value is not None:
-                config[config_key] = value
+            if env_var in env:
+                config[config_key] = env[env_var]
 
         # Load API key fallbacks if not already set
         if "api_key" not in config:
             for fallback_var in self.API_KEY_FALLBACKS:
-                value = os.environ.get(fallback_var)
-                if value is not None:
-                    config["api_key"] = value
+                if fallback_var in env:
+                    config["api_key"] = env[fallback_var]
                     break
 
         return config
@@ -258,3 +305,91 @@ class SimpleConfigLoader(ConfigLoader):
                 "  4. Config file: ~/.claude-clone/config.toml\n"
                 "     api_key = \"your-key-here\"\n"
             )
+
+
+_BARE_KEY = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def _dumps_toml(data: dict[str, Any]) -> str:
+    """Serialize a dict as a TOML document
+
+    Nested dicts become [tables]; None values are omitted since TOML has
+    no null.
+
+    Args:
+        data: Document to serialize
+
+    Returns:
+        TOML text
+
+    Raises:
+        ConfigurationError: When a value has no TOML representation
+    """
+    lines: list[str] = []
+    _dump_table(data, (), lines)
+    return "\n".join(lines) + "\n"
+
+
+def _dump_table(table: dict[str, Any], prefix: tuple[str, ...], lines: list[str]) -> None:
+    """Append a table's key/value lines, then its sub-tables"""
+    subtables: list[tuple[str, dict[str, Any]]] = []
+    for key, value in table.items():
+        if value is None:
+            continue
+        if isinstance(value, dict):
+            subtables.append((key, value))
+        else:
+            lines.append(f"{_toml_key(key)} = {_toml_value(value)}")
+
+    for key, value in subtables:
+        path = (*prefix, key)
+        if lines:
+            lines.append("")
+        lines.append(f"[{'.'.join(map(_toml_key, path))}]")
+        _dump_table(value, path, lines)
+
+
+def _toml_key(key: str) -> str:
+    """Format a key, quoting it unless it is a valid bare key"""
+    return key if _BARE_KEY.fullmatch(key) else _toml_string(key)
+
+
+def _toml_string(value: str) -> str:
+    """Format a basic string
+
+    JSON string escapes are valid TOML except that DEL must be escaped too.
+    """
+    return json.dumps(value, ensure_ascii=False).replace("\x7f", "\\u007f")
+
+
+def _toml_value(value: Any) -> str:
+    """Format a value for the right-hand side of a key/value pair"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        return _toml_string(value)
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "nan"
+        if math.isinf(value):
+            return "inf" if value > 0 else "-inf"
+        return repr(value)
+    if isinstance(value, time) and value.tzinfo is not None:
+        # TOML local times have no offset
+        raise ConfigurationError("Cannot write a time with a timezone to TOML")
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        # Unlike a None table entry, which is just left out, a None item
+        # can't be dropped without shifting the others
+        if any(v is None for v in value):
+            raise ConfigurationError("Cannot write None in a TOML array")
+        return "[" + ", ".join(_toml_value(v) for v in value) + "]"
+    if isinstance(value, dict):
+        items = ", ".join(
+            f"{_toml_key(k)} = {_toml_value(v)}" for k, v in value.items() if v is not None
+        )
+        return "{ " + items + " }" if items else "{}"
+    raise ConfigurationError(f"Cannot write {type(value).__name__} value to TOML")
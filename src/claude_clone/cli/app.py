@@ -14,12 +14,13 @@ Usage:
     $ claude-clone --model gemini-2.0-flash
 """
 
+import sys
 from typing import Annotated, Optional
 
 import typer
 
-from claude_clone.backends import SimpleConfigLoader
-from claude_clone.repl import run_repl, run_single_turn
+# Config and REPL modules are imported inside main(), so --help and
+# argument errors don't pay for loading the backend stack
 
 # Create Typer app
 app = typer.Typer(
@@ -30,6 +31,23 @@ app = typer.Typer(
 )
 
 
+def _version() -> str:
+    """Return the installed package version"""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("claude-clone")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _print_version(value: bool) -> None:
+    """Print the version and exit (eager --version callback)"""
+    if value:
+        typer.echo(f"claude-clone {_version()}")
+        raise typer.Exit()
+
+
 @app.command()
 def main(
     prompt: Annotated[
@@ -54,6 +72,15 @@ def main(
             help="Resume previous session (not yet implemented)",
         ),
     ] = False,
+    version: Annotated[
+        bool,
+        typer.Option(
+            "--version",
+            help="Show the version and exit",
+            callback=_print_version,
+            is_eager=True,
+        ),
+    ] = False,
 ) -> None:
     """Claude Clone - AI Coding Assistant
 
@@ -64,6 +91,8 @@ def main(
         claude-clone "read main.py"      # One-shot mode
         claude-clone -m gemini-1.5-pro   # Use specific model
     """
+    from claude_clone.backends import SimpleConfigLoader
+
     # Load configuration
     config_loader = SimpleConfigLoader()
     config = config_loader.load()
@@ -79,6 +108,8 @@ def main(
     # Run in appropriate mode
     if prompt:
         # One-shot mode: execute single prompt and exit
+        from claude_clone.repl import run_single_turn
+
         try:
             response = run_single_turn(config, prompt)
             if response:
@@ -88,6 +119,8 @@ def main(
             raise typer.Exit(code=1)
     else:
         # Interactive mode: start REPL
+        from claude_clone.repl import run_repl
+
         try:
             run_repl(config)
         except KeyboardInterrupt:
@@ -102,4 +135,8 @@ def run() -> None:
 
     This function is called by the console script defined in pyproject.toml.
     """
+    # Answer --version without having Typer build the command
+    if sys.argv[1:] == ["--version"]:
+        typer.echo(f"claude-clone {_version()}")
+        sys.exit(0)
     app()
@@ -17,10 +17,23 @@ Usage:
 """
 
 import fnmatch
+import functools
+import os
 import re
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Literal
+
+
+# Tool names (display name and tool function name) by kind
+_READ_TOOLS = frozenset({"Read", "read_tool"})
+_EDIT_TOOLS = frozenset({"Edit", "edit_tool"})
+_WRITE_TOOLS = frozenset({"Write", "write_tool"})
+_BASH_TOOLS = frozenset({"Bash", "bash_tool"})
+_GREP_TOOLS = frozenset({"Grep", "grep_tool"})
+_GLOB_TOOLS = frozenset({"Glob", "glob_tool"})
+_FILE_TOOLS = _READ_TOOLS | _EDIT_TOOLS | _WRITE_TOOLS
 
 
 class PermissionMode(str, Enum):
@@ -40,7 +53,7 @@ class PermissionResult(str, Enum):
     ASK = "ask"  # Ask user for permission
 
 
-@dataclass
+@dataclass(frozen=True)
 class PermissionRule:
     """Parsed permission rule
 
@@ -50,10 +63,56 @@ class PermissionRule:
         - "Bash(npm run:*)" - matches Bash with command starting with "npm run"
         - "Edit(src/**/*.py)" - matches Edit for Python files in src/
         - "Read(.env*)" - matches Read for .env files
+
+    The pattern is analyzed once, when the rule is created, so matching
+    is a prefix test or a single precompiled regex match. Rules are
+    immutable, and parse() returns a shared instance for a repeated rule
+    string.
     """
 
     tool_name: str
     pattern: str | None = None
+    _kind: Literal["all", "prefix", "glob", "regex"] = field(
+        init=False, repr=False, compare=False
+    )
+    _prefix: str = field(default="", init=False, repr=False, compare=False)
+    _regex: re.Pattern[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _match_keys: tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompile the pattern
+
+        Supports:
+        - Glob patterns: *.py, src/**/*.ts
+        - Prefix patterns: npm run:* -> matches "npm run test"
+        - Exact match
+        """
+        kind: Literal["all", "prefix", "glob", "regex"]
+        prefix = ""
+        regex = None
+        pattern = self.pattern
+        if pattern is None:
+            kind = "all"
+        elif ":*" in pattern:
+            # Prefix pattern with colon (e.g., "npm run:*")
+            kind = "prefix"
+            prefix = pattern.replace(":*", "")
+        elif "**" in pattern:
+            # ** glob pattern (recursive directory matching)
+            kind = "regex"
+            regex = _glob_to_regex(pattern)
+        else:
+            # Simple glob pattern, matched like fnmatch.fnmatch
+            kind = "glob"
+            regex = re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+        # Frozen dataclass: set the derived fields directly
+        object.__setattr__(self, "_kind", kind)
+        object.__setattr__(self, "_prefix", prefix)
+        object.__setattr__(self, "_regex", regex)
+        object.__setattr__(self, "_match_keys", _match_keys_for(self.tool_name))
 
     @classmethod
     def parse(cls, rule: str) -> "PermissionRule":
@@ -65,15 +124,7 @@ class PermissionRule:
         Returns:
             Parsed PermissionRule
         """
-        # Match "ToolName(pattern)" or "ToolName"
-        match = re.match(r"^(\w+)(?:\((.+)\))?$", rule.strip())
-        if not match:
-            return cls(tool_name=rule.strip(), pattern=None)
-
-        tool_name = match.group(1)
-        pattern = match.group(2)  # May be None
-
-        return cls(tool_name=tool_name, pattern=pattern)
+        return _parse_rule(cls, rule)
 
     def matches(self, tool_name: str, args: dict[str, Any]) -> bool:
         """Check if this rule matches a tool invocation
@@ -88,9 +139,21 @@ class PermissionRule:
         # Tool name must match
         if self.tool_name != tool_name:
             return False
+        return self.matches_args_only(tool_name, args)
+
+    def matches_args_only(self, tool_name: str, args: dict[str, Any]) -> bool:
+        """Check the pattern against a tool invocation, assuming the tool name matches
 
+        Args:
+            tool_name: Name of the tool being invoked
+            args: Tool arguments
+
+        Returns:
+            True if the pattern matches
+        """
         # If no pattern, match all invocations of this tool
-        if self.pattern is None:
+        kind = self._kind
+        if kind == "all":
             return True
 
         # Get the relevant argument to match against
@@ -99,69 +162,157 @@ class PermissionRule:
             return False
 
         # Match pattern against value
-        return self._pattern_matches(self.pattern, match_value)
+        if kind == "prefix":
+            return match_value.startswith(self._prefix)
+        assert self._regex is not None
+        if kind == "glob":
+            match_value = os.path.normcase(match_value)
+        return self._regex.match(match_value) is not None
 
     def _get_match_value(self, tool_name: str, args: dict[str, Any]) -> str | None:
-        """Get the value to match pattern against based on tool type"""
-        # For file-related tools, match against file_path
-        if tool_name in ("Read", "Edit", "Write", "read_tool", "edit_tool", "write_tool"):
-            return args.get("file_path")
+        """Get the value to match pattern against based on tool type
 
-        # For Bash, match against command
-        if tool_name in ("Bash", "bash_tool"):
-            return args.get("command")
+        Returns the first truthy argument among the rule's match keys, or
+        the last one's value.
+        """
+        value = None
+        for key in self._match_keys:
+            value = args.get(key)
+            if value:
+                return value
+        return value
 
-        # For Grep, match against pattern or path
-        if tool_name in ("Grep", "grep_tool"):
-            return args.get("path") or args.get("pattern")
 
-        # For Glob, match against pattern or path
-        if tool_name in ("Glob", "glob_tool"):
-            return args.get("path") or args.get("pattern")
+@functools.lru_cache(maxsize=512)
+def _parse_rule(cls: type[PermissionRule], rule: str) -> PermissionRule:
+    """Parse a rule string (memoized; rules are immutable)"""
+    # Match "ToolName(pattern)" or "ToolName"
+    match = re.match(r"^(\w+)(?:\((.+)\))?$", rule.strip())
+    if not match:
+        return cls(tool_name=rule.strip(), pattern=None)
 
-        # Default: try common argument names
-        return args.get("file_path") or args.get("path") or args.get("command")
+    tool_name = match.group(1)
+    pattern = match.group(2)  # May be None
 
-    def _pattern_matches(self, pattern: str, value: str) -> bool:
-        """Check if pattern matches value
+    return cls(tool_name=tool_name, pattern=pattern)
+
+
+def _match_keys_for(tool_name: str) -> tuple[str, ...]:
+    """Get the argument names a rule for this tool matches against, in priority order"""
+    # For file-related tools, match against file_path
+    if tool_name in _FILE_TOOLS:
+        return ("file_path",)
+
+    # For Bash, match against command
+    if tool_name in _BASH_TOOLS:
+        return ("command",)
+
+    # For Grep and Glob, match against path or pattern
+    if tool_name in _GREP_TOOLS or tool_name in _GLOB_TOOLS:
+        return ("path", "pattern")
+
+    # Default: try common argument names
+    return ("file_path", "path", "command")
 
-        Supports:
-        - Glob patterns: *.py, src/**/*.ts
-        - Prefix patterns: npm run:* -> matches "npm run test"
-        - Exact match
-        """
-        # Handle prefix pattern with colon (e.g., "npm run:*")
-        if ":*" in pattern:
-            prefix = pattern.replace(":*", "")
-            return value.startswith(prefix)
-
-        # Handle ** glob pattern (recursive directory matching)
-        if "**" in pattern:
-            # Convert ** glob pattern to regex
-            # ** matches zero or more path segments including /
-            # Use placeholders to avoid conflicts during replacement
-            DOUBLE_STAR_SLASH = "\x00DS\x00"
-            DOUBLE_STAR = "\x01DS\x01"
-            SINGLE_STAR = "\x02SS\x02"
-
-            regex_pattern = pattern
-            # Replace **/ first (zero or more directories)
-            regex_pattern = regex_pattern.replace("**/", DOUBLE_STAR_SLASH)
-            # Replace remaining ** (matches anything)
-            regex_pattern = regex_pattern.replace("**", DOUBLE_STAR)
-            # Replace single *
-            regex_pattern = regex_pattern.replace("*", SINGLE_STAR)
-            # Escape dots
-            regex_pattern = regex_pattern.replace(".", r"\.")
-            # Now replace placeholders with actual regex
-            regex_pattern = regex_pattern.replace(DOUBLE_STAR_SLASH, "(?:.*/)?")
-            regex_pattern = regex_pattern.replace(DOUBLE_STAR, ".*")
-            regex_pattern = regex_pattern.replace(SINGLE_STAR, "[^/]*")
-            regex_pattern = f"^{regex_pattern}$"
-            return bool(re.match(regex_pattern, value))
-
-        # Use fnmatch for simple glob patterns
-        return fnmatch.fnmatch(value, pattern)
+
+def _class_end(pattern: str, start: int) -> int:
+    """Find the ] closing the character class opened at start, or -1
+
+    Like fnmatch, a ] right after [ or [! is part of the class.
+    """
+    i = start + 1
+    if pattern.startswith("!", i):
+        i += 1
+    return pattern.find("]", i + 1)
+
+
+def _glob_to_regex(pattern: str) -> re.Pattern[str]:
+    """Compile a glob pattern containing ** to a regex, in a single pass
+
+    ** matches zero or more path segments including /, * and ? stay
+    within one segment, [...] is a character class, anything else is
+    literal.
+    """
+    buf: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        ch = pattern[i]
+        if pattern.startswith("**/", i):
+            # Zero or more directories
+            buf.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            # Anything, including /
+            buf.append(".*")
+            i += 2
+        elif ch == "*":
+            buf.append("[^/]*")
+            i += 1
+        elif ch == "?":
+            buf.append("[^/]")
+            i += 1
+        elif ch == "[" and (end := _class_end(pattern, i)) != -1:
+            body = pattern[i + 1 : end].replace("\\", "\\\\")
+            if body[0] == "!":
+                body = "^" + body[1:]
+            elif body[0] == "^":
+                body = "\\" + body
+            buf.append(f"[{body}]")
+            i = end + 1
+        else:
+            buf.append(re.escape(ch))
+            i += 1
+    return re.compile(f"^{''.join(buf)}$")
+
+
+def _index_by_tool(rules: list[str] | None) -> dict[str, tuple[PermissionRule, ...]]:
+    """Parse rule strings and group them by tool name"""
+    by_tool: dict[str, list[PermissionRule]] = {}
+    for r in rules or []:
+        rule = PermissionRule.parse(r)
+        by_tool.setdefault(rule.tool_name, []).append(rule)
+    return {tool_name: tuple(bucket) for tool_name, bucket in by_tool.items()}
+
+
+# Bucket for tools without rules (shared, never allocated per check)
+_NO_RULES: tuple[PermissionRule, ...] = ()
+
+
+
+def _edit_prompt(args: dict[str, Any]) -> str:
+    """Prompt for editing a file"""
+    file_path = args.get("file_path", "unknown")
+    return f"Allow editing {file_path}?"
+
+
+def _write_prompt(args: dict[str, Any]) -> str:
+    """Prompt for writing a file"""
+    file_path = args.get("file_path", "unknown")
+    return f"Allow writing to {file_path}?"
+
+
+def _bash_prompt(args: dict[str, Any]) -> str:
+    """Prompt for running a command"""
+    command = args.get("command", "unknown")
+    # Truncate long commands
+    if len(command) > 50:
+        command = command[:47] + "..."
+    return f"Allow running: {command}?"
+
+
+def _read_prompt(args: dict[str, Any]) -> str:
+    """Prompt for reading a file"""
+    file_path = args.get("file_path", "unknown")
+    return f"Allow reading {file_path}?"
+
+
+# Permission prompt formatter by tool name
+_PROMPT_FORMATTERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    **dict.fromkeys(_EDIT_TOOLS, _edit_prompt),
+    **dict.fromkeys(_WRITE_TOOLS, _write_prompt),
+    **dict.fromkeys(_BASH_TOOLS, _bash_prompt),
+    **dict.fromkeys(_READ_TOOLS, _read_prompt),
+}
 
 
 class PermissionManager:
@@ -174,13 +325,16 @@ class PermissionManager:
     """
 
     # Tools considered safe (read-only)
-    SAFE_TOOLS = {"Read", "read_tool", "Glob", "glob_tool", "Grep", "grep_tool"}
+    SAFE_TOOLS = _READ_TOOLS | _GLOB_TOOLS | _GREP_TOOLS
 
     # Tools that modify files
-    WRITE_TOOLS = {"Edit", "edit_tool", "Write", "write_tool"}
+    WRITE_TOOLS = _EDIT_TOOLS | _WRITE_TOOLS
 
     # Tools that execute commands
-    EXEC_TOOLS = {"Bash", "bash_tool"}
+    EXEC_TOOLS = _BASH_TOOLS
+
+    # Maximum number of cached check() results
+    RESULT_CACHE_SIZE = 1024
 
     def __init__(
         self,
@@ -195,6 +349,9 @@ class PermissionManager:
             allow_rules: List of allow rule strings
             deny_rules: List of deny rule strings
         """
+        # LRU of check() results, keyed on the arguments rules look at
+        self._result_cache: OrderedDict[tuple[Any, ...], PermissionResult] = OrderedDict()
+
         if isinstance(mode, str):
             try:
                 self.mode = PermissionMode(mode)
@@ -203,12 +360,24 @@ class PermissionManager:
         else:
             self.mode = mode
 
-        self._allow_rules = [
-            PermissionRule.parse(r) for r in (allow_rules or [])
-        ]
-        self._deny_rules = [
-            PermissionRule.parse(r) for r in (deny_rules or [])
-        ]
+        # Rules bucketed by tool name, in their original order
+        self._allow_by_tool = _index_by_tool(allow_rules)
+        self._deny_by_tool = _index_by_tool(deny_rules)
+        self._bump_version()
+
+    @property
+    def mode(self) -> PermissionMode:
+        """Permission mode"""
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode: PermissionMode) -> None:
+        self._mode = mode
+        self._bump_version()
+
+    def _bump_version(self) -> None:
+        """Invalidate cached results after the mode or rules change"""
+        self._result_cache.clear()
 
     def check(self, tool_name: str, args: dict[str, Any] | None = None) -> PermissionResult:
         """Check if tool execution is permitted
@@ -222,18 +391,48 @@ class PermissionManager:
         """
         args = args or {}
 
+        # Only the arguments _get_match_value consults affect the result
+        key = (
+            tool_name,
+            args.get("file_path"),
+            args.get("command"),
+            args.get("path"),
+            args.get("pattern"),
+        )
+        cache = self._result_cache
+        try:
+            result = cache.get(key)
+        except TypeError:  # Unhashable argument value
+            return self._evaluate(tool_name, args)
+        if result is not None:
+            cache.move_to_end(key)
+            return result
+
+        result = self._evaluate(tool_name, args)
+        cache[key] = result
+        if len(cache) > self.RESULT_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        return result
+
+    def _evaluate(self, tool_name: str, args: dict[str, Any]) -> PermissionResult:
+        """Evaluate rules and mode for a tool invocation (uncached)"""
         # 1. Check deny rules first (deny always wins)
-        for rule in self._deny_rules:
-            if rule.matches(tool_name, args):
+        for rule in self._deny_by_tool.get(tool_name, _NO_RULES):
+            if rule.matches_args_only(tool_name, args):
                 return PermissionResult.DENY
 
-        # 2. Check allow rules
-        for rule in self._allow_rules:
-            if rule.matches(tool_name, args):
-                return PermissionResult.ALLOW
+        # 2. Apply mode-based defaults. Allow rules can only turn ASK into
+        # ALLOW, so they are skipped when the mode already allows the tool
+        # (always, in bypass mode).
+        result = self._check_by_mode(tool_name)
+        if result is PermissionResult.ALLOW:
+            return result
 
-        # 3. Apply mode-based defaults
-        return self._check_by_mode(tool_name)
+        # 3. Check allow rules
+        for rule in self._allow_by_tool.get(tool_name, _NO_RULES):
+            if rule.matches_args_only(tool_name, args):
+                return PermissionResult.ALLOW
+        return result
 
     def _check_by_mode(self, tool_name: str) -> PermissionResult:
         """Apply mode-based permission defaults"""
@@ -284,28 +483,10 @@ class PermissionManager:
         Returns:
             Formatted prompt string
         """
-        args = args or {}
-
-        if tool_name in ("Edit", "edit_tool"):
-            file_path = args.get("file_path", "unknown")
-            return f"Allow editing {file_path}?"
-
-        if tool_name in ("Write", "write_tool"):
-            file_path = args.get("file_path", "unknown")
-            return f"Allow writing to {file_path}?"
-
-        if tool_name in ("Bash", "bash_tool"):
-            command = args.get("command", "unknown")
-            # Truncate long commands
-            if len(command) > 50:
-                command = command[:47] + "..."
-            return f"Allow running: {command}?"
-
-        if tool_name in ("Read", "read_tool"):
-            file_path = args.get("file_path", "unknown")
-            return f"Allow reading {file_path}?"
-
-        return f"Allow {tool_name}?"
+        formatter = _PROMPT_FORMATTERS.get(tool_name)
+        if formatter is None:
+            return f"Allow {tool_name}?"
+        return formatter(args or {})
 
 
 def create_permission_manager_from_config(
@@ -13,6 +13,7 @@ from claude_clone.domain.exceptions import (
     InvalidStateError,
     NotFoundError,
     AlreadyExistsError,
+    IdempotencyConflictError,
 )
 
 __all__ = [
@@ -31,4 +32,5 @@ __all__ = [
     "InvalidStateError",
     "NotFoundError",
     "AlreadyExistsError",
+    "IdempotencyConflictError",
 ]
@@ -0,0 +1,12 @@
+"""Clock helper for domain timestamps."""
+
+from datetime import datetime, timezone
+
+
+def utc_now() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime.
+
+    Replaces the deprecated ``datetime.utcnow()``, which returns naive
+    datetimes.
+    """
+    return datetime.now(timezone.utc)
@@ -1,11 +1,13 @@
 """Approval entity - Represents a pending approval request."""
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
+from secrets import token_hex
 from typing import Optional
-import uuid
+import re
 
+from claude_clone.domain._time import utc_now
 from claude_clone.domain.exceptions import InvalidStateError
 
 
@@ -28,7 +30,26 @@ class ApprovalType(Enum):
     GIT_PUSH = "git_push"
 
 
-@dataclass
+# Substrings that raise an approval's risk score, in reporting order
+_DANGEROUS_PATTERNS = ("rm ", "sudo", "DROP", "DELETE", "--force", "-rf")
+_SENSITIVE_PATHS = (".env", "credentials", "secret", "password", ".git/")
+
+
+def _compile_scanner(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile substrings into one regex matching wherever any of them starts."""
+    return re.compile("(?=(" + "|".join(map(re.escape, patterns)) + "))")
+
+
+_DANGER_RE = _compile_scanner(_DANGEROUS_PATTERNS)
+_SENSITIVE_RE = _compile_scanner(_SENSITIVE_PATHS)
+
+
+def _scan(scanner: re.Pattern[str], text: str) -> set[str]:
+    """Return the patterns found in text, in a single pass."""
+    return {match.group(1) for match in scanner.finditer(text)}
+
+
+@dataclass(slots=True)
 class Approval:
     """An Approval represents a request for user confirmation.
 
@@ -49,7 +70,7 @@ class Approval:
     requester_task_id: Optional[str] = None
     risk_score: int = 1  # 1-5, higher = more risky
     risk_reason: str = ""
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=utc_now)
     expires_at: Optional[datetime] = None
     resolved_at: Optional[datetime] = None
     resolved_by: Optional[str] = None  # "user" or "auto"
@@ -70,7 +91,7 @@ class Approval:
                 f"Cannot expire approval in {self.status.value} status"
             )
         self.status = ApprovalStatus.EXPIRED
-        self.resolved_at = datetime.utcnow()
+        self.resolved_at = utc_now()
 
     def _resolve(
         self, new_status: ApprovalStatus, resolved_by: str, comment: str
@@ -84,7 +105,7 @@ class Approval:
             raise InvalidStateError("Cannot resolve expired approval")
 
         self.status = new_status
-        self.resolved_at = datetime.utcnow()
+        self.resolved_at = utc_now()
         self.resolved_by = resolved_by
         self.comment = comment
 
@@ -103,8 +124,13 @@ class Approval:
         """Check if approval has expired."""
         if self.status == ApprovalStatus.EXPIRED:
             return True
-        if self.expires_at and datetime.utcnow() > self.expires_at:
-            return True
+        expires_at = self.expires_at
+        if expires_at:
+            if expires_at.tzinfo is None:
+                # Naive datetimes are UTC (as datetime.utcnow() returned)
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            if utc_now() > expires_at:
+                return True
         return False
 
     @property
@@ -129,16 +155,16 @@ class Approval:
         reasons = []
 
         # Adjust for dangerous patterns
-        dangerous_patterns = ["rm ", "sudo", "DROP", "DELETE", "--force", "-rf"]
-        for pattern in dangerous_patterns:
-            if pattern in self.target:
+        found = _scan(_DANGER_RE, self.target)
+        for pattern in _DANGEROUS_PATTERNS:
+            if pattern in found:
                 score = min(5, score + 1)
                 reasons.append(f"contains '{pattern}'")
 
         # Adjust for sensitive paths
-        sensitive_paths = [".env", "credentials", "secret", "password", ".git/"]
-        for path in sensitive_paths:
-            if path in self.target.lower():
+        found = _scan(_SENSITIVE_RE, self.target.lower())
+        for path in _SENSITIVE_PATHS:
+            if path in found:
                 score = min(5, score + 1)
                 reasons.append(f"touches sensitive path '{path}'")
 
@@ -159,7 +185,7 @@ class Approval:
     ) -> "Approval":
         """Factory method to create a new Approval."""
         approval = cls(
-            id=f"apr-{uuid.uuid4().hex[:8]}",
+            id=f"apr-{token_hex(4)}",
             run_id=run_id,
             type=approval_type,
             target=target,
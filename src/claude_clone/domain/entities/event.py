@@ -1,10 +1,14 @@
 """Event entity - Represents an immutable event in the timeline."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, Optional
 
+from claude_clone.domain._time import utc_now
+
 
 class EventType(Enum):
     """Types of events that can occur."""
@@ -61,34 +65,51 @@ class EventType(Enum):
     ERROR = "error"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class Event:
     """An immutable event in the agent timeline.
 
     Events are append-only and never modified after creation.
     They form the complete audit trail of what happened.
+
+    Identity is the event ID: equality and hashing use ``id`` only,
+    without comparing payloads. Unpersisted events (ID 0) are only
+    equal to themselves.
     """
 
     id: int  # Auto-incremented
     run_id: str
     type: EventType
     timestamp: datetime
-    data: dict[str, Any] = field(default_factory=dict)
+    # Read-only view of the payload (shared empty mapping when there is none)
+    data: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_DATA)
+    # Client-supplied key identifying a logical operation, so a retried
+    # request doesn't append a second event
+    idempotency_key: Optional[str] = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Event):
+            return NotImplemented
+        return self.id == other.id and (self.id != 0 or self is other)
+
+    def __hash__(self) -> int:
+        return hash(self.id)
 
     def to_summary(self) -> str:
         """Generate a 1-line summary for ThinState.recent_events_digest."""
         # Format: "type target" or "type key=value"
-        type_str = self.type.value.replace(".", " ")
-
-        if "path" in self.data:
-            return f"{type_str} {self.data['path']}"
-        elif "target" in self.data:
-            return f"{type_str} {self.data['target']}"
-        elif "message" in self.data:
-            msg = self.data["message"][:50]
+        type_str = _TYPE_STR[self.type._value_]
+        data = self.data
+
+        if "path" in data:
+            return f"{type_str} {data['path']}"
+        elif "target" in data:
+            return f"{type_str} {data['target']}"
+        elif "message" in data:
+            msg = data["message"][:50]
             return f"{type_str}: {msg}"
-        elif "tool" in self.data:
-            return f"{type_str} {self.data['tool']}"
+        elif "tool" in data:
+            return f"{type_str} {data['tool']}"
         else:
             return type_str
 
@@ -99,14 +120,21 @@ class Event:
         run_id: str,
         event_type: EventType,
         data: Optional[dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
     ) -> "Event":
-        """Factory method to create a new Event."""
+        """Factory method to create a new Event.
+
+        ``data`` is exposed as a read-only view, not copied. Pass
+        ``timestamp`` to share one clock reading across a batch.
+        """
         return cls(
             id=event_id,
             run_id=run_id,
             type=event_type,
-            timestamp=datetime.utcnow(),
-            data=data or {},
+            timestamp=timestamp or utc_now(),
+            data=MappingProxyType(data) if data else _EMPTY_DATA,
+            idempotency_key=idempotency_key,
         )
 
     # Convenience factory methods for common events
@@ -145,3 +173,11 @@ class Event:
             EventType.APPROVAL_REQUESTED,
             {"approval_id": approval_id, "target": target},
         )
+
+
+# Payload of events created without data
+_EMPTY_DATA: Mapping[str, Any] = MappingProxyType({})
+
+# Summary prefix per event type ("tool.called" -> "tool called"), keyed by
+# the raw value: Enum.__hash__ is implemented in Python, str hashes are cached
+_TYPE_STR: dict[str, str] = {t._value_: t.value.replace(".", " ") for t in EventType}
@@ -1,11 +1,14 @@
 """Run entity - Represents a single agent execution session."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from secrets import token_hex
+from types import MappingProxyType
 from typing import Optional
-import uuid
 
+from claude_clone.domain._time import utc_now
 from claude_clone.domain.exceptions import InvalidStateError
 
 
@@ -19,7 +22,21 @@ class RunStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# Valid state transitions (static, shared by all runs)
+_VALID_TRANSITIONS: Mapping[RunStatus, frozenset[RunStatus]] = MappingProxyType({
+    RunStatus.PENDING: frozenset({RunStatus.RUNNING, RunStatus.CANCELLED}),
+    RunStatus.RUNNING: frozenset({
+        RunStatus.COMPLETED,
+        RunStatus.FAILED,
+        RunStatus.CANCELLED,
+    }),
+    RunStatus.COMPLETED: frozenset(),
+    RunStatus.FAILED: frozenset(),
+    RunStatus.CANCELLED: frozenset(),
+})
+
+
+@dataclass(slots=True)
 class Run:
     """A Run represents a single agent execution session.
 
@@ -35,28 +52,12 @@ class Run:
     status: RunStatus = RunStatus.PENDING
     repo_root: str = "."
     branch: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
-
-    # Valid state transitions
-    _VALID_TRANSITIONS: dict[RunStatus, set[RunStatus]] = field(
-        default_factory=lambda: {
-            RunStatus.PENDING: {RunStatus.RUNNING, RunStatus.CANCELLED},
-            RunStatus.RUNNING: {
-                RunStatus.COMPLETED,
-                RunStatus.FAILED,
-                RunStatus.CANCELLED,
-            },
-            RunStatus.COMPLETED: set(),
-            RunStatus.FAILED: set(),
-            RunStatus.CANCELLED: set(),
-        },
-        repr=False,
-    )
+    created_at: datetime = field(default_factory=utc_now)
+    updated_at: datetime = field(default_factory=utc_now)
 
     def _can_transition_to(self, new_status: RunStatus) -> bool:
         """Check if transition to new_status is valid."""
-        return new_status in self._VALID_TRANSITIONS[self.status]
+        return new_status in _VALID_TRANSITIONS[self.status]
 
     def _transition_to(self, new_status: RunStatus) -> None:
         """Transition to new status if valid."""
@@ -65,7 +66,7 @@ class Run:
                 f"Cannot transition from {self.status.value} to {new_status.value}"
             )
         self.status = new_status
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utc_now()
 
     def start(self) -> None:
         """Start the run (PENDING -> RUNNING)."""
@@ -101,7 +102,7 @@ class Run:
     def create(cls, goal: str, repo_root: str = ".") -> "Run":
         """Factory method to create a new Run."""
         return cls(
-            id=f"run-{uuid.uuid4().hex[:8]}",
+            id=f"run-{token_hex(4)}",
             goal=goal,
             repo_root=repo_root,
         )
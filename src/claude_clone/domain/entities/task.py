@@ -1,11 +1,15 @@
 """Task entity - Represents a unit of work within a run."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from secrets import token_hex
+from types import MappingProxyType
 from typing import Optional
-import uuid
+import sys
 
+from claude_clone.domain._time import utc_now
 from claude_clone.domain.exceptions import InvalidStateError
 
 
@@ -19,7 +23,21 @@ class TaskStatus(Enum):
     BLOCKED = "blocked"  # Waiting for approval or dependency
 
 
-@dataclass
+# Valid transitions: (current status, action) -> new status
+_TRANSITIONS: Mapping[tuple[TaskStatus, str], TaskStatus] = MappingProxyType({
+    (TaskStatus.PENDING, "assign"): TaskStatus.IN_PROGRESS,
+    (TaskStatus.IN_PROGRESS, "block"): TaskStatus.BLOCKED,
+    (TaskStatus.BLOCKED, "unblock"): TaskStatus.IN_PROGRESS,
+    (TaskStatus.IN_PROGRESS, "complete"): TaskStatus.COMPLETED,
+    (TaskStatus.IN_PROGRESS, "fail"): TaskStatus.FAILED,
+})
+
+
+_ACTIVE_STATUSES = frozenset({TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.BLOCKED})
+_TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED})
+
+
+@dataclass(slots=True)
 class Task:
     """A Task represents a unit of work assigned to a worker.
 
@@ -41,74 +59,67 @@ class Task:
     input_refs: list[str] = field(default_factory=list)
     output_refs: list[str] = field(default_factory=list)
     error_message: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=utc_now)
+    updated_at: datetime = field(default_factory=utc_now)
+
+    def __post_init__(self) -> None:
+        # Many tasks share a run; interning keeps one copy of each ID and
+        # lets equality checks short-circuit on identity
+        self.id = sys.intern(self.id)
+        self.run_id = sys.intern(self.run_id)
+        if self.owner_worker_id is not None:
+            self.owner_worker_id = sys.intern(self.owner_worker_id)
+
+    def _transition(self, action: str) -> None:
+        """Apply an action's status change, if valid from the current status."""
+        try:
+            self.status = _TRANSITIONS[(self.status, action)]
+        except KeyError:
+            raise InvalidStateError(
+                f"Cannot {action} task in {self.status.value} status"
+            ) from None
 
     def assign(self, worker_id: str) -> None:
         """Assign task to a worker (PENDING -> IN_PROGRESS)."""
-        if self.status != TaskStatus.PENDING:
-            raise InvalidStateError(
-                f"Cannot assign task in {self.status.value} status"
-            )
-        self.owner_worker_id = worker_id
-        self.status = TaskStatus.IN_PROGRESS
-        self.updated_at = datetime.utcnow()
+        self._transition("assign")
+        self.owner_worker_id = sys.intern(worker_id)
+        self.updated_at = utc_now()
 
     def block(self, reason: str = "") -> None:
         """Block task (IN_PROGRESS -> BLOCKED)."""
-        if self.status != TaskStatus.IN_PROGRESS:
-            raise InvalidStateError(
-                f"Cannot block task in {self.status.value} status"
-            )
-        self.status = TaskStatus.BLOCKED
+        self._transition("block")
         if reason:
             self.error_message = reason
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utc_now()
 
     def unblock(self) -> None:
         """Unblock task (BLOCKED -> IN_PROGRESS)."""
-        if self.status != TaskStatus.BLOCKED:
-            raise InvalidStateError(
-                f"Cannot unblock task in {self.status.value} status"
-            )
-        self.status = TaskStatus.IN_PROGRESS
+        self._transition("unblock")
         self.error_message = None
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utc_now()
 
     def complete(self, output_refs: Optional[list[str]] = None) -> None:
         """Mark task as completed (IN_PROGRESS -> COMPLETED)."""
-        if self.status != TaskStatus.IN_PROGRESS:
-            raise InvalidStateError(
-                f"Cannot complete task in {self.status.value} status"
-            )
-        self.status = TaskStatus.COMPLETED
+        self._transition("complete")
         if output_refs:
             self.output_refs.extend(output_refs)
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utc_now()
 
     def fail(self, error_message: str) -> None:
         """Mark task as failed (IN_PROGRESS -> FAILED)."""
-        if self.status != TaskStatus.IN_PROGRESS:
-            raise InvalidStateError(
-                f"Cannot fail task in {self.status.value} status"
-            )
-        self.status = TaskStatus.FAILED
+        self._transition("fail")
         self.error_message = error_message
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utc_now()
 
     @property
     def is_active(self) -> bool:
         """Check if task is active (pending, in_progress, or blocked)."""
-        return self.status in {
-            TaskStatus.PENDING,
-            TaskStatus.IN_PROGRESS,
-            TaskStatus.BLOCKED,
-        }
+        return self.status in _ACTIVE_STATUSES
 
     @property
     def is_terminal(self) -> bool:
         """Check if task is in a terminal state."""
-        return self.status in {TaskStatus.COMPLETED, TaskStatus.FAILED}
+        return self.status in _TERMINAL_STATUSES
 
     @classmethod
     def create(
@@ -120,7 +131,7 @@ class Task:
     ) -> "Task":
         """Factory method to create a new Task."""
         return cls(
-            id=f"task-{uuid.uuid4().hex[:8]}",
+            id=f"task-{token_hex(4)}",
             run_id=run_id,
             title=title,
             description=description,
@@ -40,6 +40,17 @@ class AlreadyExistsError(DomainError):
         super().__init__(f"{entity_type} already exists: {entity_id}")
 
 
+class IdempotencyConflictError(DomainError):
+    """Raised when an idempotency key is reused for a different request.
+
+    Example: Retrying an approval with the key of another approval's request.
+    """
+
+    def __init__(self, idempotency_key: str):
+        self.idempotency_key = idempotency_key
+        super().__init__(f"Idempotency key already used by another request: {idempotency_key}")
+
+
 class ValidationError(DomainError):
     """Raised when entity data fails validation.
 
@@ -3,12 +3,14 @@
 Wires together all layers of the application.
 """
 
-from typing import TypeVar, Type, Optional
+import threading
+from typing import Callable, TypeVar, Type, Optional
 
 from claude_clone.application.interfaces.run_repository import RunRepository
 from claude_clone.application.interfaces.approval_repository import ApprovalRepository
 from claude_clone.application.interfaces.event_repository import EventRepository
 from claude_clone.application.interfaces.event_publisher import EventPublisher
+from claude_clone.application.interfaces.unit_of_work import UnitOfWork
 from claude_clone.application.use_cases.create_run import CreateRunUseCase
 from claude_clone.application.use_cases.resolve_approval import ResolveApprovalUseCase
 from claude_clone.application.use_cases.get_timeline import GetTimelineUseCase
@@ -16,6 +18,7 @@ from claude_clone.adapters.persistence.in_memory import (
     InMemoryRunRepository,
     InMemoryApprovalRepository,
     InMemoryEventRepository,
+    InMemoryUnitOfWork,
 )
 from claude_clone.adapters.messaging.event_bus import EventBus
 
@@ -35,29 +38,48 @@ class DIContainer:
     """
 
     def __init__(self) -> None:
-        self._instances: dict[type, object] = {}
-        self._factories: dict[type, callable] = {}
+        # Instances are stored as constant factories so get() is one lookup
+        self._registry: dict[type, Callable[[], object]] = {}
+        self._lock = threading.RLock()  # Guards first resolution of singletons
 
     def register_instance(self, interface: type, instance: object) -> None:
         """Register a singleton instance."""
-        self._instances[interface] = instance
+        self._registry[interface] = lambda instance=instance: instance
+
+    def register_factory(
+        self,
+        interface: type,
+        factory: Callable[[], object],
+        *,
+        singleton: bool = False,
+    ) -> None:
+        """Register a factory function.
+
+        With ``singleton=True`` the factory runs on the first ``get`` only and
+        its result is registered as the instance for later calls.
+        """
+        if not singleton:
+            self._registry[interface] = factory
+            return
+
+        def provider() -> object:
+            with self._lock:
+                if self._registry.get(interface) is not provider:
+                    # Resolved (or re-registered) by another thread meanwhile
+                    return self.get(interface)
+                instance = factory()
+                self.register_instance(interface, instance)
+                return instance
 
-    def register_factory(self, interface: type, factory: callable) -> None:
-        """Register a factory function."""
-        self._factories[interface] = factory
+        self._registry[interface] = provider
 
     def get(self, interface: Type[T]) -> T:
         """Get an instance of the requested type."""
-        # Check for singleton
-        if interface in self._instances:
-            return self._instances[interface]  # type: ignore
-
-        # Check for factory
-        if interface in self._factories:
-            instance = self._factories[interface]()
-            return instance  # type: ignore
-
-        raise KeyError(f"No registration found for {interface}")
+        try:
+            provider = self._registry[interface]
+        except KeyError:
+            raise KeyError(f"No registration found for {interface}") from None
+        return provider()  # type: ignore
 
     def configure_in_memory(self) -> "DIContainer":
         """Configure container with in-memory implementations (for testing)."""
@@ -74,13 +96,18 @@ class DIContainer:
         event_bus = EventBus(event_repository=event_repo)
         self.register_instance(EventPublisher, event_bus)
 
-        # Use cases
+        # Units of work flush the bus's outbox on commit
+        self.register_instance(UnitOfWork, InMemoryUnitOfWork(event_publisher=event_bus))
+
+        # Use cases (stateless once wired, so each is built once)
         self.register_factory(
             CreateRunUseCase,
             lambda: CreateRunUseCase(
                 run_repository=self.get(RunRepository),
                 event_publisher=self.get(EventPublisher),
+                unit_of_work=self.get(UnitOfWork),
             ),
+            singleton=True,
         )
 
         self.register_factory(
@@ -88,7 +115,9 @@ class DIContainer:
             lambda: ResolveApprovalUseCase(
                 approval_repository=self.get(ApprovalRepository),
                 event_publisher=self.get(EventPublisher),
+                unit_of_work=self.get(UnitOfWork),
             ),
+            singleton=True,
         )
 
         self.register_factory(
@@ -97,6 +126,7 @@ class DIContainer:
                 run_repository=self.get(RunRepository),
                 event_repository=self.get(EventRepository),
             ),
+            singleton=True,
         )
 
         return self
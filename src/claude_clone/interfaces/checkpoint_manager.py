@@ -14,17 +14,24 @@ from pydantic import BaseModel
 
 
 class FileSnapshot(BaseModel):
-    """File snapshot"""
+    """File snapshot
+
+    The content itself lives in the checkpoint manager's content-addressed
+    store; the snapshot only references it by hash.
+    """
 
     path: str
     """File path (absolute)"""
 
-    content: str
-    """File content (UTF-8)"""
+    content_hash: str
+    """SHA-256 hex digest of the file content"""
 
     mtime: float
     """Modification time (timestamp)"""
 
+    size: int
+    """Content size in bytes"""
+
 
 class FileCheckpoint(BaseModel):
     """Checkpoint (collection of file snapshots)"""
@@ -5,8 +5,8 @@ only references (IDs, cursors) to data in Store.
 """
 
 from dataclasses import dataclass, field
+from secrets import token_hex
 from typing import TYPE_CHECKING, Optional
-import uuid
 
 from claude_clone.state.types import (
     ApprovalsInfo,
@@ -26,7 +26,7 @@ if TYPE_CHECKING:
 
 def _generate_run_id() -> str:
     """Generate a unique run ID."""
-    return f"run-{uuid.uuid4().hex[:8]}"
+    return f"run-{token_hex(4)}"
 
 
 @dataclass
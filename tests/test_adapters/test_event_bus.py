@@ -1,10 +1,15 @@
 """Tests for EventBus."""
 
+import threading
+
 import pytest
 
 from claude_clone.domain.entities.event import Event, EventType
 from claude_clone.adapters.messaging.event_bus import EventBus
-from claude_clone.adapters.persistence.in_memory import InMemoryEventRepository
+from claude_clone.adapters.persistence.in_memory import (
+    InMemoryEventRepository,
+    InMemoryUnitOfWork,
+)
 
 
 class TestEventBusPublish:
@@ -75,6 +80,110 @@ class TestEventBusPublish:
         assert event2.id == 2
         assert event3.id == 3
 
+    def test_publish_with_idempotency_key_deduplicates(
+        self, event_bus, event_repository
+    ):
+        received = []
+        event_bus.subscribe_all(received.append)
+
+        first = event_bus.publish("run-123", EventType.INFO, idempotency_key="req-1")
+        retry = event_bus.publish("run-123", EventType.INFO, idempotency_key="req-1")
+        other = event_bus.publish("run-123", EventType.INFO, idempotency_key="req-2")
+
+        assert retry is first
+        assert other.id != first.id
+        assert received == [first, other]
+        assert event_repository.count_by_run("run-123") == 2
+
+    def test_idempotency_key_found_in_repository(self, event_repository):
+        EventBus(event_repository=event_repository).publish(
+            "run-123", EventType.INFO, idempotency_key="req-1"
+        )
+
+        # A fresh bus only knows the key through the repository
+        bus = EventBus(event_repository=event_repository)
+        retry = bus.publish("run-123", EventType.INFO, idempotency_key="req-1")
+
+        assert retry.idempotency_key == "req-1"
+        assert event_repository.count_by_run("run-123") == 1
+
+    def test_enqueued_events_published_on_flush_outbox(
+        self, event_bus, event_repository
+    ):
+        received = []
+        event_bus.subscribe_all(received.append)
+
+        event_bus.enqueue("run-123", EventType.INFO, {"n": 1})
+        event_bus.enqueue("run-123", EventType.INFO, {"n": 2})
+
+        assert received == []
+        assert event_repository.count_by_run("run-123") == 0
+
+        event_bus.flush_outbox()
+
+        assert [e.data["n"] for e in received] == [1, 2]
+        assert [e.id for e in received] == [1, 2]
+        assert event_repository.count_by_run("run-123") == 2
+
+    def test_discard_outbox_drops_events_and_keys(self, event_bus, event_repository):
+        event_bus.enqueue("run-123", EventType.INFO, idempotency_key="req-1")
+        event_bus.discard_outbox()
+        event_bus.flush_outbox()
+
+        assert event_repository.count_by_run("run-123") == 0
+        retry = event_bus.publish("run-123", EventType.INFO, idempotency_key="req-1")
+        assert retry.id == 1
+
+    def test_retry_after_failed_flush_is_published(self):
+        class FlakyRepository(InMemoryEventRepository):
+            failures = 1
+
+            def save_many(self, events):
+                if self.failures:
+                    self.failures -= 1
+                    raise OSError("disk full")
+                super().save_many(events)
+
+        event_repository = FlakyRepository()
+        event_bus = EventBus(event_repository=event_repository)
+        uow = InMemoryUnitOfWork(event_publisher=event_bus)
+
+        with pytest.raises(OSError):
+            with uow:
+                event_bus.enqueue("run-123", EventType.INFO, idempotency_key="k1")
+
+        assert event_bus.find_published("k1") is None
+        with uow:
+            retry = event_bus.enqueue("run-123", EventType.INFO, idempotency_key="k1")
+
+        stored = event_bus.find_published("k1")
+        assert retry.id == 0  # Provisional until flushed
+        assert event_repository.count_by_run("run-123") == 1
+        assert event_repository.find_by_id(stored.id) is stored
+
+    def test_failed_direct_flush_forgets_keys(self):
+        class FailingRepository(InMemoryEventRepository):
+            def save_many(self, events):
+                raise OSError("disk full")
+
+        event_bus = EventBus(event_repository=FailingRepository())
+        event_bus.enqueue("run-123", EventType.INFO, idempotency_key="k1")
+
+        with pytest.raises(OSError):
+            event_bus.flush_outbox()
+
+        assert event_bus.find_published("k1") is None
+        assert event_bus.outbox_mark() == 0
+
+    def test_enqueue_deduplicates_idempotency_key(self, event_bus, event_repository):
+        first = event_bus.enqueue("run-1", EventType.INFO, idempotency_key="req-1")
+        retry = event_bus.enqueue("run-2", EventType.INFO, idempotency_key="req-1")
+        event_bus.flush_outbox()
+
+        assert retry is first
+        assert event_repository.count_by_run("run-1") == 1
+        assert event_repository.count_by_run("run-2") == 0
+
 
 class TestEventBusSubscribe:
     """Test EventBus subscription functionality."""
@@ -214,3 +323,231 @@ class TestEventBusSubscribe:
         event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
 
         assert len(received_events) == 1  # Should only receive once
+
+    def test_unsubscribe_unknown_handler_is_noop(self, event_bus):
+        def handler(event):
+            pass
+
+        event_bus.unsubscribe(EventType.INFO, handler)
+        event_bus.unsubscribe_all(handler)
+
+        event = event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+
+        assert event is not None
+
+    def test_handler_can_unsubscribe_during_dispatch(self, event_bus):
+        received_events = []
+
+        def once(event):
+            received_events.append(event)
+            event_bus.unsubscribe(EventType.INFO, once)
+
+        def other(event):
+            received_events.append(event)
+
+        event_bus.subscribe(EventType.INFO, once)
+        event_bus.subscribe(EventType.INFO, other)
+        event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+        event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+
+        assert len(received_events) == 3
+
+    def test_type_handlers_run_before_global_handlers(self, event_bus):
+        calls = []
+
+        event_bus.subscribe_all(lambda e: calls.append("global"))
+        event_bus.subscribe(EventType.INFO, lambda e: calls.append("typed"))
+
+        event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+        event_bus.publish(run_id="run-123", event_type=EventType.ERROR, data={})
+
+        assert calls == ["typed", "global", "global"]
+
+
+class TestEventBusAsynchronous:
+    """Test EventBus asynchronous delivery."""
+
+    def test_flush_delivers_and_persists(self):
+        event_repository = InMemoryEventRepository()
+        event_bus = EventBus(event_repository=event_repository, asynchronous=True)
+        received_events = []
+
+        event_bus.subscribe_all(received_events.append)
+        events = [
+            event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+            for _ in range(10)
+        ]
+        event_bus.flush()
+
+        assert [e.id for e in received_events] == [e.id for e in events]
+        assert event_repository.count_by_run("run-123") == 10
+
+    def test_handler_error_does_not_stop_delivery(self):
+        event_bus = EventBus(asynchronous=True)
+        received_events = []
+
+        def failing(event):
+            raise RuntimeError("boom")
+
+        event_bus.subscribe(EventType.ERROR, failing)
+        event_bus.subscribe_all(received_events.append)
+        event_bus.publish(run_id="run-123", event_type=EventType.ERROR, data={})
+        event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+
+        with pytest.raises(RuntimeError, match="boom"):
+            event_bus.flush()
+
+        assert [e.type for e in received_events] == [EventType.INFO]
+        event_bus.flush()  # Reported once
+
+    def test_flush_raises_persistence_error(self):
+        class FailingRepository(InMemoryEventRepository):
+            def save(self, event):
+                raise OSError("disk full")
+
+        event_bus = EventBus(event_repository=FailingRepository(), asynchronous=True)
+        received_events = []
+
+        event_bus.subscribe_all(received_events.append)
+        event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+
+        with pytest.raises(OSError, match="disk full"):
+            event_bus.flush()
+        assert received_events == []
+
+    def test_handler_can_publish_past_full_queue(self):
+        event_repository = InMemoryEventRepository()
+        event_bus = EventBus(
+            event_repository=event_repository, asynchronous=True, queue_size=2
+        )
+
+        def fan_out(event):
+            for _ in range(3):
+                event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+
+        event_bus.subscribe(EventType.RUN_STARTED, fan_out)
+        event_bus.publish(run_id="run-123", event_type=EventType.RUN_STARTED, data={})
+        flusher = threading.Thread(target=event_bus.flush, daemon=True)
+        flusher.start()
+        flusher.join(timeout=5)
+
+        assert not flusher.is_alive()
+        assert event_repository.count_by_run("run-123") == 4
+
+    def test_publish_waits_for_queue_room(self):
+        event_bus = EventBus(asynchronous=True, queue_size=1)
+        release = threading.Event()
+        event_bus.subscribe_all(lambda e: release.wait(5))
+
+        event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+        publisher = threading.Thread(
+            target=event_bus.publish,
+            kwargs={"run_id": "run-123", "event_type": EventType.INFO},
+            daemon=True,
+        )
+        publisher.start()
+        publisher.join(timeout=0.1)
+        blocked = publisher.is_alive()
+        release.set()
+        publisher.join(timeout=5)
+        event_bus.flush()
+
+        assert blocked
+        assert not publisher.is_alive()
+
+
+class TestEventBusBatching:
+    """Test EventBus batched persistence."""
+
+    def test_events_persisted_when_batch_fills(self):
+        event_repository = InMemoryEventRepository()
+        event_bus = EventBus(event_repository=event_repository, batch_size=3)
+
+        for _ in range(2):
+            event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+
+        assert event_repository.count() == 0
+
+        event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+
+        assert event_repository.count() == 3
+
+    def test_flush_persists_partial_batch(self):
+        event_repository = InMemoryEventRepository()
+        event_bus = EventBus(event_repository=event_repository, batch_size=10)
+        received_events = []
+
+        event_bus.subscribe_all(received_events.append)
+        event = event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+
+        assert received_events == [event]
+        assert event_repository.find_by_id(event.id) is None
+
+        event_bus.flush()
+
+        assert event_repository.find_by_id(event.id) is event
+
+
+class TestEventBusBackgroundPersistence:
+    """Test EventBus background persistence."""
+
+    def test_wait_persisted(self):
+        event_repository = InMemoryEventRepository()
+        event_bus = EventBus(
+            event_repository=event_repository, background_persistence=True
+        )
+        received_events = []
+
+        event_bus.subscribe_all(received_events.append)
+        events = [
+            event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+            for _ in range(100)
+        ]
+
+        assert received_events == events
+        assert event_bus.wait_persisted(events[-1].id, timeout=5)
+        assert [e.id for e in event_repository.find_by_run("run-123", limit=200)] == [
+            e.id for e in events
+        ]
+
+    def test_flush_waits_for_persister(self):
+        event_repository = InMemoryEventRepository()
+        event_bus = EventBus(
+            event_repository=event_repository, background_persistence=True
+        )
+
+        event = event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+        event_bus.flush()
+
+        assert event_repository.find_by_id(event.id) is event
+        assert event_repository.next_id() == event.id + 1
+
+    def test_failed_write_is_reported_not_persisted(self):
+        class FailingRepository(InMemoryEventRepository):
+            def save_many(self, events):
+                raise OSError("disk full")
+
+        event_repository = FailingRepository()
+        event_bus = EventBus(
+            event_repository=event_repository, background_persistence=True
+        )
+
+        event = event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+
+        with pytest.raises(OSError, match="disk full"):
+            event_bus.wait_persisted(event.id, timeout=5)
+        assert event_bus.wait_persisted(event.id, timeout=0.01) is False
+        assert event_repository.find_by_id(event.id) is None
+
+    def test_flush_raises_failed_write(self):
+        class FailingRepository(InMemoryEventRepository):
+            def save_many(self, events):
+                raise OSError("disk full")
+
+        event_bus = EventBus(
+            event_repository=FailingRepository(), background_persistence=True
+        )
+        event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+
+        with pytest.raises(OSError, match="disk full"):
+            event_bus.flush()
@@ -0,0 +1,100 @@
+"""Tests for EventRing."""
+
+import threading
+import time
+
+import pytest
+
+from claude_clone.domain.entities.event import Event, EventType
+from claude_clone.adapters.messaging import EventBus, EventRing
+
+
+def _event(event_id: int) -> Event:
+    return Event.create(
+        event_id=event_id,
+        run_id="run-123",
+        event_type=EventType.INFO,
+    )
+
+
+class TestEventRing:
+    """Test EventRing write/poll behaviour."""
+
+    def test_capacity_must_be_power_of_two(self):
+        with pytest.raises(ValueError):
+            EventRing(capacity=100)
+
+    def test_cursor_sees_events_written_after_creation(self):
+        ring = EventRing(capacity=8)
+        ring.write(_event(1))
+        cursor = ring.cursor()
+        ring.write(_event(2))
+        ring.write(_event(3))
+
+        assert [e.id for e in cursor.poll()] == [2, 3]
+        assert cursor.poll() == []
+
+    def test_cursors_are_independent(self):
+        ring = EventRing(capacity=8)
+        fast = ring.cursor()
+        slow = ring.cursor()
+        for i in range(1, 4):
+            ring.write(_event(i))
+
+        assert [e.id for e in fast.poll()] == [1, 2, 3]
+        assert slow.lag == 3
+        assert [e.id for e in slow.poll(max_events=2)] == [1, 2]
+        assert [e.id for e in slow.poll()] == [3]
+
+    def test_overrun_cursor_skips_to_oldest(self):
+        ring = EventRing(capacity=4)
+        cursor = ring.cursor()
+        for i in range(1, 7):
+            ring.write(_event(i))
+
+        assert [e.id for e in cursor.poll()] == [3, 4, 5, 6]
+        assert cursor.dropped == 2
+
+    def test_from_start_reads_retained_events(self):
+        ring = EventRing(capacity=4)
+        for i in range(1, 6):
+            ring.write(_event(i))
+
+        cursor = ring.cursor(from_start=True)
+
+        assert [e.id for e in cursor.poll()] == [2, 3, 4, 5]
+
+    def test_attached_to_event_bus(self):
+        event_bus = EventBus()
+        ring = EventRing(capacity=8)
+        event_bus.subscribe_all(ring.write)
+        cursor = ring.cursor()
+
+        event_bus.publish(run_id="run-123", event_type=EventType.INFO, data={})
+
+        assert [e.type for e in cursor.poll()] == [EventType.INFO]
+
+    def test_concurrent_writers_lose_no_events(self):
+        class YieldingSlots(list):
+            """Slots that let another thread run in the middle of a write."""
+
+            def __setitem__(self, index, value):
+                time.sleep(0)
+                super().__setitem__(index, value)
+
+        ring = EventRing(capacity=8192)
+        ring._slots = YieldingSlots(ring._slots)
+        cursor = ring.cursor()
+
+        def write(start):
+            for event_id in range(start, start + 500):
+                ring.write(_event(event_id))
+
+        threads = [threading.Thread(target=write, args=(i * 500,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert ring.sequence == 2000
+        assert sorted(e.id for e in cursor.poll()) == list(range(2000))
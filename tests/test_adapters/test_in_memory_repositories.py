@@ -1,5 +1,8 @@
 """Tests for in-memory repository implementations."""
 
+import threading
+from datetime import datetime, timedelta
+
 import pytest
 
 from claude_clone.domain.entities.run import Run, RunStatus
@@ -9,6 +12,7 @@ from claude_clone.adapters.persistence.in_memory import (
     InMemoryRunRepository,
     InMemoryApprovalRepository,
     InMemoryEventRepository,
+    InMemoryUnitOfWork,
 )
 
 
@@ -50,6 +54,16 @@ class TestInMemoryRunRepository:
         assert len(active_runs) == 1
         assert active_runs[0].id == active_run.id
 
+    def test_find_active_drops_run_after_completion(self, repo):
+        run = Run.create(goal="활성")
+        run.start()
+        repo.save(run)
+
+        run.complete()
+        repo.save(run)
+
+        assert repo.find_active() == []
+
     def test_find_by_status(self, repo):
         run1 = Run.create(goal="실행 중 1")
         run1.start()
@@ -75,6 +89,32 @@ class TestInMemoryRunRepository:
 
         assert len(recent) == 3
 
+    def test_list_recent_orders_by_created_at_desc(self, repo):
+        base = datetime(2024, 1, 1)
+        runs = [Run.create(goal=f"런 {i}") for i in range(4)]
+        for i, run in enumerate(runs):
+            run.created_at = base + timedelta(seconds=i)
+        for run in (runs[2], runs[0], runs[3], runs[1]):
+            repo.save(run)
+
+        recent = repo.list_recent(limit=3)
+
+        assert [r.id for r in recent] == [runs[3].id, runs[2].id, runs[1].id]
+
+    def test_find_by_status_follows_transitions(self, repo):
+        run = Run.create(goal="전이")
+        repo.save(run)
+        run.start()
+        repo.save(run)
+
+        assert repo.find_by_status(RunStatus.PENDING) == []
+        assert repo.find_by_status(RunStatus.RUNNING) == [run]
+
+        repo.delete(run.id)
+
+        assert repo.find_by_status(RunStatus.RUNNING) == []
+        assert repo.list_recent() == []
+
     def test_delete(self, repo):
         run = Run.create(goal="삭제 예정")
         repo.save(run)
@@ -199,6 +239,34 @@ class TestInMemoryApprovalRepository:
 
         assert count == 3
 
+    def test_status_change_moves_between_indexes(self, repo):
+        approval = Approval.create(
+            run_id="run-123",
+            approval_type=ApprovalType.FILE_EDIT,
+            target="file1.py",
+        )
+        repo.save(approval)
+
+        approval.reject()
+        repo.save(approval)
+
+        assert repo.count_pending("run-123") == 0
+        assert repo.find_pending_by_run("run-123") == []
+        assert repo.find_by_status("run-123", ApprovalStatus.REJECTED) == [approval]
+        assert repo.find_by_run("run-123") == [approval]
+
+    def test_delete_removes_from_indexes(self, repo):
+        approval = Approval.create(
+            run_id="run-123",
+            approval_type=ApprovalType.FILE_EDIT,
+            target="file1.py",
+        )
+        repo.save(approval)
+
+        assert repo.delete(approval.id) is True
+        assert repo.find_by_run("run-123") == []
+        assert repo.count_pending("run-123") == 0
+
 
 class TestInMemoryEventRepository:
     """Test InMemoryEventRepository."""
@@ -230,6 +298,20 @@ class TestInMemoryEventRepository:
         assert id2 == 2
         assert id3 == 3
 
+    def test_next_id_unique_across_threads(self, repo):
+        ids = []
+
+        def allocate():
+            ids.extend(repo.next_id() for _ in range(1000))
+
+        threads = [threading.Thread(target=allocate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(ids) == list(range(1, 4001))
+
     def test_find_by_run(self, repo):
         for i in range(5):
             event = Event.create(
@@ -254,6 +336,49 @@ class TestInMemoryEventRepository:
         assert len(events) == 5
         assert all(e.run_id == "run-123" for e in events)
 
+    def test_find_by_idempotency_key(self, repo):
+        event = Event.create(
+            repo.next_id(), "run-123", EventType.INFO, idempotency_key="req-1"
+        )
+        repo.save(event)
+        repo.save(Event.create(repo.next_id(), "run-123", EventType.INFO))
+
+        assert repo.find_by_idempotency_key("req-1") is event
+        assert repo.find_by_idempotency_key("req-2") is None
+
+    def test_evicted_event_idempotency_key_is_dropped(self):
+        repo = InMemoryEventRepository(capacity=1)
+        repo.save(Event.create(repo.next_id(), "run-123", EventType.INFO, idempotency_key="req-1"))
+        repo.save(Event.create(repo.next_id(), "run-123", EventType.INFO))
+
+        assert repo.find_by_idempotency_key("req-1") is None
+
+    def test_find_by_run_with_event_types(self, repo):
+        types = [
+            EventType.INFO,
+            EventType.TOOL_CALLED,
+            EventType.WARNING,
+            EventType.TOOL_CALLED,
+            EventType.INFO,
+            EventType.ERROR,
+        ]
+        for event_type in types:
+            repo.save(Event.create(repo.next_id(), "run-123", event_type))
+
+        events = repo.find_by_run(
+            "run-123", event_types={EventType.INFO, EventType.TOOL_CALLED}
+        )
+        assert [e.id for e in events] == [1, 2, 4, 5]
+
+        events = repo.find_by_run(
+            "run-123", since_id=1, limit=2, event_types=[EventType.INFO, EventType.TOOL_CALLED]
+        )
+        assert [e.id for e in events] == [2, 4]
+
+        assert [e.id for e in repo.find_by_run("run-123", event_types={EventType.ERROR})] == [6]
+        assert repo.find_by_run("run-123", event_types={EventType.RUN_STARTED}) == []
+        assert repo.find_by_run("run-123", event_types=()) == []
+
     def test_find_by_run_with_since_id(self, repo):
         for i in range(5):
             event = Event.create(
@@ -358,3 +483,153 @@ class TestInMemoryEventRepository:
 
         assert repo.count() == 0
         assert repo.next_id() == 1  # ID should reset
+
+    def test_find_by_run_since_id_interleaved_runs(self, repo):
+        for i in range(6):
+            event = Event.create(
+                event_id=repo.next_id(),
+                run_id="run-123" if i % 2 == 0 else "run-456",
+                event_type=EventType.INFO,
+                data={},
+            )
+            repo.save(event)
+
+        events = repo.find_by_run("run-123", since_id=2)
+
+        assert [e.id for e in events] == [3, 5]
+        assert repo.get_latest_id("run-456") == 6
+        assert repo.count_by_run("run-456") == 3
+
+    def test_save_many(self, repo):
+        events = [
+            Event.create(
+                event_id=repo.next_id(),
+                run_id="run-123",
+                event_type=EventType.INFO,
+                data={},
+            )
+            for _ in range(4)
+        ]
+
+        repo.save_many(events)
+
+        assert repo.count_by_run("run-123") == 4
+        assert repo.find_by_id(events[2].id) is events[2]
+        assert repo.find_by_run("run-123", since_id=2) == events[2:]
+
+    def test_capacity_evicts_oldest(self):
+        repo = InMemoryEventRepository(capacity=3)
+        for i in range(5):
+            event = Event.create(
+                event_id=repo.next_id(),
+                run_id="run-123" if i < 2 else "run-456",
+                event_type=EventType.INFO,
+                data={},
+            )
+            repo.save(event)
+
+        assert repo.count() == 3
+        assert repo.find_by_id(1) is None
+        assert repo.find_by_id(2) is None
+        assert repo.find_by_run("run-123") == []
+        assert repo.get_latest_id("run-123") is None
+        assert [e.id for e in repo.find_by_run("run-456")] == [3, 4, 5]
+        assert len(repo.find_by_type("run-456", EventType.INFO)) == 3
+
+    def test_out_of_order_saves_stay_sorted(self):
+        repo = InMemoryEventRepository(capacity=3)
+        events = [
+            Event.create(
+                event_id=repo.next_id(),
+                run_id="run-123",
+                event_type=EventType.INFO,
+                data={},
+            )
+            for _ in range(4)
+        ]
+        for i in (1, 0, 3, 2):
+            repo.save(events[i])
+
+        assert [e.id for e in repo.find_by_run("run-123")] == [2, 3, 4]
+        assert [e.id for e in repo.find_by_run("run-123", since_id=2)] == [3, 4]
+        assert [e.id for e in repo.find_by_type("run-123", EventType.INFO)] == [2, 3, 4]
+        assert repo.get_latest_id("run-123") == 4
+        assert repo.find_by_id(1) is None
+
+    def test_concurrent_publishers_page_each_event_once(self):
+        import sys
+
+        from claude_clone.adapters.messaging.event_bus import EventBus
+
+        repo = InMemoryEventRepository(capacity=10000)
+        bus = EventBus(event_repository=repo)
+
+        def publish():
+            for _ in range(1000):
+                bus.publish("run-123", EventType.INFO)
+
+        # Switch threads often so saves land out of id order
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=publish) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        seen = []
+        since_id = None
+        while page := repo.find_by_run("run-123", since_id=since_id, limit=64):
+            seen.extend(e.id for e in page)
+            since_id = page[-1].id
+
+        assert seen == list(range(1, 4001))
+        assert repo.get_latest_id("run-123") == 4000
+
+
+class TestInMemoryUnitOfWork:
+    """Test InMemoryUnitOfWork."""
+
+    def test_units_of_work_are_serialized(self):
+        uow = InMemoryUnitOfWork()
+        entered = threading.Event()
+
+        def worker():
+            with uow:
+                entered.set()
+
+        with uow:
+            thread = threading.Thread(target=worker)
+            thread.start()
+            assert not entered.wait(0.05)
+
+        thread.join(1)
+        assert entered.is_set()
+
+    def test_released_when_block_raises(self):
+        uow = InMemoryUnitOfWork()
+
+        with pytest.raises(RuntimeError):
+            with uow:
+                raise RuntimeError("boom")
+
+        entered = threading.Event()
+
+        def worker():
+            with uow:
+                entered.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join(1)
+        assert entered.is_set()
+
+    def test_reentrant(self):
+        uow = InMemoryUnitOfWork()
+
+        with uow:
+            with uow:
+                pass
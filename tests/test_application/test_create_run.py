@@ -4,6 +4,8 @@ import pytest
 
 from claude_clone.domain.entities.run import RunStatus
 from claude_clone.domain.entities.event import EventType
+from claude_clone.domain.exceptions import IdempotencyConflictError
+from claude_clone.application.interfaces.unit_of_work import UnitOfWork
 from claude_clone.application.use_cases.create_run import (
     CreateRunUseCase,
     CreateRunRequest,
@@ -11,10 +13,28 @@ from claude_clone.application.use_cases.create_run import (
 from claude_clone.adapters.persistence.in_memory import (
     InMemoryRunRepository,
     InMemoryEventRepository,
+    InMemoryUnitOfWork,
 )
 from claude_clone.adapters.messaging.event_bus import EventBus
 
 
+class RecordingUnitOfWork(UnitOfWork):
+    """Unit of work that records its lifecycle calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def begin(self):
+        self.calls.append("begin")
+
+    def commit(self):
+        self.calls.append("commit")
+
+    def rollback(self):
+        self.calls.append("rollback")
+
+
 @pytest.fixture
 def run_repository():
     return InMemoryRunRepository()
@@ -97,3 +117,140 @@ class TestCreateRunUseCase:
 
         assert response1.run_id != response2.run_id
         assert run_repository.count() == 2
+
+    def test_save_and_publish_in_unit_of_work(
+        self, run_repository, event_repository, event_publisher
+    ):
+        uow = RecordingUnitOfWork()
+        seen = []
+        event_publisher.subscribe(
+            EventType.RUN_STARTED, lambda event: seen.append(list(uow.calls))
+        )
+        use_case = CreateRunUseCase(
+            run_repository=run_repository,
+            event_publisher=event_publisher,
+            unit_of_work=uow,
+        )
+
+        use_case.execute(CreateRunRequest(goal="테스트"))
+
+        assert seen == [["begin"]]
+        assert uow.calls == ["begin", "commit"]
+
+    def test_unit_of_work_rolled_back_on_publish_failure(
+        self, run_repository, event_publisher
+    ):
+        uow = RecordingUnitOfWork()
+
+        def failing_handler(event):
+            raise RuntimeError("handler failed")
+
+        event_publisher.subscribe(EventType.RUN_STARTED, failing_handler)
+        use_case = CreateRunUseCase(
+            run_repository=run_repository,
+            event_publisher=event_publisher,
+            unit_of_work=uow,
+        )
+
+        with pytest.raises(RuntimeError):
+            use_case.execute(CreateRunRequest(goal="테스트"))
+
+        assert uow.calls == ["begin", "rollback"]
+
+    def test_retry_with_idempotency_key_returns_first_run(
+        self, use_case, run_repository, event_repository
+    ):
+        request = CreateRunRequest(goal="테스트", idempotency_key="req-1")
+
+        first = use_case.execute(request)
+        retry = use_case.execute(request)
+
+        assert retry == first
+        assert run_repository.count() == 1
+        assert len(event_repository.find_by_run(first.run_id)) == 1
+
+    def test_retry_does_not_save_a_new_run(self, use_case, run_repository):
+        request = CreateRunRequest(goal="테스트", idempotency_key="req-1")
+        first = use_case.execute(request)
+        saved = []
+        run_repository.save = saved.append
+
+        retry = use_case.execute(request)
+
+        assert retry == first
+        assert saved == []
+
+    def test_key_reused_for_another_goal_is_a_conflict(self, use_case, run_repository):
+        use_case.execute(CreateRunRequest(goal="테스트", idempotency_key="req-1"))
+
+        with pytest.raises(IdempotencyConflictError):
+            use_case.execute(CreateRunRequest(goal="다른 목표", idempotency_key="req-1"))
+        assert run_repository.count() == 1
+
+    def test_events_published_on_unit_of_work_commit(
+        self, run_repository, event_repository, event_publisher
+    ):
+        uow = InMemoryUnitOfWork(event_publisher=event_publisher)
+        use_case = CreateRunUseCase(
+            run_repository=run_repository,
+            event_publisher=event_publisher,
+            unit_of_work=uow,
+        )
+
+        with uow:
+            first = use_case.execute(CreateRunRequest(goal="첫 번째"))
+            second = use_case.execute(CreateRunRequest(goal="두 번째"))
+            assert event_repository.count() == 0
+
+        assert len(event_repository.find_by_run(first.run_id)) == 1
+        assert len(event_repository.find_by_run(second.run_id)) == 1
+
+    def test_enqueued_event_discarded_on_rollback(
+        self, run_repository, event_repository, event_publisher
+    ):
+        uow = InMemoryUnitOfWork(event_publisher=event_publisher)
+        use_case = CreateRunUseCase(
+            run_repository=run_repository,
+            event_publisher=event_publisher,
+            unit_of_work=uow,
+        )
+
+        with pytest.raises(RuntimeError):
+            with uow:
+                use_case.execute(CreateRunRequest(goal="테스트"))
+                raise RuntimeError("abort")
+
+        assert event_repository.count() == 0
+
+    def test_caught_nested_failure_keeps_outer_events(
+        self, run_repository, event_repository, event_publisher
+    ):
+        uow = InMemoryUnitOfWork(event_publisher=event_publisher)
+        use_case = CreateRunUseCase(
+            run_repository=run_repository,
+            event_publisher=event_publisher,
+            unit_of_work=uow,
+        )
+
+        with uow:
+            kept = use_case.execute(CreateRunRequest(goal="유지"))
+            with pytest.raises(RuntimeError):
+                with uow:
+                    dropped = use_case.execute(CreateRunRequest(goal="폐기"))
+                    raise RuntimeError("abort")
+            after = use_case.execute(CreateRunRequest(goal="이후"))
+
+        assert len(event_repository.find_by_run(kept.run_id)) == 1
+        assert event_repository.find_by_run(dropped.run_id) == []
+        assert len(event_repository.find_by_run(after.run_id)) == 1
+
+    def test_nesting_is_tracked_per_unit_of_work(self, event_repository, event_publisher):
+        first = InMemoryUnitOfWork(event_publisher=event_publisher)
+        second = InMemoryUnitOfWork(event_publisher=event_publisher)
+
+        with first:
+            event_publisher.enqueue("run-1", EventType.INFO)
+            with second:
+                event_publisher.enqueue("run-1", EventType.INFO)
+            # Leaving second's outermost block flushes the shared outbox
+            assert event_repository.count() == 2
@@ -1,5 +1,7 @@
 """Tests for GetTimelineUseCase."""
 
+from collections.abc import Mapping
+
 import pytest
 
 from claude_clone.domain.entities.run import Run
@@ -77,6 +79,32 @@ class TestGetTimelineUseCase:
         assert len(response.events) == 3
         assert response.has_more is True
 
+    def test_get_timeline_exact_limit_has_no_more(
+        self, use_case, run_with_events
+    ):
+        request = GetTimelineRequest(run_id=run_with_events.id, limit=5)
+
+        response = use_case.execute(request)
+
+        assert len(response.events) == 5
+        assert response.has_more is False
+
+    def test_get_timeline_last_page_from_cursor(
+        self, use_case, run_with_events, event_repository
+    ):
+        events = event_repository.find_by_run(run_with_events.id)
+
+        request = GetTimelineRequest(
+            run_id=run_with_events.id,
+            since_event_id=events[2].id,
+            limit=2,
+        )
+
+        response = use_case.execute(request)
+
+        assert [e.id for e in response.events] == [events[3].id, events[4].id]
+        assert response.has_more is False
+
     def test_get_timeline_since_cursor(
         self, use_case, run_with_events, event_repository
     ):
@@ -127,7 +155,16 @@ class TestGetTimelineUseCase:
         assert event.type == "info"
         assert event.timestamp is not None
         assert event.summary is not None
-        assert isinstance(event.data, dict)
+        assert isinstance(event.data, Mapping)
+        assert event.data == {"message": "이벤트 1"}
+
+    def test_timeline_event_data_is_read_only(self, use_case, run_with_events):
+        request = GetTimelineRequest(run_id=run_with_events.id, limit=1)
+
+        response = use_case.execute(request)
+
+        with pytest.raises(TypeError):
+            response.events[0].data["message"] = "changed"
 
     def test_latest_event_id_is_set(self, use_case, run_with_events):
         request = GetTimelineRequest(run_id=run_with_events.id)
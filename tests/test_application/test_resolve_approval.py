@@ -8,7 +8,11 @@ from claude_clone.domain.entities.approval import (
     ApprovalStatus,
 )
 from claude_clone.domain.entities.event import EventType
-from claude_clone.domain.exceptions import NotFoundError
+from claude_clone.domain.exceptions import (
+    IdempotencyConflictError,
+    InvalidStateError,
+    NotFoundError,
+)
 from claude_clone.application.use_cases.resolve_approval import (
     ResolveApprovalUseCase,
     ResolveApprovalRequest,
@@ -16,6 +20,7 @@ from claude_clone.application.use_cases.resolve_approval import (
 from claude_clone.adapters.persistence.in_memory import (
     InMemoryApprovalRepository,
     InMemoryEventRepository,
+    InMemoryUnitOfWork,
 )
 from claude_clone.adapters.messaging.event_bus import EventBus
 
@@ -149,3 +154,88 @@ class TestResolveApprovalUseCase:
 
         approval = approval_repository.find_by_id(pending_approval.id)
         assert approval.resolved_by == "admin"
+
+    def test_retry_with_idempotency_key_returns_first_outcome(
+        self, use_case, event_repository, pending_approval
+    ):
+        request = ResolveApprovalRequest(
+            approval_id=pending_approval.id,
+            approved=True,
+            idempotency_key="req-1",
+        )
+
+        first = use_case.execute(request)
+        retry = use_case.execute(request)
+
+        assert retry == first
+        assert retry.status == "approved"
+        assert len(event_repository.find_by_run("run-123")) == 1
+
+    def test_retry_inside_unit_of_work_returns_first_outcome(
+        self, approval_repository, event_publisher, event_repository, pending_approval
+    ):
+        use_case = ResolveApprovalUseCase(
+            approval_repository=approval_repository,
+            event_publisher=event_publisher,
+            unit_of_work=InMemoryUnitOfWork(event_publisher=event_publisher),
+        )
+        request = ResolveApprovalRequest(
+            approval_id=pending_approval.id,
+            approved=False,
+            idempotency_key="req-1",
+        )
+
+        first = use_case.execute(request)
+        retry = use_case.execute(request)
+
+        assert retry == first
+        assert retry.status == "rejected"
+        assert len(event_repository.find_by_run("run-123")) == 1
+
+    def test_key_reused_for_another_approval_is_a_conflict(
+        self, use_case, approval_repository, pending_approval
+    ):
+        other = Approval.create(
+            run_id="run-123",
+            approval_type=ApprovalType.FILE_EDIT,
+            target="src/other.py",
+        )
+        approval_repository.save(other)
+        use_case.execute(
+            ResolveApprovalRequest(
+                approval_id=pending_approval.id, approved=True, idempotency_key="req-1"
+            )
+        )
+
+        with pytest.raises(IdempotencyConflictError):
+            use_case.execute(
+                ResolveApprovalRequest(
+                    approval_id=other.id, approved=True, idempotency_key="req-1"
+                )
+            )
+        assert approval_repository.find_by_id(other.id).status == ApprovalStatus.PENDING
+
+    def test_key_used_by_another_use_case_is_a_conflict(
+        self, use_case, event_publisher, pending_approval
+    ):
+        event_publisher.publish(
+            run_id="run-123",
+            event_type=EventType.RUN_STARTED,
+            data={"goal": "테스트"},
+            idempotency_key="req-1",
+        )
+
+        with pytest.raises(IdempotencyConflictError):
+            use_case.execute(
+                ResolveApprovalRequest(
+                    approval_id=pending_approval.id, approved=True, idempotency_key="req-1"
+                )
+            )
+
+    def test_resolving_twice_without_key_is_rejected(self, use_case, pending_approval):
+        request = ResolveApprovalRequest(approval_id=pending_approval.id, approved=True)
+
+        use_case.execute(request)
+
+        with pytest.raises(InvalidStateError):
+            use_case.execute(request)
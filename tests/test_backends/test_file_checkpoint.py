@@ -1,5 +1,7 @@
 """Tests for FileCheckpointManager"""
 
+import json
+import os
 from pathlib import Path
 
 import pytest
@@ -38,6 +40,21 @@ class TestFileCheckpointManager:
         assert len(tracked) == 1
         assert str(test_file.resolve()) in tracked
 
+    def test_track_relative_path(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that relative paths are tracked as normalized absolute paths"""
+        storage_dir = tmp_path / "checkpoints"
+        manager = FileCheckpointManager(storage_dir=storage_dir)
+
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "test.py").write_text("content", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+
+        manager.track_file("src/../src/./test.py")
+
+        assert manager.get_tracked_files() == [str(tmp_path / "src" / "test.py")]
+
     def test_track_nonexistent_file(self, tmp_path: Path) -> None:
         """Test tracking a file that doesn't exist"""
         storage_dir = tmp_path / "checkpoints"
@@ -78,7 +95,7 @@ class TestFileCheckpointManager:
         assert checkpoint.id is not None
         assert checkpoint.message == "Test checkpoint"
         assert len(checkpoint.snapshots) == 1
-        assert checkpoint.snapshots[0].content == "original"
+        assert manager.read_snapshot(checkpoint.snapshots[0]) == b"original"
 
     def test_create_clears_tracked_files(self, tmp_path: Path) -> None:
         """Test that create clears tracked files"""
@@ -104,8 +121,12 @@ class TestFileCheckpointManager:
         manager.track_file(str(test_file))
         checkpoint = manager.create("Saved checkpoint")
 
-        checkpoint_file = storage_dir / f"{checkpoint.id}.json"
-        assert checkpoint_file.exists()
+        log_lines = (storage_dir / "checkpoints.jsonl").read_text(encoding="utf-8").splitlines()
+        index_lines = (storage_dir / "index.jsonl").read_text(encoding="utf-8").splitlines()
+        assert len(log_lines) == 1
+        assert checkpoint.id in log_lines[0]
+        assert checkpoint.id in index_lines[0]
+        assert not (storage_dir / f"{checkpoint.id}.json").exists()
 
     def test_restore_checkpoint(self, tmp_path: Path) -> None:
         """Test restoring files from checkpoint"""
@@ -188,6 +209,181 @@ class TestFileCheckpointManager:
         assert deleted == 3
         assert len(manager.list_checkpoints()) == 2
 
+    def test_clear_old_compacts_log(self, tmp_path: Path) -> None:
+        """Test that clear_old drops old records and keeps the rest loadable"""
+        storage_dir = tmp_path / "checkpoints"
+        manager = FileCheckpointManager(storage_dir=storage_dir)
+
+        test_file = tmp_path / "test.py"
+        created = []
+        for i in range(4):
+            test_file.write_text(f"content {i}", encoding="utf-8")
+            manager.track_file(str(test_file))
+            created.append(manager.create(f"Checkpoint {i}"))
+
+        manager.clear_old(keep_last=2)
+
+        log_lines = (storage_dir / "checkpoints.jsonl").read_text(encoding="utf-8").splitlines()
+        assert len(log_lines) == 2
+        with pytest.raises(CheckpointNotFoundError):
+            manager.restore(created[0].id)
+        manager.restore(created[2].id)
+        assert test_file.read_text() == "content 2"
+
+    def test_checkpoints_visible_to_new_manager(self, tmp_path: Path) -> None:
+        """Test that a new manager on the same directory sees existing checkpoints"""
+        storage_dir = tmp_path / "checkpoints"
+        manager = FileCheckpointManager(storage_dir=storage_dir)
+
+        test_file = tmp_path / "test.py"
+        test_file.write_text("original", encoding="utf-8")
+        manager.track_file(str(test_file))
+        checkpoint = manager.create("Checkpoint")
+
+        other = FileCheckpointManager(storage_dir=storage_dir)
+        test_file.write_text("modified", encoding="utf-8")
+
+        assert [c.id for c in other.list_checkpoints()] == [checkpoint.id]
+        assert other.restore(checkpoint.id) == [str(test_file.resolve())]
+        assert test_file.read_text() == "original"
+
+    def test_migrates_legacy_checkpoint_files(self, tmp_path: Path) -> None:
+        """Test that one-file-per-checkpoint JSON files are moved into the log"""
+        storage_dir = tmp_path / "checkpoints"
+        storage_dir.mkdir()
+        legacy = {
+            "id": "legacy-id",
+            "turn": 3,
+            "timestamp": "2024-01-01T00:00:00",
+            "message": "Legacy",
+            "snapshots": [
+                {"path": str(tmp_path / "test.py"), "content": "old", "mtime": 1.0}
+            ],
+        }
+        (storage_dir / "legacy-id.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+        manager = FileCheckpointManager(storage_dir=storage_dir)
+
+        [checkpoint] = manager.list_checkpoints()
+        assert checkpoint.id == "legacy-id"
+        assert manager.read_snapshot(checkpoint.snapshots[0]) == b"old"
+        assert not (storage_dir / "legacy-id.json").exists()
+
+    def test_track_unchanged_file_skips_read(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a file with unchanged mtime and size is not read again"""
+        storage_dir = tmp_path / "checkpoints"
+        manager = FileCheckpointManager(storage_dir=storage_dir)
+
+        test_file = tmp_path / "test.py"
+        test_file.write_text("content", encoding="utf-8")
+        manager.track_file(str(test_file))
+        first = manager.create("First")
+
+        # A new manager picks up the persisted cache
+        manager = FileCheckpointManager(storage_dir=storage_dir)
+
+        def fail_read(*args: object, **kwargs: object) -> None:
+            raise AssertionError("file was read")
+
+        monkeypatch.setattr("builtins.open", fail_read)
+        manager.track_file(str(test_file))
+        monkeypatch.undo()
+        second = manager.create("Second")
+
+        assert second.snapshots[0].content_hash == first.snapshots[0].content_hash
+
+    def test_track_changed_file_reads_again(self, tmp_path: Path) -> None:
+        """Test that a changed size or mtime invalidates the cached hash"""
+        storage_dir = tmp_path / "checkpoints"
+        manager = FileCheckpointManager(storage_dir=storage_dir)
+
+        test_file = tmp_path / "test.py"
+        test_file.write_text("content", encoding="utf-8")
+        st = test_file.stat()
+        manager.track_file(str(test_file))
+        manager.create("First")
+
+        test_file.write_text("changed", encoding="utf-8")
+        os.utime(test_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        manager.track_file(str(test_file))
+        checkpoint = manager.create("Second")
+
+        assert manager.read_snapshot(checkpoint.snapshots[0]) == b"changed"
+
+    def test_identical_content_stored_once(self, tmp_path: Path) -> None:
+        """Test that snapshots of unchanged content share one object"""
+        storage_dir = tmp_path / "checkpoints"
+        manager = FileCheckpointManager(storage_dir=storage_dir)
+
+        file1 = tmp_path / "file1.py"
+        file2 = tmp_path / "file2.py"
+        file1.write_text("same", encoding="utf-8")
+        file2.write_text("same", encoding="utf-8")
+
+        for _ in range(3):
+            manager.track_file(str(file1))
+            manager.track_file(str(file2))
+            manager.create("Checkpoint")
+
+        assert len(list((storage_dir / "objects").iterdir())) == 1
+
+    def test_restore_preserves_bytes(self, tmp_path: Path) -> None:
+        """Test that CRLF and non-UTF-8 content round-trips exactly"""
+        storage_dir = tmp_path / "checkpoints"
+        manager = FileCheckpointManager(storage_dir=storage_dir)
+
+        test_file = tmp_path / "test.txt"
+        original = b"line 1\r\n\xff\xfe\r\n"
+        test_file.write_bytes(original)
+
+        manager.track_file(str(test_file))
+        checkpoint = manager.create("Checkpoint")
+        test_file.write_bytes(b"modified")
+
+        manager.restore(checkpoint.id)
+
+        assert test_file.read_bytes() == original
+
+    def test_clear_old_removes_unreferenced_objects(self, tmp_path: Path) -> None:
+        """Test that clear_old drops contents only old checkpoints used"""
+        storage_dir = tmp_path / "checkpoints"
+        manager = FileCheckpointManager(storage_dir=storage_dir)
+
+        test_file = tmp_path / "test.py"
+        for i in range(3):
+            test_file.write_text(f"content {i}", encoding="utf-8")
+            manager.track_file(str(test_file))
+            manager.create(f"Checkpoint {i}")
+
+        manager.clear_old(keep_last=1)
+
+        [checkpoint] = manager.list_checkpoints()
+        objects = [p.name for p in (storage_dir / "objects").iterdir()]
+        assert objects == [checkpoint.snapshots[0].content_hash]
+
+    def test_clear_old_prunes_track_cache_paths(self, tmp_path: Path) -> None:
+        """Test that clear_old drops cache entries for paths no checkpoint keeps"""
+        storage_dir = tmp_path / "checkpoints"
+        manager = FileCheckpointManager(storage_dir=storage_dir)
+
+        # Same content, so the old file's hash stays referenced
+        old_file = tmp_path / "old.py"
+        kept_file = tmp_path / "kept.py"
+        old_file.write_text("content", encoding="utf-8")
+        kept_file.write_text("content", encoding="utf-8")
+        manager.track_file(str(old_file))
+        manager.track_file(str(kept_file))
+        manager.create("Both files")
+        manager.track_file(str(kept_file))
+        manager.create("Kept file only")
+
+        manager.clear_old(keep_last=1)
+
+        cache = json.loads((storage_dir / ".track_cache.json").read_text())
+        assert list(cache) == [str(kept_file)]
+
     def test_clear_old_when_under_limit(self, tmp_path: Path) -> None:
         """Test clear_old when checkpoints are under limit"""
         storage_dir = tmp_path / "checkpoints"
@@ -299,13 +495,15 @@ class TestFileSnapshot:
         """Test creating a FileSnapshot"""
         snapshot = FileSnapshot(
             path="/path/to/file.py",
-            content="print('hello')",
+            content_hash="ab" * 32,
             mtime=1234567890.0,
+            size=14,
         )
 
         assert snapshot.path == "/path/to/file.py"
-        assert snapshot.content == "print('hello')"
+        assert snapshot.content_hash == "ab" * 32
         assert snapshot.mtime == 1234567890.0
+        assert snapshot.size == 14
 
 
 class TestFileCheckpoint:
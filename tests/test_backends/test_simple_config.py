@@ -1,6 +1,8 @@
 """Tests for SimpleConfigLoader"""
 
 import os
+import tomllib
+from datetime import time, timezone
 from pathlib import Path
 from unittest.mock import patch
 
@@ -109,6 +111,43 @@ class TestSimpleConfigLoader:
             content = config_file.read_text()
             assert 'model = "new-model"' in content
 
+    def test_save_config_round_trips_through_toml(self, tmp_path: Path) -> None:
+        """Test that saved values, including nested tables and escapes, read back"""
+        loader = SimpleConfigLoader(project_root=tmp_path)
+        updates = {
+            "model": 'quote " backslash \\ newline \n',
+            "allow_rules": ["Read(*)", "Bash(git *)"],
+            "history_limit": 50,
+            "auto_save": False,
+            "tools": {"grep": {"max_results": 10}},
+        }
+
+        loader.save_project_config(updates)
+
+        config_file = tmp_path / ".claude-clone" / "config.toml"
+        assert tomllib.loads(config_file.read_text(encoding="utf-8")) == updates
+
+    def test_save_config_rejects_unserializable_value(self, tmp_path: Path) -> None:
+        """Test that values with no TOML form raise instead of being dropped"""
+        loader = SimpleConfigLoader(project_root=tmp_path)
+
+        with pytest.raises(ConfigurationError):
+            loader.save_project_config({"model": object()})
+
+    def test_save_config_rejects_time_with_timezone(self, tmp_path: Path) -> None:
+        """Test that a time with an offset raises, since TOML local times have none"""
+        loader = SimpleConfigLoader(project_root=tmp_path)
+
+        with pytest.raises(ConfigurationError):
+            loader.save_project_config({"quiet_hours": time(22, 0, tzinfo=timezone.utc)})
+
+    def test_save_config_rejects_none_in_array(self, tmp_path: Path) -> None:
+        """Test that a None array item raises instead of being dropped"""
+        loader = SimpleConfigLoader(project_root=tmp_path)
+
+        with pytest.raises(ConfigurationError):
+            loader.save_project_config({"allow_rules": ["Read(*)", None]})
+
     def test_dotenv_loading(self, tmp_path: Path) -> None:
         """Test that .env file is loaded"""
         # Create .env file
@@ -120,6 +159,47 @@ class TestSimpleConfigLoader:
 
         assert config.api_key == "dotenv-api-key"
 
+    def test_load_is_cached_until_sources_change(self, tmp_path: Path) -> None:
+        """Test that load() reuses its result until a file or env var changes"""
+        with patch.dict(os.environ, {"GOOGLE_API_KEY": "test-api-key"}, clear=False):
+            loader = SimpleConfigLoader(project_root=tmp_path)
+            first = loader.load()
+
+            assert loader.load() is first
+
+            os.environ["CLAUDE_CLONE_MODEL"] = "env-model"
+            second = loader.load()
+            assert second is not first
+            assert second.model == "env-model"
+
+            del os.environ["CLAUDE_CLONE_MODEL"]
+            config_file = tmp_path / ".claude-clone" / "config.toml"
+            config_file.parent.mkdir()
+            config_file.write_text('model = "file-model"\n')
+            assert loader.load().model == "file-model"
+
+    def test_load_sees_saved_config(self, tmp_path: Path) -> None:
+        """Test that saving config invalidates the cached result"""
+        with patch.dict(os.environ, {"GOOGLE_API_KEY": "test-api-key"}, clear=False):
+            os.environ.pop("CLAUDE_CLONE_MODEL", None)
+            loader = SimpleConfigLoader(project_root=tmp_path)
+            loader.load()
+
+            loader.save_project_config({"model": "model-a"})
+            assert loader.load().model == "model-a"
+            loader.save_project_config({"model": "model-b"})
+            assert loader.load().model == "model-b"
+
+    def test_dotenv_loaded_once_per_file(self, tmp_path: Path) -> None:
+        """Test that a .env file is not re-read by later loaders"""
+        (tmp_path / ".env").write_text("GOOGLE_API_KEY=dotenv-api-key\n")
+
+        with patch("dotenv.load_dotenv") as load_dotenv:
+            SimpleConfigLoader(project_root=tmp_path)
+            SimpleConfigLoader(project_root=tmp_path)
+
+        load_dotenv.assert_called_once_with(tmp_path / ".env")
+
     def test_api_key_fallback_order(self, tmp_path: Path) -> None:
         """Test API key fallback order"""
         # Only ANTHROPIC_API_KEY set
@@ -1,11 +1,13 @@
 """Tests for CLI Application"""
 
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 from typer.testing import CliRunner
 
-from claude_clone.cli.app import app
+from claude_clone.cli.app import app, run
 
 
 @pytest.fixture
@@ -32,12 +34,46 @@ class TestCLIHelp:
 
         assert "AI Coding Assistant" in result.output
 
+    def test_version_flag(self, runner: CliRunner) -> None:
+        """Test that --version prints the version"""
+        result = runner.invoke(app, ["--version"])
+
+        assert result.exit_code == 0
+        assert result.output.startswith("claude-clone ")
+
+    def test_run_answers_version_without_app(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that run() handles --version before invoking Typer"""
+        monkeypatch.setattr(sys, "argv", ["claude-clone", "--version"])
+
+        with patch("claude_clone.cli.app.app") as mock_app:
+            with pytest.raises(SystemExit) as exc_info:
+                run()
+
+        assert exc_info.value.code == 0
+        mock_app.assert_not_called()
+        assert capsys.readouterr().out.startswith("claude-clone ")
+
+    def test_import_does_not_load_backends(self) -> None:
+        """Test that importing the CLI defers config and REPL imports"""
+        code = (
+            "import sys, claude_clone.cli.app; "
+            "print(any(m.startswith(('claude_clone.backends', 'claude_clone.repl'))"
+            " for m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
 
 class TestCLIOneShotMode:
     """Tests for one-shot mode with prompt argument"""
 
-    @patch("claude_clone.cli.app.run_single_turn")
-    @patch("claude_clone.cli.app.SimpleConfigLoader")
+    @patch("claude_clone.repl.run_single_turn")
+    @patch("claude_clone.backends.SimpleConfigLoader")
     def test_oneshot_with_prompt(
         self,
         mock_config_loader: MagicMock,
@@ -56,8 +92,8 @@ class TestCLIOneShotMode:
         mock_run_single_turn.assert_called_once_with(mock_config, "read main.py")
         assert "File contents here" in result.output
 
-    @patch("claude_clone.cli.app.run_single_turn")
-    @patch("claude_clone.cli.app.SimpleConfigLoader")
+    @patch("claude_clone.repl.run_single_turn")
+    @patch("claude_clone.backends.SimpleConfigLoader")
     def test_oneshot_empty_response(
         self,
         mock_config_loader: MagicMock,
@@ -74,8 +110,8 @@ class TestCLIOneShotMode:
 
         assert result.exit_code == 0
 
-    @patch("claude_clone.cli.app.run_single_turn")
-    @patch("claude_clone.cli.app.SimpleConfigLoader")
+    @patch("claude_clone.repl.run_single_turn")
+    @patch("claude_clone.backends.SimpleConfigLoader")
     def test_oneshot_error_handling(
         self,
         mock_config_loader: MagicMock,
@@ -97,8 +133,8 @@ class TestCLIOneShotMode:
 class TestCLIModelOption:
     """Tests for --model option"""
 
-    @patch("claude_clone.cli.app.run_single_turn")
-    @patch("claude_clone.cli.app.SimpleConfigLoader")
+    @patch("claude_clone.repl.run_single_turn")
+    @patch("claude_clone.backends.SimpleConfigLoader")
     def test_model_option_overrides_config(
         self,
         mock_config_loader: MagicMock,
@@ -116,8 +152,8 @@ class TestCLIModelOption:
         assert result.exit_code == 0
         mock_config.model_copy.assert_called_once_with(update={"model": "gemini-1.5-pro"})
 
-    @patch("claude_clone.cli.app.run_single_turn")
-    @patch("claude_clone.cli.app.SimpleConfigLoader")
+    @patch("claude_clone.repl.run_single_turn")
+    @patch("claude_clone.backends.SimpleConfigLoader")
     def test_model_short_option(
         self,
         mock_config_loader: MagicMock,
@@ -139,8 +175,8 @@ class TestCLIModelOption:
 class TestCLIResumeOption:
     """Tests for --resume option"""
 
-    @patch("claude_clone.cli.app.run_repl")
-    @patch("claude_clone.cli.app.SimpleConfigLoader")
+    @patch("claude_clone.repl.run_repl")
+    @patch("claude_clone.backends.SimpleConfigLoader")
     def test_resume_shows_not_implemented(
         self,
         mock_config_loader: MagicMock,
@@ -160,8 +196,8 @@ class TestCLIResumeOption:
 class TestCLIInteractiveMode:
     """Tests for interactive REPL mode"""
 
-    @patch("claude_clone.cli.app.run_repl")
-    @patch("claude_clone.cli.app.SimpleConfigLoader")
+    @patch("claude_clone.repl.run_repl")
+    @patch("claude_clone.backends.SimpleConfigLoader")
     def test_no_args_starts_repl(
         self,
         mock_config_loader: MagicMock,
@@ -178,8 +214,8 @@ class TestCLIInteractiveMode:
         assert result.exit_code == 0
         mock_run_repl.assert_called_once_with(mock_config)
 
-    @patch("claude_clone.cli.app.run_repl")
-    @patch("claude_clone.cli.app.SimpleConfigLoader")
+    @patch("claude_clone.repl.run_repl")
+    @patch("claude_clone.backends.SimpleConfigLoader")
     def test_repl_keyboard_interrupt(
         self,
         mock_config_loader: MagicMock,
@@ -196,8 +232,8 @@ class TestCLIInteractiveMode:
 
         assert result.exit_code == 0
 
-    @patch("claude_clone.cli.app.run_repl")
-    @patch("claude_clone.cli.app.SimpleConfigLoader")
+    @patch("claude_clone.repl.run_repl")
+    @patch("claude_clone.backends.SimpleConfigLoader")
     def test_repl_error_handling(
         self,
         mock_config_loader: MagicMock,
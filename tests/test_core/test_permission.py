@@ -76,6 +76,52 @@ class TestPermissionRule:
         assert rule.matches("Read", {"file_path": ".env.production"})
         assert not rule.matches("Read", {"file_path": "config.env"})
 
+    def test_double_star_pattern_treats_regex_chars_literally(self) -> None:
+        """Test that ** patterns escape regex metacharacters"""
+        rule = PermissionRule.parse("Edit(src/**/c++/*.h)")
+
+        assert rule.matches("Edit", {"file_path": "src/lib/c++/vec.h"})
+        assert not rule.matches("Edit", {"file_path": "src/lib/cc/vec.h"})
+
+    def test_double_star_pattern_supports_classes_and_question_mark(self) -> None:
+        """Test ? and [...] inside ** patterns"""
+        rule = PermissionRule.parse("Edit(**/v?/[!_]*.py)")
+
+        assert rule.matches("Edit", {"file_path": "api/v1/models.py"})
+        assert not rule.matches("Edit", {"file_path": "api/v1/_private.py"})
+        assert not rule.matches("Edit", {"file_path": "api/v10/models.py"})
+
+    def test_grep_rule_falls_back_to_pattern(self) -> None:
+        """Test that Grep rules match path first, then pattern"""
+        rule = PermissionRule.parse("Grep(src/*)")
+
+        assert rule.matches("Grep", {"path": "src/main.py", "pattern": "x"})
+        assert rule.matches("Grep", {"path": "", "pattern": "src/a"})
+        assert not rule.matches("Grep", {"path": "lib/main.py", "pattern": "src/a"})
+        assert not rule.matches("Grep", {})
+
+    def test_parse_reuses_rule_for_same_string(self) -> None:
+        """Test that parsing a repeated rule string returns the same rule"""
+        rule = PermissionRule.parse("Bash(npm run:*)")
+
+        assert PermissionRule.parse("Bash(npm run:*)") is rule
+        with pytest.raises(AttributeError):
+            rule.pattern = "rm:*"  # type: ignore[misc]
+
+    def test_directly_constructed_rule_is_compiled(self) -> None:
+        """Test that rules built without parse() match the same way"""
+        rule = PermissionRule(tool_name="Edit", pattern="src/**/*.py")
+
+        assert rule == PermissionRule.parse("Edit(src/**/*.py)")
+        assert rule.matches("Edit", {"file_path": "src/pkg/mod.py"})
+
+    def test_matches_single_char_wildcard(self) -> None:
+        """Test that ? in a simple glob matches one character"""
+        rule = PermissionRule.parse("Read(log?.txt)")
+
+        assert rule.matches("Read", {"file_path": "log1.txt"})
+        assert not rule.matches("Read", {"file_path": "log10.txt"})
+
 
 class TestPermissionManager:
     """Tests for PermissionManager"""
@@ -150,6 +196,24 @@ class TestPermissionManager:
         assert manager.check("Edit", {"file_path": "src/main.py"}) == PermissionResult.ALLOW
         assert manager.check("Edit", {"file_path": "tests/test.py"}) == PermissionResult.ASK
 
+    def test_allow_rules_skipped_when_mode_allows(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that allow rules are not evaluated when the mode allows"""
+        manager = PermissionManager(
+            mode=PermissionMode.BYPASS,
+            allow_rules=["Bash(npm run:*)", "Read(src/*)"],
+        )
+
+        def fail(*args: object) -> bool:
+            raise AssertionError("allow rule evaluated")
+
+        monkeypatch.setattr(PermissionRule, "matches_args_only", fail)
+
+        assert manager.check("Bash", {"command": "npm run test"}) == PermissionResult.ALLOW
+        manager.mode = PermissionMode.PLAN
+        assert manager.check("Read", {"file_path": "src/a.py"}) == PermissionResult.ALLOW
+
     def test_deny_takes_precedence_over_allow(self) -> None:
         """Test that deny rules take precedence over allow rules"""
         manager = PermissionManager(
@@ -201,6 +265,59 @@ class TestPermissionManager:
         manager = PermissionManager(mode="default")
         assert manager.mode == PermissionMode.DEFAULT
 
+    def test_rules_only_apply_to_their_tool(self) -> None:
+        """Test that rules are looked up by tool name"""
+        manager = PermissionManager(
+            allow_rules=["Bash(npm run:*)", "Edit"],
+            deny_rules=["Read(.env*)"],
+        )
+
+        assert manager._deny_by_tool.keys() == {"Read"}
+        assert manager.check("Edit", {"file_path": ".env"}) == PermissionResult.ALLOW
+        assert manager.check("Read", {"file_path": ".env"}) == PermissionResult.DENY
+        assert manager.check("Bash", {"command": "npm test"}) == PermissionResult.ASK
+
+    def test_repeated_check_uses_cached_result(self) -> None:
+        """Test that repeated checks hit the result cache"""
+        manager = PermissionManager(allow_rules=["Edit(src/*.py)"])
+        args = {"file_path": "src/main.py"}
+
+        first = manager.check("Edit", args)
+        second = manager.check("Edit", args)
+
+        assert first == second == PermissionResult.ALLOW
+        assert len(manager._result_cache) == 1
+        assert manager.check("Edit", {"file_path": "lib/main.py"}) == PermissionResult.ASK
+
+    def test_mode_change_invalidates_cached_results(self) -> None:
+        """Test that changing the mode clears cached results"""
+        manager = PermissionManager(mode=PermissionMode.DEFAULT)
+        assert manager.check("Bash", {"command": "ls"}) == PermissionResult.ASK
+
+        manager.mode = PermissionMode.BYPASS
+
+        assert manager.check("Bash", {"command": "ls"}) == PermissionResult.ALLOW
+
+    def test_result_cache_is_bounded(self) -> None:
+        """Test that the result cache evicts least recently used entries"""
+        manager = PermissionManager()
+        manager.RESULT_CACHE_SIZE = 2
+
+        manager.check("Read", {"file_path": "a"})
+        manager.check("Read", {"file_path": "b"})
+        manager.check("Read", {"file_path": "a"})
+        manager.check("Read", {"file_path": "c"})
+
+        paths = [key[1] for key in manager._result_cache]
+        assert paths == ["a", "c"]
+
+    def test_unhashable_args_are_not_cached(self) -> None:
+        """Test that unhashable argument values bypass the cache"""
+        manager = PermissionManager()
+
+        assert manager.check("Grep", {"path": ["a", "b"]}) == PermissionResult.ALLOW
+        assert len(manager._result_cache) == 0
+
     def test_invalid_mode_defaults_to_default(self) -> None:
         """Test that invalid mode falls back to default"""
         manager = PermissionManager(mode="invalid_mode")
@@ -256,6 +373,16 @@ class TestPermissionManagerHelpers:
         assert "running" in prompt.lower()
         assert "npm test" in prompt
 
+    def test_format_permission_prompt_other_tools(self) -> None:
+        """Test format_permission_prompt for write, read and unknown tools"""
+        manager = PermissionManager()
+
+        assert manager.format_permission_prompt("write_tool", {"file_path": "a.txt"}) == (
+            "Allow writing to a.txt?"
+        )
+        assert manager.format_permission_prompt("Read") == "Allow reading unknown?"
+        assert manager.format_permission_prompt("WebFetch", {"url": "x"}) == "Allow WebFetch?"
+
     def test_format_permission_prompt_truncates_long_command(self) -> None:
         """Test that long commands are truncated in prompt"""
         manager = PermissionManager()
@@ -1,5 +1,7 @@
 """Tests for Approval entity."""
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
 from claude_clone.domain.entities.approval import (
@@ -138,6 +140,28 @@ class TestApprovalExpiration:
         with pytest.raises(InvalidStateError):
             approval.expire()
 
+    def test_past_expiry_is_expired(self):
+        approval = Approval.create(
+            run_id="run-123",
+            approval_type=ApprovalType.FILE_EDIT,
+            target="src/main.py",
+        )
+        approval.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+
+        assert approval.is_expired
+        assert approval.created_at.tzinfo is timezone.utc
+
+    def test_naive_expiry_is_treated_as_utc(self):
+        approval = Approval.create(
+            run_id="run-123",
+            approval_type=ApprovalType.FILE_EDIT,
+            target="src/main.py",
+        )
+        naive_utc_now = datetime.now(timezone.utc).replace(tzinfo=None)
+        approval.expires_at = naive_utc_now + timedelta(hours=1)
+
+        assert not approval.is_expired
+
 
 class TestApprovalProperties:
     """Test Approval properties."""
@@ -219,3 +243,25 @@ class TestApprovalRiskAssessment:
         # Base 2 + 1 (.env) = 3
         assert approval.risk_score >= 3
         assert ".env" in approval.risk_reason
+
+    def test_reasons_follow_pattern_order(self):
+        approval = Approval.create(
+            run_id="run-123",
+            approval_type=ApprovalType.FILE_EDIT,
+            target="config/Secret.ENV",
+        )
+
+        assert approval.risk_score == 4
+        assert approval.risk_reason == (
+            "touches sensitive path '.env', touches sensitive path 'secret'"
+        )
+
+    def test_repeated_pattern_counts_once(self):
+        approval = Approval.create(
+            run_id="run-123",
+            approval_type=ApprovalType.BASH_COMMAND,
+            target="sudo ls && sudo pwd",
+        )
+
+        assert approval.risk_score == 4
+        assert approval.risk_reason == "contains 'sudo'"
@@ -1,5 +1,9 @@
 """Tests for Event entity."""
 
+from datetime import datetime, timezone
+
+import pytest
+
 from claude_clone.domain.entities.event import Event, EventType
 
 
@@ -19,6 +23,37 @@ class TestEventCreation:
         assert event.type == EventType.RUN_STARTED
         assert event.data == {"goal": "테스트"}
         assert event.timestamp is not None
+        assert event.timestamp.tzinfo is timezone.utc
+
+    def test_create_event_with_timestamp(self):
+        timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        event = Event.create(
+            event_id=1,
+            run_id="run-123",
+            event_type=EventType.INFO,
+            timestamp=timestamp,
+        )
+
+        assert event.timestamp is timestamp
+
+    def test_event_data_is_read_only(self):
+        event = Event.create(
+            event_id=1,
+            run_id="run-123",
+            event_type=EventType.INFO,
+            data={"message": "hello"},
+        )
+
+        with pytest.raises(TypeError):
+            event.data["message"] = "changed"
+
+    def test_events_without_data_share_empty_mapping(self):
+        first = Event.create(event_id=1, run_id="run-123", event_type=EventType.INFO)
+        second = Event.create(event_id=2, run_id="run-123", event_type=EventType.INFO)
+
+        assert first.data == {}
+        assert first.data is second.data
 
     def test_event_is_immutable(self):
         event = Event.create(
@@ -31,6 +66,25 @@ class TestEventCreation:
         # This would raise FrozenInstanceError
         assert event.id == 1  # Can read
 
+    def test_equality_and_hash_use_id(self):
+        event = Event.create(event_id=1, run_id="run-123", event_type=EventType.INFO)
+        same_id = Event.create(
+            event_id=1, run_id="run-123", event_type=EventType.INFO, data={"x": 1}
+        )
+        other = Event.create(event_id=2, run_id="run-123", event_type=EventType.INFO)
+
+        assert event == same_id
+        assert hash(event) == hash(same_id)
+        assert event != other
+        assert len({event, same_id, other}) == 2
+
+    def test_unpersisted_events_compare_by_identity(self):
+        event1 = Event.create(event_id=0, run_id="run-123", event_type=EventType.INFO)
+        event2 = Event.create(event_id=0, run_id="run-123", event_type=EventType.INFO)
+
+        assert event1 == event1
+        assert event1 != event2
+
 
 class TestEventFactoryMethods:
     """Test Event factory methods."""
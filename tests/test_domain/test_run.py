@@ -28,6 +28,11 @@ class TestRunCreation:
 
         assert run1.id != run2.id
 
+    def test_run_uses_slots(self):
+        run = Run.create(goal="테스트")
+
+        assert not hasattr(run, "__dict__")
+
 
 class TestRunStateTransitions:
     """Test Run state transitions."""
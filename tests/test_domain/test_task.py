@@ -1,5 +1,8 @@
 """Tests for Task entity."""
 
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
 from claude_clone.domain.entities.task import Task, TaskStatus
@@ -37,6 +40,44 @@ class TestTaskCreation:
 
         assert task1.id != task2.id
 
+    def test_timestamps_are_utc_datetimes(self):
+        task = Task.create(run_id="run-1", title="Task 1")
+
+        assert task.created_at.tzinfo is timezone.utc
+        assert abs(datetime.now(timezone.utc) - task.created_at) < timedelta(minutes=1)
+        assert task.updated_at == task.created_at or task.updated_at > task.created_at
+
+    def test_transition_updates_timestamp(self):
+        task = Task.create(run_id="run-1", title="Task 1")
+        task.updated_at = task.created_at - timedelta(days=1)
+
+        task.assign("worker-1")
+
+        assert task.updated_at >= task.created_at
+
+    def test_timestamps_are_constructor_fields(self):
+        created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        task = Task(id="task-1", run_id="run-1", title="Task 1", created_at=created)
+
+        assert task.created_at == created
+        assert asdict(task)["created_at"] == created
+        assert "updated_at" in asdict(task)
+
+    def test_ids_are_interned(self):
+        run_id = "".join(["run-", "shared"])
+        task1 = Task.create(run_id=run_id, title="Task 1")
+        task2 = Task.create(run_id="".join(["run-", "shared"]), title="Task 2")
+        task1.assign("".join(["worker-", "1"]))
+        task2.assign("".join(["worker-", "1"]))
+
+        assert task1.run_id is task2.run_id
+        assert task1.owner_worker_id is task2.owner_worker_id
+
+    def test_task_uses_slots(self):
+        task = Task.create(run_id="run-1", title="Task 1")
+
+        assert not hasattr(task, "__dict__")
+
 
 class TestTaskStateTransitions:
     """Test Task state transitions."""
@@ -106,6 +147,15 @@ class TestTaskInvalidTransitions:
         with pytest.raises(InvalidStateError):
             task.assign(worker_id="worker-2")
 
+    def test_invalid_transition_leaves_task_unchanged(self):
+        task = Task.create(run_id="run-123", title="테스트")
+
+        with pytest.raises(InvalidStateError, match="Cannot unblock task in pending status"):
+            task.unblock()
+
+        assert task.status == TaskStatus.PENDING
+        assert task.owner_worker_id is None
+
     def test_cannot_complete_pending_task(self):
         task = Task.create(run_id="run-123", title="테스트")
 
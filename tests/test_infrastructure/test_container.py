@@ -11,6 +11,7 @@ from claude_clone.application.interfaces.run_repository import RunRepository
 from claude_clone.application.interfaces.approval_repository import ApprovalRepository
 from claude_clone.application.interfaces.event_repository import EventRepository
 from claude_clone.application.interfaces.event_publisher import EventPublisher
+from claude_clone.application.interfaces.unit_of_work import UnitOfWork
 from claude_clone.application.use_cases.create_run import CreateRunUseCase
 from claude_clone.application.use_cases.resolve_approval import ResolveApprovalUseCase
 from claude_clone.application.use_cases.get_timeline import GetTimelineUseCase
@@ -53,6 +54,51 @@ class TestDIContainerBasic:
 
         assert "str" in str(exc_info.value)
 
+    def test_factory_key_error_is_not_masked(self):
+        container = DIContainer()
+
+        def factory():
+            return {}["missing"]
+
+        container.register_factory(object, factory)
+
+        with pytest.raises(KeyError) as exc_info:
+            container.get(object)
+
+        assert "missing" in str(exc_info.value)
+
+    def test_singleton_factory_runs_once(self):
+        container = DIContainer()
+        calls = []
+
+        def factory():
+            calls.append(None)
+            return object()
+
+        container.register_factory(object, factory, singleton=True)
+        instance1 = container.get(object)
+        instance2 = container.get(object)
+
+        assert len(calls) == 1
+        assert instance1 is instance2
+
+    def test_singleton_factory_can_resolve_other_singletons(self):
+        container = DIContainer()
+        container.register_factory(int, lambda: 1, singleton=True)
+        container.register_factory(str, lambda: str(container.get(int)), singleton=True)
+
+        assert container.get(str) == "1"
+        assert container.get(str) is container.get(str)
+
+    def test_instance_replaces_factory_registration(self):
+        container = DIContainer()
+        instance = object()
+
+        container.register_factory(object, object)
+        container.register_instance(object, instance)
+
+        assert container.get(object) is instance
+
 
 class TestDIContainerInMemoryConfiguration:
     """Test DIContainer in-memory configuration."""
@@ -75,6 +121,13 @@ class TestDIContainerInMemoryConfiguration:
 
         assert publisher is not None
 
+    def test_unit_of_work_is_registered(self, container):
+        uow = container.get(UnitOfWork)
+
+        assert uow is container.get(UnitOfWork)
+        assert container.get(CreateRunUseCase).unit_of_work is uow
+        assert container.get(ResolveApprovalUseCase).unit_of_work is uow
+
     def test_use_cases_are_registered(self, container):
         create_run = container.get(CreateRunUseCase)
         resolve_approval = container.get(ResolveApprovalUseCase)
@@ -84,6 +137,10 @@ class TestDIContainerInMemoryConfiguration:
         assert resolve_approval is not None
         assert get_timeline is not None
 
+    def test_use_cases_are_built_once(self, container):
+        assert container.get(CreateRunUseCase) is container.get(CreateRunUseCase)
+        assert container.get(GetTimelineUseCase) is container.get(GetTimelineUseCase)
+
     def test_repositories_are_singletons(self, container):
         repo1 = container.get(RunRepository)
         repo2 = container.get(RunRepository)
@@ -70,6 +70,14 @@ class TestRunCommand:
         assert "line1" in result.stdout
         assert "line2" in result.stdout
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses printf")
+    def test_invalid_utf8_output_is_replaced(self) -> None:
+        """Test that undecodable output doesn't fail the command"""
+        result = run_command("printf 'ok\\377'")
+
+        assert result.return_code == 0
+        assert result.stdout == "ok\ufffd"
+
     def test_command_with_pipe(self) -> None:
         """Test command with pipe"""
         if sys.platform == "win32":
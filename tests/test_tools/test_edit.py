@@ -61,6 +61,32 @@ class TestEditFile:
         # File should remain unchanged
         assert test_file.read_text(encoding="utf-8") == "foo bar foo\n"
 
+    def test_overlapping_match_counts_once(self, tmp_path: Path) -> None:
+        """Test that overlapping occurrences count like str.count"""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("aaa\n", encoding="utf-8")
+
+        edit_file(str(test_file), "aa", "b")
+
+        assert test_file.read_text(encoding="utf-8") == "ba\n"
+
+    def test_replace_preserves_crlf(self, tmp_path: Path) -> None:
+        """Test that CRLF files keep their line endings"""
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(b"one\r\ntwo\r\nthree\r\n")
+
+        edit_file(str(test_file), "one\ntwo", "1\n2")
+
+        assert test_file.read_bytes() == b"1\r\n2\r\nthree\r\n"
+
+    def test_empty_old_string_raises(self, tmp_path: Path) -> None:
+        """Test that an empty target string is rejected"""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("content\n", encoding="utf-8")
+
+        with pytest.raises(EditToolError):
+            edit_file(str(test_file), "", "x")
+
     def test_string_not_found_raises(self, tmp_path: Path) -> None:
         """Test that missing string raises error"""
         test_file = tmp_path / "test.txt"
@@ -121,6 +147,30 @@ class TestEditFile:
 
         assert "Not a file" in str(exc_info.value)
 
+    def test_edit_preserves_mode_and_leaves_no_temp_file(self, tmp_path: Path) -> None:
+        """Test that the atomic rewrite keeps permissions and cleans up"""
+        test_file = tmp_path / "script.sh"
+        test_file.write_text("echo hello\n", encoding="utf-8")
+        test_file.chmod(0o754)
+
+        edit_file(str(test_file), "hello", "goodbye")
+
+        assert test_file.read_text(encoding="utf-8") == "echo goodbye\n"
+        assert test_file.stat().st_mode & 0o777 == 0o754
+        assert [p.name for p in tmp_path.iterdir()] == ["script.sh"]
+
+    def test_edit_through_symlink_updates_target(self, tmp_path: Path) -> None:
+        """Test that editing a symlink rewrites the target, keeping the link"""
+        target = tmp_path / "target.txt"
+        target.write_text("hello world\n", encoding="utf-8")
+        link = tmp_path / "link.txt"
+        link.symlink_to(target)
+
+        edit_file(str(link), "hello", "goodbye")
+
+        assert link.is_symlink()
+        assert target.read_text(encoding="utf-8") == "goodbye world\n"
+
     def test_string_not_found_truncates_long_string(self, tmp_path: Path) -> None:
         """Test that long missing strings are truncated in error"""
         test_file = tmp_path / "test.txt"
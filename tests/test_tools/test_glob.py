@@ -83,6 +83,51 @@ class TestGlobFiles:
 
         assert len(result) == 3
 
+    def test_max_results_keeps_first_in_sorted_order(self, tmp_path: Path) -> None:
+        """Test that truncation keeps the smallest paths, not walk order"""
+        for name in ("d.py", "b.py", "e.py", "a.py", "c.py"):
+            (tmp_path / name).write_text("x")
+
+        result = glob_files("*.py", str(tmp_path), max_results=2)
+
+        assert result == ["a.py", "b.py"]
+
+    def test_max_results_matches_full_sort_across_directories(self, tmp_path: Path) -> None:
+        """Test that truncated recursive results are a prefix of the full sort"""
+        for rel in ("a.py", "a/x.py", "a-b/x.py", "a.d/x.py", "A.py"):
+            (tmp_path / rel).parent.mkdir(exist_ok=True)
+            (tmp_path / rel).write_text("x")
+
+        full = glob_files("**/*.py", str(tmp_path))
+
+        assert full == sorted(full)
+        for k in range(1, len(full) + 1):
+            assert glob_files("**/*.py", str(tmp_path), max_results=k) == full[:k]
+
+    def test_max_results_stops_walk_early(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that directories past the first max_results matches aren't listed"""
+        import claude_clone.agent.tools.glob as glob_module
+
+        for name in ("a", "b", "c"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "x.py").write_text("x")
+        listed = []
+        listdir = glob_module.listdir_cached
+
+        def tracking_listdir(path: str):
+            listed.append(Path(path).name)
+            return listdir(path)
+
+        monkeypatch.setattr(glob_module, "listdir_cached", tracking_listdir)
+
+        result = glob_files("**/*.py", str(tmp_path), max_results=1)
+
+        assert result == [str(Path("a") / "x.py")]
+        assert "b" not in listed
+        assert "c" not in listed
+
     def test_relative_path_result(self, tmp_path: Path) -> None:
         """Test that results are relative paths"""
         (tmp_path / "subdir").mkdir()
@@ -115,6 +160,75 @@ class TestGlobFiles:
         assert len(result) == 1
         assert "test.py" in result
 
+    def test_hidden_files_match(self, tmp_path: Path) -> None:
+        """Test that wildcards match dot-files and dot-directories"""
+        (tmp_path / ".config").mkdir()
+        (tmp_path / ".config" / "settings.py").write_text("x")
+        (tmp_path / ".env.py").write_text("x")
+
+        result = glob_files("**/*.py", str(tmp_path))
+
+        assert result == sorted([str(Path(".config") / "settings.py"), ".env.py"])
+
+    def test_symlink_loops_are_not_followed(self, tmp_path: Path) -> None:
+        """Test that ** does not descend into symlinked directories"""
+        (tmp_path / "x.py").write_text("x")
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "y.py").write_text("y")
+        (tmp_path / "a" / "up").symlink_to("..")
+        (tmp_path / "a" / "up2").symlink_to("../..")
+
+        result = glob_files("**/*.py", str(tmp_path), max_results=5)
+
+        assert result == [str(Path("a") / "y.py"), "x.py"]
+
+    def test_dot_prefix_is_dropped(self, tmp_path: Path) -> None:
+        """Test that a leading ./ doesn't appear in results"""
+        (tmp_path / "x.py").write_text("x")
+
+        result = glob_files("./*.py", str(tmp_path))
+
+        assert result == ["x.py"]
+
+    def test_trailing_double_star_matches_no_files(self, tmp_path: Path) -> None:
+        """Test that a pattern ending in ** matches only directories"""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "y.py").write_text("y")
+
+        assert glob_files("**", str(tmp_path)) == []
+        assert glob_files("a/**", str(tmp_path)) == []
+
+    def test_trailing_separator_matches_no_files(self, tmp_path: Path) -> None:
+        """Test that a pattern ending in / matches only directories"""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "y.py").write_text("y")
+        (tmp_path / "b.txt").write_text("b")
+
+        assert glob_files("*/", str(tmp_path)) == []
+        assert glob_files("a/*/", str(tmp_path)) == []
+
+    def test_bracket_classes(self, tmp_path: Path) -> None:
+        """Test that a ] right after [ or [! belongs to the class"""
+        for name in ("]x", "b.txt", "^y"):
+            (tmp_path / name).write_text("x")
+
+        assert glob_files("[!]]*", str(tmp_path)) == ["^y", "b.txt"]
+        assert glob_files("[]]*", str(tmp_path)) == ["]x"]
+        assert glob_files("[^]*", str(tmp_path)) == ["^y"]
+
+    def test_wildcard_components_follow_symlinked_directories(self, tmp_path: Path) -> None:
+        """Test that non-** components descend into symlinked directories"""
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "r.py").write_text("r")
+        (tmp_path / "link").symlink_to("real")
+
+        assert glob_files("*/*.py", str(tmp_path)) == [
+            str(Path("link") / "r.py"),
+            str(Path("real") / "r.py"),
+        ]
+        assert glob_files("link/*.py", str(tmp_path)) == [str(Path("link") / "r.py")]
+        assert glob_files("**/*.py", str(tmp_path)) == [str(Path("real") / "r.py")]
+
 
 class TestGlobTool:
     """Tests for glob_tool LangChain tool"""
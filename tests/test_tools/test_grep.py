@@ -1,9 +1,11 @@
 """Tests for Grep Tool"""
 
+import json
 from pathlib import Path
 
 import pytest
 
+from claude_clone.agent.tools import grep
 from claude_clone.agent.tools.grep import (
     GrepMatch,
     GrepToolError,
@@ -60,6 +62,22 @@ class TestGrepFiles:
         assert len(result) == 1
         assert "test.py" in result[0].file
 
+    def test_file_type_filter_is_case_insensitive(self, tmp_path: Path) -> None:
+        """Test that extensions match regardless of case"""
+        (tmp_path / "Upper.PY").write_text("hello\n")
+        (tmp_path / "Makefile").write_text("hello\n")
+
+        result = grep_files("hello", str(tmp_path), file_type="py")
+
+        assert [m.file for m in result] == ["Upper.PY"]
+
+    def test_file_type_filter_on_single_file(self, tmp_path: Path) -> None:
+        """Test that file type filter applies when searching one file"""
+        test_file = tmp_path / "test.js"
+        test_file.write_text("hello\n")
+
+        assert grep_files("hello", str(test_file), file_type="py") == []
+
     def test_context_lines(self, tmp_path: Path) -> None:
         """Test context lines before and after match"""
         test_file = tmp_path / "test.py"
@@ -68,8 +86,8 @@ class TestGrepFiles:
         result = grep_files("match_here", str(tmp_path), context_lines=1)
 
         assert len(result) == 1
-        assert result[0].context_before == ["line2"]
-        assert result[0].context_after == ["line4"]
+        assert result[0].context_before == ("line2",)
+        assert result[0].context_after == ("line4",)
 
     def test_max_results(self, tmp_path: Path) -> None:
         """Test max_results limit"""
@@ -80,6 +98,22 @@ class TestGrepFiles:
 
         assert len(result) == 5
 
+    def test_parallel_search_matches_sequential(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that threaded search returns the same ordered results"""
+        for i in range(50):
+            sub = tmp_path / f"dir{i % 5}"
+            sub.mkdir(exist_ok=True)
+            (sub / f"file{i}.py").write_text(f"match {i}\nmatch again\n")
+
+        parallel = grep_files("match", str(tmp_path), max_results=37)
+        monkeypatch.setattr(grep, "_SEARCH_WORKERS", 1)
+        sequential = grep_files("match", str(tmp_path), max_results=37)
+
+        assert len(parallel) == 37
+        assert parallel == sequential
+
     def test_invalid_pattern(self, tmp_path: Path) -> None:
         """Test error on invalid regex pattern"""
         (tmp_path / "test.py").write_text("content\n")
@@ -89,6 +123,17 @@ class TestGrepFiles:
 
         assert "Invalid regex" in str(exc_info.value)
 
+    def test_compiled_pattern_is_reused(self, tmp_path: Path) -> None:
+        """Test that repeated searches share one compiled pattern"""
+        (tmp_path / "test.py").write_text("foo1\n")
+        grep._compile.cache_clear()
+
+        grep_files(r"foo\d", str(tmp_path))
+        grep_files(r"foo\d", str(tmp_path))
+
+        info = grep._compile.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
     def test_path_not_found(self, tmp_path: Path) -> None:
         """Test error when path doesn't exist"""
         nonexistent = tmp_path / "nonexistent"
@@ -125,6 +170,95 @@ class TestGrepFiles:
         assert len(result) == 1
         assert "test.py" in result[0].file
 
+    def test_match_does_not_span_lines(self, tmp_path: Path) -> None:
+        """Test that patterns are matched against single lines"""
+        (tmp_path / "test.txt").write_text("foo\nbar\nfoo bar\n")
+
+        result = grep_files(r"foo\s+bar", str(tmp_path))
+
+        assert [m.line_number for m in result] == [3]
+
+    def test_anchors_match_each_line(self, tmp_path: Path) -> None:
+        """Test that ^ and $ anchor at line boundaries, including CRLF"""
+        (tmp_path / "test.txt").write_bytes(b"x end\r\nend\r\nend x\r\n")
+
+        result = grep_files("^end$", str(tmp_path))
+
+        assert [(m.line_number, m.content) for m in result] == [(2, "end")]
+
+    def test_string_anchors_match_each_line(self, tmp_path: Path) -> None:
+        r"""Test that \A and \Z anchor at every line, not only the file's ends"""
+        (tmp_path / "test.txt").write_text("foo\nx foo\nfoo\n")
+
+        start = grep_files(r"\Afoo", str(tmp_path))
+        end = grep_files(r"foo\Z", str(tmp_path))
+
+        assert [m.line_number for m in start] == [1, 3]
+        assert [m.line_number for m in end] == [1, 2, 3]
+
+    def test_lookbehind_does_not_see_previous_line(self, tmp_path: Path) -> None:
+        """Test that a lookbehind can't match the newline before a line"""
+        (tmp_path / "test.txt").write_text("bar\nfoo\n foo\n")
+
+        assert grep_files(r"(?<=\n)foo", str(tmp_path)) == []
+        assert [m.line_number for m in grep_files(r"(?<= )foo", str(tmp_path))] == [3]
+
+    def test_lookahead_does_not_see_next_line(self, tmp_path: Path) -> None:
+        """Test that a negative lookahead at line end ignores the newline"""
+        (tmp_path / "test.txt").write_text("foo\nbar\n")
+
+        result = grep_files(r"foo(?!\n)", str(tmp_path))
+
+        assert [m.line_number for m in result] == [1]
+
+    def test_literal_pattern_reports_each_line_once(self, tmp_path: Path) -> None:
+        """Test that a plain-string pattern yields one match per line"""
+        (tmp_path / "test.txt").write_text("to do to do\nnothing\nto\n")
+
+        result = grep_files("to", str(tmp_path))
+
+        assert [(m.line_number, m.content) for m in result] == [
+            (1, "to do to do"),
+            (3, "to"),
+        ]
+
+    def test_skip_binary_single_file(self, tmp_path: Path) -> None:
+        """Test that a binary file given directly is not searched"""
+        binary = tmp_path / "binary.bin"
+        binary.write_bytes(b"\x00\x01\x02hello\x03\x04")
+
+        assert grep_files("hello", str(binary)) == []
+
+    def test_skip_large_files(self, tmp_path: Path) -> None:
+        """Test that files over 1MB are skipped, including a single file"""
+        (tmp_path / "small.txt").write_text("needle\n")
+        large = tmp_path / "large.txt"
+        large.write_text("needle\n" + "x" * 1_000_000)
+
+        result = grep_files("needle", str(tmp_path))
+
+        assert [m.file for m in result] == ["small.txt"]
+        assert grep_files("needle", str(large)) == []
+
+    def test_literal_in_mapped_file(self, tmp_path: Path) -> None:
+        """Test literal search in files large enough to be memory-mapped"""
+        filler = "filler line\n" * 10_000
+        (tmp_path / "hit.txt").write_text(filler + "café needle\n", encoding="utf-8")
+        (tmp_path / "miss.txt").write_text(filler, encoding="utf-8")
+
+        result = grep_files("café", str(tmp_path))
+
+        assert [(m.file, m.line_number) for m in result] == [("hit.txt", 10_001)]
+
+    def test_text_after_first_chunk_is_searched(self, tmp_path: Path) -> None:
+        """Test that content past the binary-check chunk is still searched"""
+        (tmp_path / "long.txt").write_text("x" * 5000 + "\nneedle\n")
+
+        result = grep_files("needle", str(tmp_path))
+
+        assert len(result) == 1
+        assert result[0].line_number == 2
+
     def test_skip_hidden_directories(self, tmp_path: Path) -> None:
         """Test that hidden directories are skipped"""
         (tmp_path / "visible.py").write_text("hello visible\n")
@@ -137,6 +271,28 @@ class TestGrepFiles:
         assert len(result) == 1
         assert "visible.py" in result[0].file
 
+    def test_search_inside_hidden_root(self, tmp_path: Path) -> None:
+        """Test that a hidden search root itself is still searched"""
+        root = tmp_path / ".config"
+        (root / "sub").mkdir(parents=True)
+        (root / "sub" / "a.py").write_text("hello\n")
+
+        result = grep_files("hello", str(root))
+
+        assert len(result) == 1
+        assert result[0].file == str(Path("sub") / "a.py")
+
+    def test_skip_dirs_are_pruned(self, tmp_path: Path) -> None:
+        """Test that skipped directories are not descended into"""
+        (tmp_path / "main.py").write_text("hello\n")
+        nested = tmp_path / "node_modules" / "pkg"
+        nested.mkdir(parents=True)
+        (nested / "index.js").write_text("hello\n")
+
+        result = grep_files("hello", str(tmp_path))
+
+        assert [m.file for m in result] == ["main.py"]
+
     def test_relative_file_paths(self, tmp_path: Path) -> None:
         """Test that file paths in results are relative"""
         subdir = tmp_path / "src"
@@ -241,8 +397,9 @@ class TestGrepMatch:
         assert match.file == "test.py"
         assert match.line_number == 10
         assert match.content == "hello world"
-        assert match.context_before == []
-        assert match.context_after == []
+        assert match.context_before == ()
+        assert match.context_after == ()
+        assert not hasattr(match, "__dict__")
 
     def test_grep_match_with_context(self) -> None:
         """Test GrepMatch with context lines"""
@@ -250,9 +407,121 @@ class TestGrepMatch:
             file="test.py",
             line_number=10,
             content="match line",
-            context_before=["line 9"],
-            context_after=["line 11"],
+            context_before=("line 9",),
+            context_after=("line 11",),
         )
 
-        assert match.context_before == ["line 9"]
-        assert match.context_after == ["line 11"]
+        assert match.context_before == ("line 9",)
+        assert match.context_after == ("line 11",)
+
+
+def _rg_record(kind: str, path: str, line_number: int = 0, text: str = "") -> str:
+    data: dict = {"path": {"text": path}}
+    if kind in ("match", "context"):
+        data["line_number"] = line_number
+        data["lines"] = {"text": text}
+    return json.dumps({"type": kind, "data": data})
+
+
+class TestRipgrepBackend:
+    """Tests for the ripgrep backend"""
+
+    def test_parse_matches_with_shared_context(self) -> None:
+        """Test that nearby matches share ripgrep's context lines"""
+        records = [
+            _rg_record("begin", "src/a.py"),
+            _rg_record("context", "src/a.py", 1, "one\n"),
+            _rg_record("match", "src/a.py", 2, "hello\r\n"),
+            _rg_record("match", "src/a.py", 3, "hello again\n"),
+            _rg_record("context", "src/a.py", 4, "four\n"),
+            _rg_record("end", "src/a.py"),
+        ]
+
+        result = grep._parse_rg_json(records, context_lines=1, max_results=10)
+
+        assert [(m.file, m.line_number, m.content) for m in result] == [
+            ("src/a.py", 2, "hello"),
+            ("src/a.py", 3, "hello again"),
+        ]
+        assert result[0].context_before == ("one",)
+        assert result[0].context_after == ("hello again",)
+        assert result[1].context_before == ("hello",)
+        assert result[1].context_after == ("four",)
+
+    def test_parse_stops_at_max_results(self) -> None:
+        """Test that parsing stops once max_results is reached"""
+        records = []
+        for name in ("a.py", "b.py"):
+            records += [
+                _rg_record("begin", name),
+                _rg_record("match", name, 1, "hello\n"),
+                _rg_record("match", name, 2, "hello\n"),
+                _rg_record("end", name),
+            ]
+
+        result = grep._parse_rg_json(records, context_lines=0, max_results=3)
+
+        assert [(m.file, m.line_number) for m in result] == [
+            ("a.py", 1),
+            ("a.py", 2),
+            ("b.py", 1),
+        ]
+
+    def test_falls_back_when_ripgrep_fails(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the Python search runs if ripgrep can't be started"""
+        monkeypatch.setattr(grep, "_RG_PATH", str(tmp_path / "missing-rg"))
+        (tmp_path / "test.py").write_text("hello\n")
+
+        result = grep_files("hello", str(tmp_path))
+
+        assert [m.file for m in result] == ["test.py"]
+
+    def test_ripgrep_filters_mirror_python_walk(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the size limit, sort order and case-sensitive globs passed to ripgrep"""
+        calls = []
+
+        def fake_popen(args, **kwargs):
+            calls.append(args)
+            raise OSError("not started")
+
+        monkeypatch.setattr(grep, "_RG_PATH", "rg")
+        monkeypatch.setattr(grep.subprocess, "Popen", fake_popen)
+        (tmp_path / "test.py").write_text("hello\n")
+
+        grep_files("hello", str(tmp_path), file_type="py")
+
+        args = calls[0]
+        assert args[args.index("--sort") + 1] == "path"
+        assert args[args.index("--max-filesize") + 1] == "1000000"
+        assert "--iglob" not in args
+        globs = [args[i + 1] for i, arg in enumerate(args) if arg == "--glob"]
+        assert "!node_modules/" in globs
+        assert "*.[pP][yY]" in globs
+
+    @pytest.mark.skipif(grep._RG_PATH is None, reason="ripgrep is not installed")
+    def test_ripgrep_matches_python_search(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that ripgrep and the Python walk find the same matches"""
+        (tmp_path / "b.py").write_text("hello\n")
+        (tmp_path / "A.PY").write_text("hello\n")
+        (tmp_path / "build").write_text("hello\n")  # A file, not a skipped dir
+        (tmp_path / "dist").mkdir()
+        (tmp_path / "dist" / "c.py").write_text("hello\n")
+        (tmp_path / "big.py").write_text("hello\n" + "x" * 1_000_000)
+
+        def search(**kwargs) -> list[tuple[str, int]]:
+            return [(m.file, m.line_number) for m in grep_files("hello", str(tmp_path), **kwargs)]
+
+        with_rg = search()
+        typed_with_rg = search(file_type="py")
+        monkeypatch.setattr(grep, "_RG_PATH", None)
+
+        assert with_rg == sorted(with_rg)
+        assert with_rg == sorted(search())
+        assert typed_with_rg == sorted(search(file_type="py"))
+        assert typed_with_rg == [("A.PY", 1), ("b.py", 1)]
@@ -0,0 +1,30 @@
+"""Tests for shared path helpers"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from claude_clone.agent.tools._paths import normalize_path
+
+
+class TestNormalizePath:
+    """Tests for normalize_path"""
+
+    def test_absolute_path_is_kept(self, tmp_path: Path) -> None:
+        """Test that an absolute path is returned unchanged"""
+        assert normalize_path(str(tmp_path / "a.txt")) == tmp_path / "a.txt"
+
+    def test_relative_path_uses_cwd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that relative paths are joined to the working directory"""
+        monkeypatch.chdir(tmp_path)
+
+        assert normalize_path("sub/a.txt") == Path(os.getcwd()) / "sub" / "a.txt"
+
+    def test_dot_segments_are_collapsed(self, tmp_path: Path) -> None:
+        """Test that . and .. segments are removed"""
+        raw = os.path.join(str(tmp_path), "sub", ".", "..", "a.txt")
+
+        assert normalize_path(raw) == tmp_path / "a.txt"
@@ -27,6 +27,16 @@ class TestReadFile:
         assert "2→line 2" in result
         assert "3→line 3" in result
 
+    def test_read_exact_formatting(self, tmp_path: Path) -> None:
+        """Test number padding and line ending removal in the output"""
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(b"a\r\nb\r\n" + b"x\n" * 8)
+
+        result = read_file(str(test_file))
+
+        assert result.splitlines()[:3] == [" 1→a", " 2→b", " 3→x"]
+        assert result.endswith("10→x")
+
     def test_read_with_offset(self, tmp_path: Path) -> None:
         """Test reading with offset"""
         test_file = tmp_path / "test.txt"
@@ -65,6 +75,17 @@ class TestReadFile:
         assert "3→" not in result
         assert "7→" not in result
 
+    def test_read_with_large_offset(self, tmp_path: Path) -> None:
+        """Test that offsets spanning many skip blocks land on the right line"""
+        test_file = tmp_path / "test.txt"
+        content = "\n".join([f"line {i}" for i in range(1, 50001)])
+        test_file.write_text(content, encoding="utf-8")
+
+        result = read_file(str(test_file), offset=45000, limit=2)
+
+        assert result.startswith("45001→line 45001\n45002→line 45002")
+        assert "(Showing lines 45001-45002 of 50000)" in result
+
     def test_read_nonexistent_file(self, tmp_path: Path) -> None:
         """Test reading a file that doesn't exist"""
         nonexistent = tmp_path / "nonexistent.txt"
@@ -108,6 +129,17 @@ class TestReadFile:
         assert "valid text" in result
         assert "invalid bytes" in result
 
+    def test_read_crlf_with_offset(self, tmp_path: Path) -> None:
+        """Test CRLF lines with an offset into the file"""
+        test_file = tmp_path / "crlf.txt"
+        test_file.write_bytes(b"line 1\r\nline 2\r\nline 3\r\n")
+
+        result = read_file(str(test_file), offset=1, limit=1)
+
+        assert result.startswith("2→line 2\n")
+        assert "\r" not in result
+        assert "(Showing lines 2-2 of 3)" in result
+
     def test_read_empty_file(self, tmp_path: Path) -> None:
         """Test reading an empty file"""
         test_file = tmp_path / "empty.txt"
@@ -0,0 +1,63 @@
+"""Tests for cached directory listings"""
+
+from pathlib import Path
+
+import pytest
+
+from claude_clone.agent.tools import _walk
+from claude_clone.agent.tools._walk import clear_dir_cache, listdir_cached
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    clear_dir_cache()
+    yield
+    clear_dir_cache()
+
+
+class TestListdirCached:
+    """Tests for listdir_cached"""
+
+    def test_lists_entries(self, tmp_path: Path) -> None:
+        """Test that files and directories are reported"""
+        (tmp_path / "file.txt").write_text("x")
+        (tmp_path / "sub").mkdir()
+
+        result = sorted(listdir_cached(str(tmp_path)))
+
+        assert result == [("file.txt", False, True), ("sub", True, False)]
+
+    def test_reuses_unchanged_listing(self, tmp_path: Path) -> None:
+        """Test that an unchanged directory is served from the cache"""
+        (tmp_path / "file.txt").write_text("x")
+
+        first = listdir_cached(str(tmp_path))
+        second = listdir_cached(str(tmp_path))
+
+        assert second is first
+
+    def test_relists_after_change(self, tmp_path: Path) -> None:
+        """Test that a changed directory mtime invalidates the listing"""
+        (tmp_path / "a.txt").write_text("x")
+        listdir_cached(str(tmp_path))
+        (tmp_path / "b.txt").write_text("x")
+
+        result = sorted(name for name, _, _ in listdir_cached(str(tmp_path)))
+
+        assert result == ["a.txt", "b.txt"]
+
+    def test_cache_is_bounded(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the least recently used listing is evicted"""
+        monkeypatch.setattr(_walk, "DIR_CACHE_SIZE", 2)
+        for name in ("a", "b", "c"):
+            (tmp_path / name).mkdir()
+            listdir_cached(str(tmp_path / name))
+
+        assert list(_walk._dir_cache) == [str(tmp_path / "b"), str(tmp_path / "c")]
+
+    def test_missing_directory_raises(self, tmp_path: Path) -> None:
+        """Test that OSError propagates for unreadable directories"""
+        with pytest.raises(OSError):
+            listdir_cached(str(tmp_path / "missing"))